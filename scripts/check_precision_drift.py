@@ -0,0 +1,66 @@
+import sys
+import os
+import numpy as np
+from datetime import date, timedelta
+
+# 프로젝트 루트 경로 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.market.ticker import Ticker
+from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
+from src.domain.strategy.presets.bollinger_band_strategy import BollingerBandStrategy
+from src.domain.strategy.presets.bollinger_band_evaluator import BollingerBandEvaluator
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.ema import EMA
+from src.domain.technical.rsi import RSI
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+from src.domain.technical.drift import max_drift
+from src.infrastructure.market.pykrx_data_provider import PyKrxDataProvider
+from src.application.service.backtest_service import BacktestService
+
+def main():
+    """실제 데이터로 float64 모드와 Decimal 참조 모드의 최대 오차와 신호/거래 차이를 출력합니다."""
+    tickers = [
+        Ticker(code="005930", name="Samsung Electronics"),
+        Ticker(code="000660", name="SK hynix"),
+        Ticker(code="035420", name="NAVER"),
+    ]
+    end_date = date.today()
+    start_date = end_date - timedelta(days=365 * 2)
+    provider = PyKrxDataProvider()
+
+    # 1. 지표 drift
+    print(f"Fetching {len(tickers)} tickers... ({start_date} ~ {end_date})")
+    charts = [provider.get_ohlcv(ticker, start_date, end_date) for ticker in tickers]
+    indicators = [MovingAverage(period=20), EMA(period=12), RSI(period=14), BollingerBands(period=20), MACD()]
+
+    print(f"{'indicator':<50} {'output':>6} {'max abs':>12} {'max rel':>12} {'warm-up':>8}")
+    for name, report in max_drift(indicators, charts).items():
+        print(f"{name:<50} {report.output:>6} {report.max_abs_error:>12.3e} {report.max_rel_error:>12.3e} {report.warmup_mismatches:>8}")
+
+    # 2. 신호 drift (밴드 경계 근처에서 비교 결과가 뒤집힌 봉)
+    for chart in charts:
+        codes = {
+            precision: BollingerBandEvaluator(precision=precision).evaluate_series(chart).codes
+            for precision in Precision
+        }
+        flipped = np.flatnonzero(codes[Precision.DECIMAL] != codes[Precision.FLOAT64])
+        days = ", ".join(str(chart.timestamps[i])[:10] for i in flipped[:5])
+        print(f"Signals {chart.ticker.code}: {len(flipped)} / {len(chart)} bars differ" + (f" ({days})" if days else ""))
+
+    # 3. 백테스트 drift (같은 전략을 두 정밀도 모드로 실행, 지표와 자산 평가 모두 해당 모드)
+    results = {}
+    for precision in Precision:
+        service = BacktestService(provider, precision=precision)
+        results[precision] = service.run(tickers, BollingerBandStrategy(), start_date, end_date, Money.krw(10_000_000))
+
+    exact, fast = results[Precision.DECIMAL], results[Precision.FLOAT64]
+    drift = max(abs(fast.daily_equity_curve[day] - value) for day, value in exact.daily_equity_curve.items())
+    print(f"Equity curve: {len(exact.daily_equity_curve)} days, max abs drift {drift:.3e} KRW")
+    same_trades = fast.trade_logs == exact.trade_logs
+    print(f"Trades: {len(exact.trade_logs)} (DECIMAL) vs {len(fast.trade_logs)} (FLOAT64), identical: {same_trades}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import sys
 import os
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import mplfinance as mpf
 from pykrx import stock
@@ -10,9 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_unit import CandleUnit
-from src.domain.market.candle import Candle
-from src.domain.market.candle_chart import CandleChart
-from src.domain.shared.money import Money
+from src.infrastructure.market.ohlcv_frame import frame_to_chart
 from src.domain.technical.moving_average import MovingAverage
 from src.domain.technical.rsi import RSI
 from src.domain.technical.macd import MACD
@@ -34,18 +33,8 @@ def main():
     }, inplace=True)
     
     # 2. 도메인 객체로 변환하여 지표 계산 (로직 검증용)
-    chart = CandleChart(ticker=Ticker(code=ticker_code, name=ticker_name), unit=CandleUnit.day())
-    
-    for date, row in df.iterrows():
-        candle = Candle(
-            open_price=Money.krw(row['Open']),
-            high_price=Money.krw(row['High']),
-            low_price=Money.krw(row['Low']),
-            close_price=Money.krw(row['Close']),
-            volume=int(row['Volume']),
-            timestamp=date
-        )
-        chart.add_candle(candle)
+    english_columns = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+    chart = frame_to_chart(df, Ticker(code=ticker_code, name=ticker_name), CandleUnit.day(), columns=english_columns)
 
     # 3. 지표 계산
     print("Calculating indicators...")
@@ -61,10 +50,11 @@ def main():
     rsi = [v if v is not None else float('nan') for v in RSI(period=14).calculate(chart)]
     
     # MACD
+    # 열 기반 결과이므로 ndarray를 그대로 사용 (히스토그램의 NaN은 0으로 그림)
     macd_res = MACD(fast_period=12, slow_period=26, signal_period=9).calculate(chart)
-    macd = [float(r['macd']) if r['macd'] is not None else float('nan') for r in macd_res]
-    signal = [float(r['signal']) if r['signal'] is not None else float('nan') for r in macd_res]
-    hist = [float(r['histogram']) if r['histogram'] is not None else 0.0 for r in macd_res]
+    macd = macd_res.macd
+    signal = macd_res.signal
+    hist = np.nan_to_num(macd_res.histogram)
 
     # 4. 시각화 (mplfinance)
     # 추가 플롯 (AddPlots) 정의
@@ -35,6 +35,7 @@ class BacktestResult(BaseModel):
     mdd: float  # Maximum Drawdown (ex: -0.2 = -20%)
     trade_logs: List[TradeLog] = []
     daily_equity_curve: Dict[str, float] = {}
+    failed_tickers: Dict[str, str] = {}  # 데이터 로딩에 실패한 종목 {ticker_code: error message}
 
     model_config = {
         "frozen": True,
@@ -0,0 +1,17 @@
+from typing import Dict, Optional
+from pydantic import BaseModel
+from src.domain.market.candle_chart import CandleChart
+
+class UniverseLoadReport(BaseModel):
+    """
+    유니버스 데이터 로딩 결과 DTO.
+    성공한 종목의 차트와 실패한 종목의 오류 메시지를 함께 담습니다.
+    """
+    charts: Dict[str, CandleChart] = {}  # {ticker_code: chart} (요청 순서 유지)
+    failures: Dict[str, str] = {}  # {ticker_code: error message}
+    elapsed_seconds: float = 0.0
+    snapshot_error: Optional[str] = None  # 시장 단면 일괄 조회 실패로 종목별 조회로 대체한 경우의 오류 메시지
+
+    model_config = {
+        "frozen": True,
+    }
@@ -1,16 +1,22 @@
 from datetime import date
 from decimal import Decimal
 from typing import List, Dict, Tuple, Optional
+import numpy as np
 
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle import Candle
 from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_columns import to_decimal
+from src.domain.market.market_universe import MarketUniverse
 from src.domain.shared.money import Money
+from src.domain.shared.fast_money import FastMoney
+from src.domain.shared.precision import Precision
 from src.domain.portfolio.portfolio import Portfolio
 from src.domain.strategy.strategy import Strategy
 from src.domain.strategy.trading_signal import TradingSignal, SignalType
 from src.ports.market_data_provider import MarketDataProvider
 from src.application.dto.backtest_result import BacktestResult, TradeLog
+from src.application.service.universe_loader import UniverseLoader, ProgressCallback
 
 class BacktestService:
     """
@@ -19,8 +25,27 @@ class BacktestService:
     """
     TRANSACTION_COST_RATE = Decimal("0.003")  # 거래 비용률 (0.3%)
     
-    def __init__(self, data_provider: MarketDataProvider):
+    def __init__(
+        self,
+        data_provider: MarketDataProvider,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        precision: Precision = Precision.DECIMAL,
+    ):
+        """
+        Args:
+            data_provider: 시장 데이터 제공자
+            max_workers: 종목 데이터를 동시에 조회할 최대 스레드 수
+            rate_limit: 데이터 제공자 초당 최대 호출 수 (None이면 제한 없음)
+            on_progress: 종목별 로딩 완료 시 호출되는 콜백 (완료 개수, 전체 개수, 종목, 예외)
+            precision: 실행 단위 정밀도 정책 (기본 DECIMAL: 정확한 Decimal 계산, FLOAT64: float64 고속 계산을 명시적으로 선택)
+                       전략의 지표 계산(strategy.prepare로 전달)과 일별 자산 평가에 적용합니다.
+                       매매 체결과 거래 로그는 항상 정확한 금액으로 계산합니다.
+        """
         self.data_provider = data_provider
+        self.precision = precision
+        self.loader = UniverseLoader(data_provider, max_workers=max_workers, rate_limit=rate_limit, on_progress=on_progress)
 
     def run(self, tickers: List[Ticker], strategy: Strategy, start_date: date, end_date: date, initial_capital: Money) -> BacktestResult:
         """
@@ -36,35 +61,23 @@ class BacktestService:
         Returns:
             BacktestResult: 백테스트 결과 (현재는 첫 번째 종목 기준 리포트 반환)
         """
-        # 1. 데이터 준비 (Universe 생성)
-        universe: Dict[str, CandleChart] = {}
-        all_dates = set()
+        # 1. 데이터 준비 (Universe 생성: 공통 날짜 축 + 종목×날짜 행렬)
+        load_report = self.loader.load(tickers, start_date, end_date)
+        # 데이터가 없는 종목은 제외
+        universe = MarketUniverse.from_charts(load_report.charts.values())
         
-        for ticker in tickers:
-            chart = self.data_provider.get_ohlcv(ticker, start_date, end_date)
-            # 데이터가 없는 종목은 제외
-            if not chart.candles:
-                continue
-            
-            universe[ticker.code] = chart
-            # 차트의 모든 날짜 수집
-            for candle in chart.candles:
-                all_dates.add(candle.timestamp.date())
-        
-        if not universe:
+        if not len(universe):
             raise ValueError("No data found for any ticker in the given range.")
-            
-        # 날짜 정렬
-        sorted_dates = sorted(list(all_dates))
 
-        # 2. 초기화
+        # 2. 초기화 (전략의 종목별 사전 계산 포함, 지표도 이번 실행의 정밀도로 계산)
+        strategy.prepare(universe, self.precision)
         portfolio = Portfolio(initial_capital)
         trade_logs: List[TradeLog] = []
         daily_equity_curve: Dict[str, float] = {}
         mdd_tracker = {"peak": initial_capital.amount, "max_drawdown": Decimal(0)}
 
         # 3. 시뮬레이션 루프 (시간 기반)
-        for current_date in sorted_dates:
+        for date_idx, current_date in enumerate(universe.trading_dates):
             date_str = current_date.strftime("%Y-%m-%d")
             
             # 3.1 전략 분석 (전체 시장 데이터 제공)
@@ -72,51 +85,26 @@ class BacktestService:
             
             # 3.2 매매 실행
             # 리밸런싱을 위해 매도(현금확보) 먼저, 그 다음 매수 실행
-            
-            # 매도 시그널 처리 - 보유 중인 종목에 대해 SELL 시그널이 있으면 처리
-            sell_signals = [s for s in signals.values() if s.type == SignalType.SELL]
-            for signal in sell_signals:
-                if not signal.ticker: # Ticker 정보 필수
-                    continue
-                
-                # 해당 날짜의 캔들 데이터 찾기 (가격 정보 필요)
-                chart = universe.get(signal.ticker.code)
-                if not chart: continue
-                
-                idx = chart.find_index_by_date(current_date)
-                if idx == -1: continue # 오늘 데이터 없으면 거래 불가
-                
-                candle = chart.candles[idx]
-                trade_log = self._execute_trade(signal.ticker, portfolio, candle, signal, date_str)
-                if trade_log:
-                    trade_logs.append(trade_log)
-
-            # 매수 시그널 처리
-            buy_signals = [s for s in signals.values() if s.type == SignalType.BUY]
-            for signal in buy_signals:
-                if not signal.ticker:
-                    continue
-                
-                chart = universe.get(signal.ticker.code)
-                if not chart: continue
-                
-                idx = chart.find_index_by_date(current_date)
-                if idx == -1: continue
-                
-                candle = chart.candles[idx]
-                trade_log = self._execute_trade(signal.ticker, portfolio, candle, signal, date_str)
-                if trade_log:
-                    trade_logs.append(trade_log)
+            for signal_type in (SignalType.SELL, SignalType.BUY):
+                for signal in signals.values():
+                    if signal.type != signal_type or not signal.ticker: # Ticker 정보 필수
+                        continue
+                    
+                    # 해당 날짜의 캔들 위치 (가격 정보 필요)
+                    idx = universe.row_index(signal.ticker.code, date_idx)
+                    if idx == -1: continue # 오늘 데이터 없으면 거래 불가
+                    
+                    candle = universe[signal.ticker.code][idx]
+                    trade_log = self._execute_trade(signal.ticker, portfolio, candle, signal, date_str)
+                    if trade_log:
+                        trade_logs.append(trade_log)
             
             # 3.3 일별 자산 평가 및 MDD 계산
-            # 현재 유니버스에 있는 모든 종목의 오늘 종가 수집
-            current_prices = {}
-            for ticker_code, chart in universe.items():
-                idx = chart.find_index_by_date(current_date)
-                if idx != -1:
-                    current_prices[ticker_code] = chart.candles[idx].close_price
-            
-            total_equity = self._evaluate_portfolio(portfolio, current_prices)
+            # 보유 종목의 오늘 종가만 날짜 단면(cross-section)에서 읽음
+            if self.precision is Precision.FLOAT64:
+                total_equity = self._evaluate_portfolio_float(portfolio, universe, date_idx)
+            else:
+                total_equity = self._evaluate_portfolio(portfolio, self._current_prices(universe, portfolio, date_idx))
             daily_equity_curve[date_str] = float(total_equity.amount)
             self._update_mdd(total_equity.amount, mdd_tracker)
             
@@ -127,9 +115,21 @@ class BacktestService:
         
         return self._create_result(
             representative_ticker, initial_capital, daily_equity_curve, 
-            trade_logs, mdd_tracker["max_drawdown"]
+            trade_logs, mdd_tracker["max_drawdown"], load_report.failures
         )
     
+    def _current_prices(self, universe: MarketUniverse, portfolio: Portfolio, date_idx: int) -> Dict[str, FastMoney]:
+        """보유 종목들의 date_idx 날짜 종가를 {ticker_code: price}로 반환합니다. (데이터 없으면 제외)"""
+        closes = universe.cross_section(date_idx)
+        current_prices: Dict[str, FastMoney] = {}
+        for position in portfolio.positions:
+            code = position.ticker.code
+            i = universe.ticker_index(code)
+            if i == -1 or np.isnan(closes[i]):
+                continue
+            current_prices[code] = FastMoney.from_decimal(to_decimal(float(closes[i])), universe[code].currency)
+        return current_prices
+
     def _execute_trade(
         self, 
         ticker: Ticker, 
@@ -159,7 +159,7 @@ class BacktestService:
         date_str: str
     ) -> Optional[TradeLog]:
         """매수 실행"""
-        if portfolio.cash.amount <= 0:
+        if portfolio.cash_amount <= 0:
             return None
         
         quantity = self._calculate_buy_quantity(portfolio, price, signal.quantity)
@@ -209,7 +209,7 @@ class BacktestService:
         
         # 거래 비용을 고려한 최대 매수 수량
         total_rate = Decimal(1) + self.TRANSACTION_COST_RATE
-        return Decimal(int(portfolio.cash.amount / (price.amount * total_rate)))
+        return Decimal(int(portfolio.cash_amount / (price.amount * total_rate)))
     
     def _calculate_sell_quantity(
         self, 
@@ -231,16 +231,15 @@ class BacktestService:
         reason: str
     ) -> TradeLog:
         """매수 거래 로그 생성"""
-        stock_cost = price * quantity
-        transaction_fee = stock_cost * self.TRANSACTION_COST_RATE
-        total_cost = stock_cost + Money(amount=transaction_fee.amount, currency=price.currency)
+        stock_cost = FastMoney.from_money(price) * quantity
+        total_cost = stock_cost + stock_cost * self.TRANSACTION_COST_RATE
         
         return TradeLog(
             date=date_str,
             action="BUY",
             quantity=quantity,
             price=price,
-            amount=total_cost,
+            amount=total_cost.to_money(),
             reason=reason
         )
     
@@ -252,23 +251,22 @@ class BacktestService:
         reason: str
     ) -> TradeLog:
         """매도 거래 로그 생성"""
-        gross_revenue = price * quantity
-        transaction_fee = gross_revenue * self.TRANSACTION_COST_RATE
-        net_revenue = gross_revenue - Money(amount=transaction_fee.amount, currency=price.currency)
+        gross_revenue = FastMoney.from_money(price) * quantity
+        net_revenue = gross_revenue - gross_revenue * self.TRANSACTION_COST_RATE
         
         return TradeLog(
             date=date_str,
             action="SELL",
             quantity=quantity,
             price=price,
-            amount=net_revenue,
+            amount=net_revenue.to_money(),
             reason=reason
         )
     
     def _evaluate_portfolio(
         self, 
         portfolio: Portfolio, 
-        current_prices: Dict[str, Money]
+        current_prices: Dict[str, FastMoney]
     ) -> Money:
         """
         포트폴리오 자산 평가
@@ -282,6 +280,20 @@ class BacktestService:
         """
         return portfolio.get_total_equity(current_prices)
     
+    def _evaluate_portfolio_float(self, portfolio: Portfolio, universe: MarketUniverse, date_idx: int) -> Money:
+        """
+        포트폴리오 자산 평가 (Precision.FLOAT64)
+        현금과 보유 수량 × 종가를 float64로 합산합니다. (종가 데이터가 없는 종목은 제외)
+        """
+        closes = universe.cross_section(date_idx)
+        equity = float(portfolio.cash_amount)
+        for position in portfolio.positions:
+            i = universe.ticker_index(position.ticker.code)
+            if i == -1 or np.isnan(closes[i]):
+                continue
+            equity += float(position.quantity) * float(closes[i])
+        return Money.trusted(to_decimal(equity), portfolio.cash.currency)
+
     def _update_mdd(self, current_equity: Decimal, mdd_tracker: Dict[str, Decimal]) -> None:
         """MDD(Maximum Drawdown) 업데이트"""
         if current_equity > mdd_tracker["peak"]:
@@ -297,7 +309,8 @@ class BacktestService:
         initial_capital: Money,
         daily_equity_curve: Dict[str, float],
         trade_logs: List[TradeLog],
-        max_drawdown: Decimal
+        max_drawdown: Decimal,
+        failed_tickers: Optional[Dict[str, str]] = None
     ) -> BacktestResult:
         """백테스트 결과 객체 생성"""
         final_equity = Money.krw(list(daily_equity_curve.values())[-1]) if daily_equity_curve else initial_capital
@@ -310,5 +323,6 @@ class BacktestService:
             initial_capital=initial_capital,
             mdd=float(max_drawdown) * -1,
             trade_logs=trade_logs,
-            daily_equity_curve=daily_equity_curve
+            daily_equity_curve=daily_equity_curve,
+            failed_tickers=failed_tickers or {}
         )
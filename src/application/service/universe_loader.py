@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Callable, Dict, List, Optional
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.ports.market_data_provider import MarketDataProvider
+from src.application.dto.universe_load_report import UniverseLoadReport
+
+# (완료 개수, 전체 개수, 종목, 실패 시 예외)
+ProgressCallback = Callable[[int, int, Ticker, Optional[BaseException]], None]
+
+class RateLimiter:
+    """
+    초당 호출 횟수를 제한하는 스레드 안전 토큰 버킷.
+    버킷이 비어 있으면 다음 토큰이 생길 때까지 대기합니다.
+    """
+    def __init__(self, calls_per_second: float, burst: int = 1):
+        if calls_per_second <= 0:
+            raise ValueError("calls_per_second must be positive")
+        self.interval = 1.0 / calls_per_second
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.interval
+            time.sleep(wait)
+
+class UniverseLoader:
+    """
+    여러 종목의 OHLCV를 스레드 풀로 동시에 조회하는 로더.
+    - max_workers로 동시 조회 수를 제한합니다.
+    - rate_limit(초당 호출 수)을 주면 상위 데이터 소스 호출 속도를 제한합니다.
+    - 종목별 실패는 전체 로딩을 중단하지 않고 결과(failures)에 기록합니다.
+    - 시장 전체 단면을 지원하는 제공자가 이 종목/기간에는 일괄 조회가 유리하다고 답하면(prefers_market_snapshot)
+      get_universe_ohlcv 한 번으로 조회합니다. 그 밖의 경우는 항상 스레드 풀에서 종목별로 조회합니다.
+      (상위 호출마다 rate_limit을 적용하며, 일괄 조회가 실패하면 오류를 snapshot_error에 기록하고 종목별 조회로 대체)
+    """
+    def __init__(
+        self,
+        data_provider: MarketDataProvider,
+        max_workers: int = 8,
+        rate_limit: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.data_provider = data_provider
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.on_progress = on_progress
+
+    def load(self, tickers: List[Ticker], start_date: date, end_date: date) -> UniverseLoadReport:
+        started = time.perf_counter()
+
+        # 일괄 조회가 유리한 경우에만 시장 전체 단면으로 처리 (실패 시 종목별 조회로 대체)
+        snapshot_error: Optional[str] = None
+        if self.data_provider.supports_market_snapshot:
+            before_call = self.rate_limiter.acquire if self.rate_limiter else None
+            bulk: Optional[Dict[str, CandleChart]] = None
+            try:
+                if self.data_provider.prefers_market_snapshot(tickers, start_date, end_date, before_call=before_call):
+                    bulk = self.data_provider.get_universe_ohlcv(tickers, start_date, end_date, before_call=before_call)
+            except Exception as error:
+                snapshot_error = f"{type(error).__name__}: {error}"
+            if bulk is not None:
+                for completed, ticker in enumerate(tickers, start=1):
+                    if self.on_progress:
+                        self.on_progress(completed, len(tickers), ticker, None)
+                return UniverseLoadReport(charts=bulk, elapsed_seconds=time.perf_counter() - started)
+
+        loaded: Dict[str, CandleChart] = {}
+        failures: Dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(tickers)))) as executor:
+            futures = {executor.submit(self._fetch, ticker, start_date, end_date): ticker for ticker in tickers}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                ticker = futures[future]
+                error = future.exception()
+                if error is None:
+                    loaded[ticker.code] = future.result()
+                else:
+                    failures[ticker.code] = f"{type(error).__name__}: {error}"
+                if self.on_progress:
+                    self.on_progress(completed, len(tickers), ticker, error)
+
+        # 요청 순서 유지
+        charts = {ticker.code: loaded[ticker.code] for ticker in tickers if ticker.code in loaded}
+        return UniverseLoadReport(
+            charts=charts, failures=failures, elapsed_seconds=time.perf_counter() - started, snapshot_error=snapshot_error,
+        )
+
+    def _fetch(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        return self.data_provider.get_ohlcv(ticker, start_date, end_date)
@@ -50,6 +50,25 @@ class Candle(BaseModel):
         
         return self
 
+    @classmethod
+    def trusted(
+        cls,
+        open_price: Money,
+        high_price: Money,
+        low_price: Money,
+        close_price: Money,
+        volume: int,
+        timestamp: datetime,
+    ) -> 'Candle':
+        """
+        검증(validate_volume, validate_ohlc) 없이 Candle을 생성합니다.
+        validate_ohlcv_arrays로 일괄 검증했거나 자체 저장소에서 읽은 데이터 전용입니다.
+        """
+        return cls.model_construct(
+            open_price=open_price, high_price=high_price, low_price=low_price,
+            close_price=close_price, volume=volume, timestamp=timestamp,
+        )
+
     @property
     def is_bullish(self) -> bool:
         """양봉 여부 (종가 > 시가)"""
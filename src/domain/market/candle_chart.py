@@ -1,20 +1,33 @@
-from typing import List, Optional, Union, Iterator
+from typing import Any, Iterable, List, Optional, Protocol, TypeVar, Union, Iterator
 from pydantic import BaseModel, PrivateAttr
-from bisect import insort
 from datetime import timedelta, date
+import numpy as np
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_unit import CandleUnit
 from src.domain.market.candle import Candle
+from src.domain.market.candle_columns import CandleColumns, to_day_number
+from src.domain.market.candle_sequence import CandleSequence
+from src.domain.shared.money import Currency
+
+class ChartObserver(Protocol):
+    """차트에 연결되어 캔들 추가 시 종가로 갱신되는 객체 (예: 스트리밍 지표)"""
+    def reset(self) -> None: ...
+    def update_value(self, close: float) -> Any: ...
+
+ObserverT = TypeVar("ObserverT", bound=ChartObserver)
 
 class CandleChart(BaseModel):
     """
     특정 종목(Ticker)과 시간 단위(CandleUnit)를 가지는 캔들 차트(컨테이너)입니다.
     캔들은 항상 시간순으로 정렬되어 유지됩니다.
+    내부적으로는 필드별 배열(CandleColumns)에 저장하며, Candle 객체는 조회 시점에 생성합니다.
     Pydantic을 사용하여 데이터 검증.
     """
     ticker: Ticker
     unit: CandleUnit
-    _candles: List[Candle] = PrivateAttr(default_factory=list)
+    _columns: CandleColumns = PrivateAttr(default_factory=CandleColumns)
+    _is_view: bool = PrivateAttr(default=False)
+    _observers: List[ChartObserver] = PrivateAttr(default_factory=list)
 
     model_config = {
         "frozen": False,
@@ -23,36 +36,234 @@ class CandleChart(BaseModel):
     def __init__(self, ticker: Ticker, unit: CandleUnit, candles: Optional[List[Candle]] = None):
         super().__init__(ticker=ticker, unit=unit)
         if candles:
-            for candle in candles:
-                self.add_candle(candle)
+            self.extend(candles)
+
+    @classmethod
+    def from_candles(cls, ticker: Ticker, unit: CandleUnit, candles: Iterable[Candle]) -> 'CandleChart':
+        """
+        캔들 묶음으로 차트를 한 번에 생성합니다.
+        정렬은 한 번만 수행하고 중복은 선형 1회 순회로 검사합니다. (O(n log n))
+        """
+        chart = cls(ticker, unit)
+        chart.extend(candles)
+        return chart
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ticker: Ticker,
+        unit: CandleUnit,
+        timestamps: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        currency: Currency,
+        copy: bool = True,
+        validate: bool = True,
+    ) -> 'CandleChart':
+        """
+        필드별 배열로 차트를 생성합니다.
+
+        Args:
+            copy: True면 배열을 복사하여 정렬/중복 검사 후 소유하는 일반 차트를 생성합니다.
+                  False면 배열(예: np.memmap)을 복사 없이 참조하는 읽기 전용 차트 뷰를 생성하며,
+                  이때 timestamps는 이미 엄격히 증가하는 순서여야 합니다.
+            validate: True면 OHLC/거래량 규칙을 배열 전체에 대해 한 번에 검증합니다.
+                      자체 저장소처럼 이미 검증된 데이터는 False로 건너뛸 수 있습니다.
+
+        Raises:
+            CandleValidationError: validate=True이고 규칙을 위반한 행이 있는 경우
+        """
+        columns = CandleColumns.from_arrays(timestamps, opens, highs, lows, closes, volumes, currency)
+        if validate:
+            columns.validate()
+        chart = cls(ticker, unit)
+        if copy:
+            chart._columns = columns.copy_sorted()
+            return chart
+
+        times = columns.timestamps
+        if len(times) > 1 and not bool(np.all(times[1:] > times[:-1])):
+            raise ValueError("Timestamps must be strictly increasing for a zero-copy chart")
+        chart._columns = columns
+        chart._is_view = True
+        return chart
+
+    def extend(self, candles: Iterable[Candle]) -> None:
+        """
+        여러 캔들을 한 번에 추가합니다.
+        새 묶음을 정렬한 뒤 기존 차트와 O(n + m)으로 병합합니다.
+        이미 존재하는 시간(또는 묶음 내 중복)의 캔들이 있으면 ValueError를 발생시키며, 차트는 변경되지 않습니다.
+        """
+        self._check_writable()
+        batch = CandleColumns.from_candles(candles, currency=self._columns.currency)
+        size = len(self._columns)
+        appends = size == 0 or not len(batch) or batch.timestamps[0] > self._columns.timestamps[-1]
+        self._columns.merge(batch)
+        self._notify(size if appends else 0)
 
     def add_candle(self, candle: Candle) -> None:
         """
         차트에 캔들을 추가합니다.
-        이미 존재하는 시간의 캔들이라면 ValueERRor를 발생시킵니다.
+        이미 존재하는 시간의 캔들이라면 ValueError를 발생시킵니다.
         """
-        # 중복 검사 (성능을 위해 마지막 캔들과 비교하거나 전체 검색 필요, 일단 간단히 구현)
-        for c in self._candles:
-            if c.timestamp == candle.timestamp:
-                raise ValueError(f"Candle with timestamp {candle.timestamp} already exists")
+        self._check_writable()
+        row = self._columns.encode(candle)
+        timestamps = self._columns.timestamps
 
-        # 시간순 정렬 유지하며 삽입
-        self._candles.append(candle)
-        self._candles.sort(key=lambda x: x.timestamp)
+        # 정렬된 timestamp 배열에서 삽입 위치를 이진 탐색 (중복 검사 겸용)
+        position = int(np.searchsorted(timestamps, row[0], side="left"))
+        if position < len(timestamps) and timestamps[position] == row[0]:
+            raise ValueError(f"Candle with timestamp {candle.timestamp} already exists")
+
+        # 시간순 정렬 유지하며 삽입 (대부분 맨 뒤 append)
+        appends = position == len(timestamps)
+        self._columns.insert(position, row)
+        self._notify(position if appends else 0)
+
+    def attach(self, observer: ObserverT) -> ObserverT:
+        """
+        관찰자(예: 스트리밍 지표)를 연결합니다.
+        기존 캔들로 상태를 채운 뒤, 이후 캔들이 뒤에 추가될 때마다 새 캔들만큼 O(1)로 갱신합니다.
+        """
+        observer.reset()
+        for close in self._columns.closes.tolist():
+            observer.update_value(close)
+        self._observers.append(observer)
+        return observer
+
+    def detach(self, observer: ChartObserver) -> None:
+        self._observers.remove(observer)
+
+    def _notify(self, start: int) -> None:
+        """
+        start 이후 행을 관찰자에게 전달합니다.
+        중간 삽입(start=0)처럼 과거가 바뀐 경우에는 상태를 초기화하고 전체를 다시 적용합니다.
+        """
+        if not self._observers:
+            return
+        closes = self._columns.closes[start:].tolist()
+        for observer in self._observers:
+            if start == 0:
+                observer.reset()
+            for close in closes:
+                observer.update_value(close)
+
+    def _check_writable(self) -> None:
+        if self._is_view:
+            raise ValueError("Cannot modify a read-only chart view")
+
+    @property
+    def candles(self) -> CandleSequence:
+        """
+        외부에서는 읽기 전용 뷰로 접근합니다.
+        리스트를 복사하지 않으며, Candle 객체는 인덱스 접근 시점에만 생성됩니다.
+        """
+        return CandleSequence(self._columns.view(0, len(self._columns)))
+
+    @property
+    def currency(self) -> Optional[Currency]:
+        """차트 가격의 통화 (빈 차트면 None)"""
+        return self._columns.currency
 
     @property
-    def candles(self) -> List[Candle]:
-        """외부에서는 읽기 전용으로 접근"""
-        return list(self._candles)
+    def version(self) -> int:
+        """데이터 변경 카운터 (캔들이 추가/삽입될 때마다 증가)"""
+        return self._columns.version
+
+    @property
+    def is_view(self) -> bool:
+        """다른 차트의 구간을 참조하는 읽기 전용 뷰인지 여부"""
+        return self._is_view
+
+    def slice(self, start: Optional[int] = None, end: Optional[int] = None) -> 'CandleChart':
+        """
+        [start, end) 구간을 복사 없이 참조하는 읽기 전용 차트 뷰를 반환합니다.
+        파이썬 슬라이스와 동일하게 음수 인덱스와 범위 초과를 허용합니다.
+        """
+        start_idx, end_idx, _ = slice(start, end).indices(len(self._columns))
+        return self._view(start_idx, max(start_idx, end_idx))
+
+    def window(self, end_idx: int, length: int) -> 'CandleChart':
+        """
+        end_idx(포함)에서 끝나는 최근 length개 캔들의 읽기 전용 차트 뷰를 반환합니다.
+        앞쪽 데이터가 부족하면 0번 인덱스부터 시작합니다.
+        """
+        if length <= 0:
+            raise ValueError("Window length must be positive")
+        size = len(self._columns)
+        if end_idx < 0:
+            end_idx += size
+        if not 0 <= end_idx < size:
+            raise IndexError("Window end index out of range")
+        return self._view(max(0, end_idx - length + 1), end_idx + 1)
+
+    def _view(self, start: int, stop: int) -> 'CandleChart':
+        view = CandleChart(self.ticker, self.unit)
+        view._columns = self._columns.view(start, stop)
+        view._is_view = True
+        return view
+
+    @property
+    def day_numbers(self) -> np.ndarray:
+        """캔들별 일 번호 배열 (1970-01-01 기준 경과 일수, int64, 읽기 전용)"""
+        return self._read_only(self._columns.days)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """캔들 시각 배열 (datetime64[us], 읽기 전용)"""
+        return self._read_only(self._columns.timestamps)
+
+    @property
+    def opens(self) -> np.ndarray:
+        """시가 배열 (float64, 읽기 전용)"""
+        return self._read_only(self._columns.opens)
+
+    @property
+    def highs(self) -> np.ndarray:
+        """고가 배열 (float64, 읽기 전용)"""
+        return self._read_only(self._columns.highs)
+
+    @property
+    def lows(self) -> np.ndarray:
+        """저가 배열 (float64, 읽기 전용)"""
+        return self._read_only(self._columns.lows)
+
+    @property
+    def closes(self) -> np.ndarray:
+        """종가 배열 (float64, 읽기 전용)"""
+        return self._read_only(self._columns.closes)
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """거래량 배열 (int64, 읽기 전용)"""
+        return self._read_only(self._columns.volumes)
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
 
     def get_latest_candle(self) -> Optional[Candle]:
         """가장 최근(마지막) 캔들을 반환합니다."""
-        if not self._candles:
+        if not len(self._columns):
             return None
-        return self._candles[-1]
+        return self._columns.candle_at(len(self._columns) - 1)
+
+    def __getitem__(self, index: int) -> Candle:
+        """index 위치의 캔들을 생성하여 반환합니다. (음수 인덱스 지원)"""
+        size = len(self._columns)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Candle index out of range")
+        return self._columns.candle_at(index)
 
     def __len__(self) -> int:
-        return len(self._candles)
+        return len(self._columns)
 
     def verify(self) -> List[str]:
         """
@@ -62,7 +273,7 @@ class CandleChart(BaseModel):
             발견된 문제점들의 리스트 (비어있으면 정상)
         """
         messages = []
-        if not self._candles:
+        if not len(self._columns):
             messages.append("Chart is empty")
             return messages
 
@@ -72,26 +283,32 @@ class CandleChart(BaseModel):
         # 분봉이면 (5분*3) = 15분 이상 차이나면 Gap으로 간주
         gap_threshold = unit_delta * 3 + timedelta(days=2)
 
-        for i in range(len(self._candles) - 1):
-            curr = self._candles[i]
-            next_c = self._candles[i+1]
+        # 인접 캔들 간 시간 차이를 한 번에 계산
+        timestamps = self._columns.timestamps
+        diffs = np.diff(timestamps)
+        disordered = diffs <= np.timedelta64(0, "us")
+        gaps = diffs > np.timedelta64(gap_threshold)
+
+        for i in np.flatnonzero(disordered | gaps):
+            curr = timestamps[i].item()
+            next_c = timestamps[i + 1].item()
 
             # 1. 정렬 및 중복 검사
-            if curr.timestamp >= next_c.timestamp:
-                messages.append(f"[Order/Duplicate] Index {i}: {curr.timestamp} >= {next_c.timestamp}")
+            if disordered[i]:
+                messages.append(f"[Order/Duplicate] Index {i}: {curr} >= {next_c}")
                 continue
 
             # 2. Gap 분석 (연속성)
             # 단순히 시간 차이가 너무 크면 알림
-            time_diff = next_c.timestamp - curr.timestamp
-            if time_diff > gap_threshold:
-                 messages.append(f"[Gap] Index {i} -> {i+1}: Missing data between {curr.timestamp} and {next_c.timestamp} (Diff: {time_diff})")
+            time_diff = next_c - curr
+            messages.append(f"[Gap] Index {i} -> {i+1}: Missing data between {curr} and {next_c} (Diff: {time_diff})")
 
         return messages
 
     def find_index_by_date(self, target_date: date) -> int:
         """
         특정 날짜에 해당하는 캔들의 인덱스를 반환합니다.
+        같은 날짜에 캔들이 여러 개(분봉 등)라면 그날의 마지막 캔들을 반환합니다.
         찾지 못하면 -1을 반환합니다.
         
         Args:
@@ -100,12 +317,18 @@ class CandleChart(BaseModel):
         Returns:
             int: 캔들 인덱스 (0-based), 없으면 -1
         """
-        # 이진 탐색을 사용하면 더 빠르겠지만, timestamp와 date 타입 불일치/시간 포함 여부로 인해
-        # 일단은 안전하게 뒤에서부터 탐색 (최신 날짜를 조회할 확률이 높으므로)
-        for i in range(len(self._candles) - 1, -1, -1):
-            if self._candles[i].timestamp.date() == target_date:
-                return i
-            # 이미 target_date보다 과거로 갔다면 더 이상 찾을 필요 없음
-            if self._candles[i].timestamp.date() < target_date:
-                return -1
+        day = to_day_number(target_date)
+        days = self._columns.days
+        i = int(np.searchsorted(days, day, side="right")) - 1
+        if i >= 0 and days[i] == day:
+            return i
         return -1
+
+    def find_index_at_or_before(self, target_date: date) -> int:
+        """
+        특정 날짜 또는 그 이전 가장 가까운 날짜의 (마지막) 캔들 인덱스를 반환합니다.
+        휴장일 등 정확히 일치하는 캔들이 없을 때의 시점(as-of) 조회용이며, 비용은 정확 일치 조회와 같습니다.
+        target_date 이전 캔들이 없으면 -1을 반환합니다.
+        """
+        day = to_day_number(target_date)
+        return int(np.searchsorted(self._columns.days, day, side="right")) - 1
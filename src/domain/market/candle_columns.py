@@ -0,0 +1,350 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Optional, Tuple
+import numpy as np
+from src.domain.market.candle import Candle
+from src.domain.market.candle_validation import validate_ohlcv_arrays
+from src.domain.shared.money import Money, Currency
+
+TIMESTAMP_DTYPE = np.dtype("datetime64[us]")
+PRICE_DTYPE = np.dtype("float64")
+VOLUME_DTYPE = np.dtype("int64")
+DAY_DTYPE = np.dtype("int64")
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def to_decimal(value: float) -> Decimal:
+    """
+    float 가격을 Decimal로 변환합니다.
+    정수값은 지수 없이, 그 외에는 최단 표현(repr)을 사용하여 Money.krw와 동일한 값을 복원합니다.
+    """
+    if value.is_integer():
+        return Decimal(int(value))
+    return Decimal(repr(value))
+
+def to_day_number(target_date: date) -> int:
+    """날짜를 1970-01-01 기준 경과 일수(일 번호)로 변환합니다."""
+    return target_date.toordinal() - _EPOCH_ORDINAL
+
+def to_datetime64(timestamp: datetime) -> np.datetime64:
+    """datetime을 마이크로초 단위 datetime64로 변환합니다."""
+    if timestamp.tzinfo is not None:
+        raise ValueError(f"Timezone-aware timestamp is not supported: {timestamp}")
+    return np.datetime64(timestamp, "us")
+
+class CandleColumns:
+    """
+    캔들 데이터를 필드별 연속 배열(Struct-of-Arrays)로 보관하는 저장소입니다.
+    - timestamps: datetime64[us] (int64, 8 bytes)
+    - opens / highs / lows / closes: float64 (각 8 bytes)
+    - volumes: int64 (8 bytes)
+    캔들 1개당 48 bytes만 사용하며, Candle 객체는 조회 시점에만 생성합니다.
+    용량(capacity)을 두 배씩 늘려 append를 분할 상환 O(1)로 처리합니다.
+
+    날짜 조회를 위해 일 번호(1970-01-01 기준 경과 일수) 배열을 함께 유지합니다.
+    _days_valid는 앞에서부터 몇 개의 일 번호가 유효한지를 나타내며,
+    뒤에 추가되는 경우 새 구간만, 중간 삽입 시에는 삽입 위치 이후만 다시 계산합니다.
+
+    version은 데이터가 바뀔 때마다(추가/삽입/병합/재정렬) 1씩 증가하며, 지표 캐시의 무효화 키로 사용됩니다.
+    """
+    __slots__ = (
+        "_timestamps", "_opens", "_highs", "_lows", "_closes", "_volumes", "_size", "currency",
+        "_days", "_days_valid", "version",
+    )
+
+    def __init__(self, capacity: int = 0, currency: Optional[Currency] = None):
+        self._timestamps = np.empty(capacity, dtype=TIMESTAMP_DTYPE)
+        self._opens = np.empty(capacity, dtype=PRICE_DTYPE)
+        self._highs = np.empty(capacity, dtype=PRICE_DTYPE)
+        self._lows = np.empty(capacity, dtype=PRICE_DTYPE)
+        self._closes = np.empty(capacity, dtype=PRICE_DTYPE)
+        self._volumes = np.empty(capacity, dtype=VOLUME_DTYPE)
+        self._size = 0
+        self.currency = currency
+        self._days = np.empty(0, dtype=DAY_DTYPE)
+        self._days_valid = 0
+        self.version = 0
+
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        currency: Optional[Currency],
+    ) -> 'CandleColumns':
+        """
+        이미 준비된 배열로 저장소를 생성합니다.
+        dtype이 일치하면 복사하지 않고 그대로 참조합니다.
+        """
+        columns = cls(currency=currency)
+        columns._timestamps = np.asarray(timestamps, dtype=TIMESTAMP_DTYPE)
+        columns._opens = np.asarray(opens, dtype=PRICE_DTYPE)
+        columns._highs = np.asarray(highs, dtype=PRICE_DTYPE)
+        columns._lows = np.asarray(lows, dtype=PRICE_DTYPE)
+        columns._closes = np.asarray(closes, dtype=PRICE_DTYPE)
+        columns._volumes = np.asarray(volumes, dtype=VOLUME_DTYPE)
+
+        size = len(columns._timestamps)
+        for array in (columns._opens, columns._highs, columns._lows, columns._closes, columns._volumes):
+            if array.ndim != 1 or len(array) != size:
+                raise ValueError("All columns must be 1-D arrays of the same length")
+        columns._size = size
+        return columns
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle], currency: Optional[Currency] = None) -> 'CandleColumns':
+        """
+        Candle 묶음을 한 번에 정렬된 배열로 변환합니다.
+        정렬은 한 번만(O(n log n)) 수행하고, 중복 timestamp는 선형 1회 순회로 검출합니다.
+        """
+        columns = cls(currency=currency)
+        rows = [columns.encode(candle) for candle in candles]
+        if not rows:
+            return columns
+
+        timestamps, opens, highs, lows, closes, volumes = zip(*rows)
+        batch = cls.from_arrays(
+            np.array(timestamps, dtype=TIMESTAMP_DTYPE), np.array(opens), np.array(highs),
+            np.array(lows), np.array(closes), np.array(volumes), columns.currency,
+        )
+        batch.sort()
+        return batch
+
+    def copy_sorted(self) -> 'CandleColumns':
+        """배열을 복사한 뒤 정렬/중복 검사를 수행한 새 저장소를 반환합니다."""
+        copied = CandleColumns.from_arrays(
+            self.timestamps.copy(), self.opens.copy(), self.highs.copy(),
+            self.lows.copy(), self.closes.copy(), self.volumes.copy(), self.currency,
+        )
+        copied.sort()
+        return copied
+
+    def sort(self) -> None:
+        """
+        시간순으로 정렬하고 중복 timestamp를 검사합니다.
+        이미 정렬된 경우 배열을 재배치하지 않습니다.
+        """
+        timestamps = self.timestamps
+        if len(timestamps) > 1 and not bool(np.all(timestamps[1:] > timestamps[:-1])):
+            order = np.argsort(timestamps, kind="stable")
+            for name in ("_timestamps", "_opens", "_highs", "_lows", "_closes", "_volumes"):
+                setattr(self, name, getattr(self, name)[:self._size][order])
+            timestamps = self.timestamps
+            self._days_valid = 0
+            self.version += 1
+
+        duplicated = np.flatnonzero(timestamps[1:] == timestamps[:-1])
+        if len(duplicated):
+            raise ValueError(f"Candle with timestamp {timestamps[duplicated[0]].item()} already exists")
+
+    def view(self, start: int, stop: int) -> 'CandleColumns':
+        """
+        [start, stop) 구간을 복사 없이 참조하는 저장소를 반환합니다.
+        원본에 이후 추가/병합이 일어나도 뷰가 가리키는 데이터는 변하지 않습니다.
+        """
+        return CandleColumns.from_arrays(
+            self._timestamps[start:stop], self._opens[start:stop], self._highs[start:stop],
+            self._lows[start:stop], self._closes[start:stop], self._volumes[start:stop],
+            self.currency,
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def nbytes(self) -> int:
+        """실제 데이터가 차지하는 메모리 (bytes)"""
+        row_bytes = TIMESTAMP_DTYPE.itemsize + PRICE_DTYPE.itemsize * 4 + VOLUME_DTYPE.itemsize
+        return row_bytes * self._size
+
+    @property
+    def days(self) -> np.ndarray:
+        """
+        캔들별 일 번호 배열 (int64, 정렬됨).
+        아직 계산되지 않은 뒤쪽 구간만 변환하므로, append 이후 조회는 추가된 개수만큼의 비용만 듭니다.
+        """
+        size = self._size
+        valid = self._days_valid
+        if valid < size:
+            if len(self._days) < size:
+                days = np.empty(self.capacity, dtype=DAY_DTYPE)
+                days[:valid] = self._days[:valid]
+                self._days = days
+            self._days[valid:size] = self._timestamps[valid:size].astype("datetime64[D]").view(DAY_DTYPE)
+            self._days_valid = size
+        return self._days[:size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[:self._size]
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self._opens[:self._size]
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self._highs[:self._size]
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self._lows[:self._size]
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self._closes[:self._size]
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self._volumes[:self._size]
+
+    def encode(self, candle: Candle) -> Tuple[np.datetime64, float, float, float, float, int]:
+        """Candle을 컬럼 값 튜플로 변환합니다. (통화 검사 포함)"""
+        currency = candle.open_price.currency
+        if self.currency is None:
+            self.currency = currency
+        elif currency != self.currency:
+            raise ValueError(f"Currency mismatch: chart uses {self.currency}, candle uses {currency}")
+
+        return (
+            to_datetime64(candle.timestamp),
+            float(candle.open_price.amount),
+            float(candle.high_price.amount),
+            float(candle.low_price.amount),
+            float(candle.close_price.amount),
+            candle.volume,
+        )
+
+    def append(self, row: Tuple[np.datetime64, float, float, float, float, int]) -> None:
+        """맨 뒤에 한 행을 추가합니다. (분할 상환 O(1))"""
+        if self._size == self.capacity:
+            self._grow(max(8, self.capacity * 2))
+
+        i = self._size
+        (self._timestamps[i], self._opens[i], self._highs[i],
+         self._lows[i], self._closes[i], self._volumes[i]) = row
+        self._size += 1
+        self.version += 1
+
+    def insert(self, position: int, row: Tuple[np.datetime64, float, float, float, float, int]) -> None:
+        """
+        중간에 한 행을 삽입합니다. (O(n))
+        기존 배열을 제자리에서 밀지 않고 새 배열을 만들므로, 앞서 꺼내간 배열 뷰는 그대로 유지됩니다.
+        """
+        if position == self._size:
+            self.append(row)
+            return
+
+        self._timestamps = np.insert(self.timestamps, position, row[0])
+        self._opens = np.insert(self.opens, position, row[1])
+        self._highs = np.insert(self.highs, position, row[2])
+        self._lows = np.insert(self.lows, position, row[3])
+        self._closes = np.insert(self.closes, position, row[4])
+        self._volumes = np.insert(self.volumes, position, row[5])
+        self._size += 1
+        self._days_valid = min(self._days_valid, position)
+        self.version += 1
+
+    def merge(self, batch: 'CandleColumns') -> None:
+        """
+        정렬된 batch를 O(n + m)으로 병합합니다.
+        batch가 모두 기존 데이터 이후라면 버퍼 뒤에 이어 붙이고,
+        그렇지 않으면 삽입 위치를 한 번에 계산하여 새 배열에 배치합니다.
+        기존 timestamp와 겹치면 ValueError를 발생시킵니다.
+        """
+        if not len(batch):
+            return
+        if self.currency is None:
+            self.currency = batch.currency
+        elif batch.currency is not None and batch.currency != self.currency:
+            raise ValueError(f"Currency mismatch: chart uses {self.currency}, candle uses {batch.currency}")
+
+        size, added = self._size, len(batch)
+        sources = (batch.timestamps, batch.opens, batch.highs, batch.lows, batch.closes, batch.volumes)
+        names = ("_timestamps", "_opens", "_highs", "_lows", "_closes", "_volumes")
+
+        # 1. 가장 흔한 경우: 새 데이터가 모두 마지막 캔들 이후 (제자리 append)
+        if size == 0 or batch.timestamps[0] > self._timestamps[size - 1]:
+            if size + added > self.capacity:
+                self._grow(max(size + added, self.capacity * 2))
+            for name, source in zip(names, sources):
+                getattr(self, name)[size:size + added] = source
+            self._size += added
+            self.version += 1
+            return
+
+        # 2. 중간 삽입: batch 각 원소의 최종 위치 = 기존 배열 내 삽입 위치 + batch 내 순번
+        timestamps = self.timestamps
+        positions = np.searchsorted(timestamps, batch.timestamps, side="left")
+        inside = positions < size
+        collided = np.flatnonzero(inside)[timestamps[positions[inside]] == batch.timestamps[inside]]
+        if len(collided):
+            raise ValueError(f"Candle with timestamp {batch.timestamps[collided[0]].item()} already exists")
+
+        targets = positions + np.arange(added)
+        from_existing = np.ones(size + added, dtype=bool)
+        from_existing[targets] = False
+
+        for name, source in zip(names, sources):
+            merged = np.empty(size + added, dtype=source.dtype)
+            merged[from_existing] = getattr(self, name)[:size]
+            merged[targets] = source
+            setattr(self, name, merged)
+        self._size += added
+        self._days_valid = min(self._days_valid, int(targets[0]))
+        self.version += 1
+
+    def validate(self) -> None:
+        """
+        저장된 모든 행의 OHLC/거래량 규칙을 한 번에 검증합니다.
+
+        Raises:
+            CandleValidationError: 실패한 행이 있는 경우
+        """
+        validate_ohlcv_arrays(self.opens, self.highs, self.lows, self.closes, self.volumes, self.timestamps)
+
+    def candle_at(self, index: int) -> Candle:
+        """
+        index 위치의 Candle 객체를 생성하여 반환합니다.
+        저장소에 들어온 데이터는 이미 검증되었으므로 검증 없는 trusted 생성자를 사용합니다.
+        """
+        currency = self.currency
+        return Candle.trusted(
+            open_price=Money.trusted(to_decimal(float(self._opens[index])), currency),
+            high_price=Money.trusted(to_decimal(float(self._highs[index])), currency),
+            low_price=Money.trusted(to_decimal(float(self._lows[index])), currency),
+            close_price=Money.trusted(to_decimal(float(self._closes[index])), currency),
+            volume=int(self._volumes[index]),
+            timestamp=self._timestamps[index].item(),
+        )
+
+    def _grow(self, capacity: int) -> None:
+        """배열 용량을 늘립니다. 기존 데이터는 새 버퍼로 복사됩니다."""
+        for name in ("_timestamps", "_opens", "_highs", "_lows", "_closes", "_volumes"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CandleColumns):
+            return NotImplemented
+        return (
+            self.currency == other.currency
+            and np.array_equal(self.timestamps, other.timestamps)
+            and np.array_equal(self.opens, other.opens)
+            and np.array_equal(self.highs, other.highs)
+            and np.array_equal(self.lows, other.lows)
+            and np.array_equal(self.closes, other.closes)
+            and np.array_equal(self.volumes, other.volumes)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,51 @@
+from typing import Iterator, Sequence, Union, overload
+from src.domain.market.candle import Candle
+from src.domain.market.candle_columns import CandleColumns
+
+class CandleSequence(Sequence[Candle]):
+    """
+    CandleChart의 캔들을 복사 없이 보여주는 읽기 전용 시퀀스 뷰입니다.
+    Candle 객체는 인덱스로 접근하는 시점에만 생성되며, 슬라이싱도 새 뷰를 반환합니다.
+    """
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: CandleColumns):
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'CandleSequence': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, 'CandleSequence']:
+        size = len(self._columns)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step != 1:
+                raise ValueError("CandleSequence only supports contiguous slices")
+            return CandleSequence(self._columns.view(start, max(start, stop)))
+
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Candle index out of range")
+        return self._columns.candle_at(index)
+
+    def __iter__(self) -> Iterator[Candle]:
+        columns = self._columns
+        for i in range(len(columns)):
+            yield columns.candle_at(i)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CandleSequence(len={len(self)})"
@@ -0,0 +1,58 @@
+from typing import List, Optional
+import numpy as np
+
+class CandleValidationError(ValueError):
+    """
+    배열 단위 캔들 검증 실패 시 발생하는 예외.
+    rows에 실패한 행 인덱스 전체를, 메시지에는 앞쪽 일부 행과 사유를 담습니다.
+    """
+    MAX_REPORTED_ROWS = 5
+
+    def __init__(self, rows: np.ndarray, reasons: List[str]):
+        self.rows = rows
+        self.reasons = reasons
+        shown = "; ".join(reasons[:self.MAX_REPORTED_ROWS])
+        more = f" (and {len(rows) - self.MAX_REPORTED_ROWS} more)" if len(rows) > self.MAX_REPORTED_ROWS else ""
+        super().__init__(f"{len(rows)} invalid candle rows: {shown}{more}")
+
+def validate_ohlcv_arrays(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    timestamps: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Candle.validate_ohlc와 같은 규칙을 배열 전체에 한 번에(벡터화) 적용합니다.
+    - 가격은 유한한 값
+    - 고가는 시가/저가/종가 이상, 저가는 시가/고가/종가 이하
+    - 거래량은 0 이상
+    (통화 일치는 차트 단위로 하나의 통화를 사용하므로 CandleColumns에서 검사합니다.)
+
+    Raises:
+        CandleValidationError: 실패한 행이 하나라도 있는 경우
+    """
+    not_finite = ~(np.isfinite(opens) & np.isfinite(highs) & np.isfinite(lows) & np.isfinite(closes))
+    bad_high = highs < np.maximum(np.maximum(opens, lows), closes)
+    bad_low = lows > np.minimum(np.minimum(opens, highs), closes)
+    bad_volume = volumes < 0
+
+    invalid = not_finite | bad_high | bad_low | bad_volume
+    if not invalid.any():
+        return
+
+    rows = np.flatnonzero(invalid)
+    reasons = []
+    for i in rows[:CandleValidationError.MAX_REPORTED_ROWS]:
+        causes = [
+            name for name, failed in (
+                ("price is not finite", not_finite[i]),
+                ("high price must be the highest among OHLC", bad_high[i]),
+                ("low price must be the lowest among OHLC", bad_low[i]),
+                ("volume cannot be negative", bad_volume[i]),
+            ) if failed
+        ]
+        where = f"row {i}" if timestamps is None else f"row {i} ({timestamps[i]})"
+        reasons.append(f"{where}: {', '.join(causes)}")
+    raise CandleValidationError(rows, reasons)
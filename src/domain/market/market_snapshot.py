@@ -0,0 +1,84 @@
+from datetime import date
+from typing import Dict, Iterable, List
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.shared.money import Currency
+
+class MarketSnapshot:
+    """
+    특정 하루의 시장 전체 OHLCV 단면(cross-section)입니다.
+    종목 코드 배열과 필드별 배열을 같은 순서로 보관합니다.
+    """
+    __slots__ = ("date", "codes", "opens", "highs", "lows", "closes", "volumes", "currency")
+
+    def __init__(
+        self,
+        target_date: date,
+        codes: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        currency: Currency = Currency.KRW,
+    ):
+        self.date = target_date
+        self.codes = np.asarray(codes, dtype=str)
+        self.opens = np.asarray(opens, dtype=np.float64)
+        self.highs = np.asarray(highs, dtype=np.float64)
+        self.lows = np.asarray(lows, dtype=np.float64)
+        self.closes = np.asarray(closes, dtype=np.float64)
+        self.volumes = np.asarray(volumes, dtype=np.int64)
+        self.currency = currency
+
+        size = len(self.codes)
+        for array in (self.opens, self.highs, self.lows, self.closes, self.volumes):
+            if len(array) != size:
+                raise ValueError("All snapshot columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+def pivot_snapshots(
+    snapshots: Iterable[MarketSnapshot],
+    tickers: List[Ticker],
+    unit: CandleUnit = CandleUnit.day(),
+) -> Dict[str, CandleChart]:
+    """
+    날짜별 시장 단면들을 종목별 CandleChart로 변환(pivot)합니다.
+    모든 단면을 이어 붙인 뒤 종목 코드로 한 번 정렬하여, 종목별 연속 구간을 잘라 배열 그대로 차트에 넘깁니다.
+    요청한 종목 중 데이터가 없는 종목은 빈 차트로 반환합니다.
+    """
+    snapshots = [snapshot for snapshot in snapshots if len(snapshot)]
+    charts = {ticker.code: CandleChart(ticker, unit) for ticker in tickers}
+    if not snapshots:
+        return charts
+
+    codes = np.concatenate([s.codes for s in snapshots])
+    timestamps = np.concatenate([np.full(len(s), np.datetime64(s.date, "us")) for s in snapshots])
+    fields = [
+        np.concatenate([getattr(s, field) for s in snapshots])
+        for field in ("opens", "highs", "lows", "closes", "volumes")
+    ]
+
+    # 요청 종목만 남긴 뒤 (종목, 시각) 순으로 정렬
+    wanted = np.isin(codes, np.array(list(charts), dtype=str))
+    codes, timestamps = codes[wanted], timestamps[wanted]
+    fields = [field[wanted] for field in fields]
+    order = np.lexsort((timestamps, codes))
+    codes, timestamps = codes[order], timestamps[order]
+    fields = [field[order] for field in fields]
+
+    unique_codes, starts = np.unique(codes, return_index=True)
+    ends = np.append(starts[1:], len(codes))
+    by_code = {ticker.code: ticker for ticker in tickers}
+    currency = snapshots[0].currency
+    for code, start, end in zip(unique_codes.tolist(), starts, ends):
+        charts[code] = CandleChart.from_arrays(
+            by_code[code], unit, timestamps[start:end],
+            *(field[start:end] for field in fields),
+            currency=currency,
+        )
+    return charts
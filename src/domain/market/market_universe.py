@@ -0,0 +1,129 @@
+from collections.abc import Mapping
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Tuple
+import numpy as np
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_columns import to_day_number
+
+class MarketUniverse(Mapping):
+    """
+    여러 종목의 차트를 하나의 공통 거래일 축으로 정렬한 시장 데이터 집합입니다.
+
+    - dates: 모든 종목의 거래일을 합친 정렬된 날짜 축 (datetime64[D])
+    - opens / highs / lows / closes: (종목 × 날짜) float64 행렬, 데이터가 없는 칸은 NaN
+    - volumes: (종목 × 날짜) int64 행렬, 데이터가 없는 칸은 0
+    - mask: (종목 × 날짜) bool 행렬, 해당 날짜에 캔들이 있으면 True
+    - rows: (종목 × 날짜) int64 행렬, 각 칸에 대응하는 차트 인덱스 (없으면 -1)
+
+    행렬은 열(날짜) 우선(Fortran order)으로 저장되어 특정 날짜의 단면(cross-section)이 연속 메모리입니다.
+    하루에 캔들이 여러 개인 차트(분봉 등)는 그날의 마지막 캔들을 사용합니다.
+    기존 코드와의 호환을 위해 {ticker_code: CandleChart} 매핑처럼 동작합니다.
+    """
+
+    def __init__(self, charts: Dict[str, CandleChart]):
+        self._charts: Dict[str, CandleChart] = dict(charts)
+        self.codes: List[str] = list(self._charts)
+        self._positions: Dict[str, int] = {code: i for i, code in enumerate(self.codes)}
+
+        # 1. 종목별 "하루의 마지막 캔들" 위치와 일 번호
+        last_rows: List[np.ndarray] = []
+        last_days: List[np.ndarray] = []
+        for chart in self._charts.values():
+            days = chart.day_numbers
+            if len(days):
+                is_last = np.empty(len(days), dtype=bool)
+                is_last[:-1] = days[1:] != days[:-1]
+                is_last[-1] = True
+                rows = np.flatnonzero(is_last)
+            else:
+                rows = np.empty(0, dtype=np.int64)
+            last_rows.append(rows)
+            last_days.append(days[rows])
+
+        # 2. 공통 날짜 축
+        self._days = np.unique(np.concatenate(last_days)) if last_days else np.empty(0, dtype=np.int64)
+        self.dates = self._days.astype("datetime64[D]")
+
+        # 3. (종목 × 날짜) 행렬 구성
+        shape = (len(self.codes), len(self._days))
+        self.opens = np.full(shape, np.nan, order="F")
+        self.highs = np.full(shape, np.nan, order="F")
+        self.lows = np.full(shape, np.nan, order="F")
+        self.closes = np.full(shape, np.nan, order="F")
+        self.volumes = np.zeros(shape, dtype=np.int64, order="F")
+        self.rows = np.full(shape, -1, dtype=np.int64, order="F")
+
+        for i, chart in enumerate(self._charts.values()):
+            rows = last_rows[i]
+            columns = np.searchsorted(self._days, last_days[i])
+            self.rows[i, columns] = rows
+            self.opens[i, columns] = chart.opens[rows]
+            self.highs[i, columns] = chart.highs[rows]
+            self.lows[i, columns] = chart.lows[rows]
+            self.closes[i, columns] = chart.closes[rows]
+            self.volumes[i, columns] = chart.volumes[rows]
+
+        self.mask = self.rows >= 0
+        for matrix in (self.opens, self.highs, self.lows, self.closes, self.volumes, self.rows, self.mask):
+            matrix.flags.writeable = False
+
+    @classmethod
+    def from_charts(cls, charts: Iterable[CandleChart]) -> 'MarketUniverse':
+        """차트 목록으로 유니버스를 생성합니다. (빈 차트는 제외)"""
+        return cls({chart.ticker.code: chart for chart in charts if len(chart)})
+
+    # --- Mapping 인터페이스 (기존 Dict[str, CandleChart] 호환) ---
+    def __getitem__(self, ticker_code: str) -> CandleChart:
+        return self._charts[ticker_code]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._charts)
+
+    def __len__(self) -> int:
+        return len(self._charts)
+
+    # --- 날짜 축 조회 ---
+    @property
+    def trading_dates(self) -> List[date]:
+        """공통 거래일 목록 (date 객체)"""
+        return self.dates.tolist()
+
+    def date_index(self, target_date: date) -> int:
+        """날짜 축에서 target_date의 위치를 반환합니다. 거래일이 아니면 -1."""
+        day = to_day_number(target_date)
+        i = int(np.searchsorted(self._days, day))
+        if i < len(self._days) and self._days[i] == day:
+            return i
+        return -1
+
+    def ticker_index(self, ticker_code: str) -> int:
+        """종목 축에서 ticker_code의 위치를 반환합니다. 없으면 -1."""
+        return self._positions.get(ticker_code, -1)
+
+    def row_index(self, ticker_code: str, date_idx: int) -> int:
+        """해당 종목 차트에서 date_idx 날짜에 대응하는 캔들 인덱스를 반환합니다. 없으면 -1."""
+        i = self._positions.get(ticker_code)
+        if i is None or date_idx < 0:
+            return -1
+        return int(self.rows[i, date_idx])
+
+    def cross_section(self, date_idx: int) -> np.ndarray:
+        """date_idx 날짜의 전 종목 종가 (종목 축 순서, 없으면 NaN). 복사 없는 뷰입니다."""
+        return self.closes[:, date_idx]
+
+    def active_rows(self, date_idx: int) -> List[Tuple[str, int]]:
+        """date_idx 날짜에 캔들이 있는 (ticker_code, 차트 인덱스) 목록을 반환합니다."""
+        rows = self.rows[:, date_idx]
+        return [(self.codes[i], int(rows[i])) for i in np.flatnonzero(rows >= 0)]
+
+    def active_schedule(self) -> List[List[Tuple[str, int]]]:
+        """
+        날짜 축 순서대로 각 날짜의 active_rows 목록을 반환합니다.
+        전체 행렬을 한 번만 훑어 만들므로, 날짜마다 전 종목을 확인하지 않고 그날 거래된 종목만 순회할 수 있습니다.
+        """
+        # mask.T는 (날짜 × 종목) C 순서이므로 nonzero 결과가 날짜, 종목 순으로 정렬됨
+        date_positions, ticker_positions = np.nonzero(self.mask.T)
+        rows = self.rows.T[date_positions, ticker_positions]
+        pairs = list(zip([self.codes[i] for i in ticker_positions.tolist()], rows.tolist()))
+        bounds = np.searchsorted(date_positions, np.arange(len(self._days) + 1)).tolist()
+        return [pairs[bounds[d]:bounds[d + 1]] for d in range(len(self._days))]
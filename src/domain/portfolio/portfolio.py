@@ -1,8 +1,9 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from decimal import Decimal
 from pydantic import BaseModel, PrivateAttr, Field
 from src.domain.market.ticker import Ticker
 from src.domain.shared.money import Money
+from src.domain.shared.fast_money import FastMoney
 from src.domain.portfolio.position import Position
 
 class Portfolio(BaseModel):
@@ -13,12 +14,14 @@ class Portfolio(BaseModel):
     - 현금(cash) 관리
     - 매수/매도 시 거래 비용 자동 처리 (수수료 + 슬리피지)
     - 총 자산 평가 기능
+
+    내부 현금과 거래 비용 계산은 검증 없는 FastMoney로 수행하고, 외부에는 Money로 노출합니다.
     """
     initial_cash: Money
     commission_rate: Decimal = Field(default=Decimal("0.002"), ge=0)
     slippage_rate: Decimal = Field(default=Decimal("0.001"), ge=0)
     
-    _cash: Money = PrivateAttr()
+    _cash: FastMoney = PrivateAttr()
     _positions: Dict[str, Position] = PrivateAttr(default_factory=dict)
 
     model_config = {
@@ -28,13 +31,18 @@ class Portfolio(BaseModel):
 
     def __init__(self, initial_cash: Money, commission_rate: Decimal = Decimal("0.002"), slippage_rate: Decimal = Decimal("0.001")):
         super().__init__(initial_cash=initial_cash, commission_rate=commission_rate, slippage_rate=slippage_rate)
-        self._cash = initial_cash
+        self._cash = FastMoney.from_money(initial_cash)
         self._positions = {}
 
     @property
     def cash(self) -> Money:
         """현재 보유 현금"""
-        return self._cash
+        return self._cash.to_money()
+
+    @property
+    def cash_amount(self) -> Decimal:
+        """현재 보유 현금 금액 (Money 변환 없이)"""
+        return self._cash.amount
     
     @property
     def positions(self) -> List[Position]:
@@ -61,11 +69,8 @@ class Portfolio(BaseModel):
             raise ValueError("Quantity must be positive")
 
         # 거래 비용 계산
-        stock_cost = price * quantity
-        transaction_fee = Money(
-            amount=stock_cost.amount * (self.commission_rate + self.slippage_rate),
-            currency=price.currency
-        )
+        stock_cost = FastMoney.from_money(price) * quantity
+        transaction_fee = stock_cost * (self.commission_rate + self.slippage_rate)
         total_cost = stock_cost + transaction_fee
         
         # 현금 확인
@@ -113,11 +118,8 @@ class Portfolio(BaseModel):
             )
 
         # 거래 비용 계산
-        gross_revenue = price * quantity
-        transaction_fee = Money(
-            amount=gross_revenue.amount * (self.commission_rate + self.slippage_rate),
-            currency=price.currency
-        )
+        gross_revenue = FastMoney.from_money(price) * quantity
+        transaction_fee = gross_revenue * (self.commission_rate + self.slippage_rate)
         net_revenue = gross_revenue - transaction_fee
         
         # 현금 증가
@@ -130,21 +132,21 @@ class Portfolio(BaseModel):
         if position.quantity == 0:
             del self._positions[ticker.code]
     
-    def get_total_equity(self, current_prices: Dict[str, Money]) -> Money:
+    def get_total_equity(self, current_prices: Dict[str, Union[Money, FastMoney]]) -> Money:
         """
         총 자산 평가 = 현금 + 모든 포지션의 평가액
         
         Args:
-            current_prices: {ticker_code: current_price} 딕셔너리
+            current_prices: {ticker_code: current_price} 딕셔너리 (Money 또는 FastMoney)
             
         Returns:
             Money: 총 자산 가치
         """
-        position_value = Money(amount=Decimal(0), currency=self._cash.currency)
+        position_value = FastMoney.zero(self._cash.currency)
         
-        for position in self.positions:
+        for position in self._positions.values():
             current_price = current_prices.get(position.ticker.code)
             if current_price:
-                position_value += current_price * position.quantity
+                position_value += FastMoney.from_money(current_price) * position.quantity
         
-        return self._cash + position_value
+        return (self._cash + position_value).to_money()
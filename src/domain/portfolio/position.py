@@ -2,6 +2,7 @@ from decimal import Decimal
 from pydantic import BaseModel, Field
 from src.domain.market.ticker import Ticker
 from src.domain.shared.money import Money
+from src.domain.shared.fast_money import FastMoney
 
 class Position(BaseModel):
     """
@@ -34,15 +35,15 @@ class Position(BaseModel):
         if price.currency != self.average_price.currency:
             raise ValueError("Currency mismatch")
 
-        # 기존 총액 + 신규 매수 총액
-        new_amount = price * quantity
-        total_value = self.total_amount + new_amount
+        # 기존 총액 + 신규 매수 총액 (검증 없는 FastMoney로 계산, 결과는 Money와 동일)
+        new_amount = FastMoney.from_money(price) * quantity
+        total_value = FastMoney.from_money(self.average_price) * self.quantity + new_amount
         
         # 전체 수량 업데이트
         self.quantity += quantity
         
         # 평단가 재계산
-        self.average_price = Money(amount=total_value.amount / self.quantity, currency=self.average_price.currency)
+        self.average_price = (total_value / self.quantity).to_money()
 
     def decrease(self, quantity: Decimal):
         """
@@ -0,0 +1,166 @@
+from decimal import Decimal, getcontext
+from typing import Dict, Tuple, Union
+from src.domain.shared.money import Money, Currency
+
+# 통화별 최소 단위 지수 (KRW: 원, USD: 센트)
+MINOR_EXPONENT: Dict[Currency, int] = {
+    Currency.KRW: 0,
+    Currency.USD: -2,
+}
+
+Number = Union[int, float, Decimal]
+
+def _split(value: Decimal) -> Tuple[int, int]:
+    """Decimal을 (정수 계수, 10진 지수)로 분해합니다."""
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        raise ValueError(f"Cannot represent non-finite amount: {value}")
+    units = int("".join(map(str, digits))) if digits else 0
+    return (-units if sign else units), exponent
+
+class FastMoney:
+    """
+    검증 없이 연산하는 경량 금액 표현 (내부 연산 전용).
+
+    금액을 정수 계수(units)와 10진 지수(exponent)로 보관합니다. (amount = units × 10^exponent)
+    덧셈/뺄셈/곱셈은 Decimal과 동일하게 지수를 맞춰 정수로 정확히 계산하며,
+    결과 자릿수가 Decimal 컨텍스트 정밀도를 넘는 경우에만 Decimal 연산으로 위임하여
+    Money(Decimal)와 같은 반올림 결과를 냅니다. 나눗셈은 항상 Decimal로 위임합니다.
+
+    외부에 노출하는 값은 to_money()로 Money로 변환합니다.
+    """
+    __slots__ = ("units", "exponent", "currency")
+
+    def __init__(self, units: int, exponent: int, currency: Currency):
+        self.units = units
+        self.exponent = exponent
+        self.currency = currency
+
+    @classmethod
+    def from_decimal(cls, amount: Decimal, currency: Currency) -> 'FastMoney':
+        units, exponent = _split(amount)
+        return cls(units, exponent, currency)
+
+    @classmethod
+    def from_money(cls, money: Union[Money, 'FastMoney']) -> 'FastMoney':
+        """Money → FastMoney (FastMoney는 그대로 반환)"""
+        if isinstance(money, FastMoney):
+            return money
+        return cls.from_decimal(money.amount, money.currency)
+
+    @classmethod
+    def from_minor_units(cls, units: int, currency: Currency) -> 'FastMoney':
+        """통화 최소 단위 정수로 생성합니다. (예: USD 1234 → $12.34)"""
+        return cls(units, MINOR_EXPONENT[currency], currency)
+
+    @classmethod
+    def zero(cls, currency: Currency) -> 'FastMoney':
+        """Money(amount=Decimal(0))과 같은 0"""
+        return cls(0, 0, currency)
+
+    @property
+    def amount(self) -> Decimal:
+        return Decimal(f"{self.units}E{self.exponent}")
+
+    @property
+    def minor_units(self) -> int:
+        """
+        통화 최소 단위 정수 금액.
+
+        Raises:
+            ValueError: 최소 단위보다 작은 금액이 남는 경우
+        """
+        shift = self.exponent - MINOR_EXPONENT[self.currency]
+        if shift >= 0:
+            return self.units * 10 ** shift
+        units, remainder = divmod(self.units, 10 ** -shift)
+        if remainder:
+            raise ValueError(f"Amount {self.amount} is not a whole number of {self.currency} minor units")
+        return units
+
+    def to_money(self) -> Money:
+        return Money.trusted(self.amount, self.currency)
+
+    def _check_currency(self, other: 'FastMoney', op: str):
+        if not isinstance(other, FastMoney):
+            raise TypeError(f"Cannot {op} FastMoney and {type(other)}")
+        if self.currency != other.currency:
+            raise ValueError(f"Cannot {op} different currencies: {self.currency} and {other.currency}")
+
+    def _aligned(self, other: 'FastMoney') -> Tuple[int, int, int]:
+        """두 금액을 작은 지수로 맞춘 (self 계수, other 계수, 지수)"""
+        if self.exponent == other.exponent:
+            return self.units, other.units, self.exponent
+        if self.exponent < other.exponent:
+            return self.units, other.units * 10 ** (other.exponent - self.exponent), self.exponent
+        return self.units * 10 ** (self.exponent - other.exponent), other.units, other.exponent
+
+    @staticmethod
+    def _fits(units: int) -> bool:
+        """계수가 Decimal 컨텍스트 정밀도 안에 들어가 반올림 없이 정확한지 여부"""
+        return -(limit := 10 ** getcontext().prec) < units < limit
+
+    def __add__(self, other: 'FastMoney') -> 'FastMoney':
+        self._check_currency(other, "add")
+        a, b, exponent = self._aligned(other)
+        if self._fits(a + b):
+            return FastMoney(a + b, exponent, self.currency)
+        return FastMoney.from_decimal(self.amount + other.amount, self.currency)
+
+    def __sub__(self, other: 'FastMoney') -> 'FastMoney':
+        self._check_currency(other, "subtract")
+        a, b, exponent = self._aligned(other)
+        if self._fits(a - b):
+            return FastMoney(a - b, exponent, self.currency)
+        return FastMoney.from_decimal(self.amount - other.amount, self.currency)
+
+    def __mul__(self, factor: Number) -> 'FastMoney':
+        if not isinstance(factor, (int, float, Decimal)):
+            raise TypeError(f"Multiplier must be a number, not {type(factor)}")
+        # Money.__mul__과 동일하게 str을 거쳐 Decimal로 변환
+        factor = factor if isinstance(factor, Decimal) else Decimal(str(factor))
+        units, exponent = _split(factor)
+        product = self.units * units
+        if self._fits(product):
+            return FastMoney(product, self.exponent + exponent, self.currency)
+        return FastMoney.from_decimal(self.amount * factor, self.currency)
+
+    def __truediv__(self, divisor: Number) -> 'FastMoney':
+        if not isinstance(divisor, (int, float, Decimal)):
+            raise TypeError(f"Divisor must be a number, not {type(divisor)}")
+        divisor = divisor if isinstance(divisor, Decimal) else Decimal(str(divisor))
+        return FastMoney.from_decimal(self.amount / divisor, self.currency)
+
+    def _compare(self, other: 'FastMoney') -> int:
+        self._check_currency(other, "compare")
+        a, b, _ = self._aligned(other)
+        return (a > b) - (a < b)
+
+    def __lt__(self, other: 'FastMoney') -> bool:
+        return self._compare(other) < 0
+
+    def __le__(self, other: 'FastMoney') -> bool:
+        return self._compare(other) <= 0
+
+    def __gt__(self, other: 'FastMoney') -> bool:
+        return self._compare(other) > 0
+
+    def __ge__(self, other: 'FastMoney') -> bool:
+        return self._compare(other) >= 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FastMoney):
+            return NotImplemented
+        if self.currency != other.currency:
+            return False
+        a, b, _ = self._aligned(other)
+        return a == b
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
+    def __str__(self) -> str:
+        return str(self.to_money())
+
+    def __repr__(self) -> str:
+        return f"FastMoney({self.amount!r}, {self.currency.value})"
@@ -27,6 +27,14 @@ class Money(BaseModel):
         """KRW 통화로 Money 인스턴스 생성 (팩토리 메서드)"""
         return Money(amount=Decimal(str(amount)), currency=Currency.KRW)
 
+    @classmethod
+    def trusted(cls, amount: Decimal, currency: Currency) -> 'Money':
+        """
+        검증 없이 Money를 생성합니다. (이미 검증된 데이터 전용)
+        amount는 반드시 Decimal, currency는 Currency여야 합니다.
+        """
+        return cls.model_construct(amount=amount, currency=currency)
+
     def __add__(self, other: 'Money') -> 'Money':
         if not isinstance(other, Money):
             raise TypeError(f"Cannot add Money and {type(other)}")
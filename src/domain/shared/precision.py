@@ -0,0 +1,17 @@
+from enum import Enum
+
+class Precision(str, Enum):
+    """
+    수치 계산 정밀도 정책.
+
+    - DECIMAL: Decimal로 정확히 계산하는 참조(reference) 모드. 느리지만 결과가 입력 가격의 10진 표현에 대해 정확합니다.
+    - FLOAT64: numpy float64로 계산하는 고속 모드. 상대 오차는 대략 1e-12 수준이며 drift 검증으로 확인할 수 있습니다.
+
+    지표의 calculate(), 평가기, BacktestService의 기본값은 모두 DECIMAL이며 FLOAT64는 명시적으로 선택합니다.
+    (지표의 compute/apply 같은 배열 API는 정밀도 설정과 무관하게 항상 float64)
+    """
+    DECIMAL = "decimal"
+    FLOAT64 = "float64"
+
+    def __str__(self):
+        return self.value
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Mapping, Optional
 from src.domain.market.candle_chart import CandleChart
 from src.domain.strategy.trading_signal import TradingSignal
+from src.domain.strategy.signal_series import SignalSeries
+from src.domain.shared.precision import Precision
 
 class AssetEvaluator(ABC):
     """
@@ -20,3 +23,19 @@ class AssetEvaluator(ABC):
             TradingSignal: 매수/매도/관망 신호
         """
         pass
+
+    def prepare(self, universe_data: Mapping[str, CandleChart], precision: Optional[Precision] = None) -> None:
+        """
+        시뮬레이션 시작 전에 평가할 유니버스를 한 번 전달받습니다. (사전 계산/캐시 초기화용, 기본 구현은 아무것도 하지 않음)
+        precision이 주어지면 이후 evaluate/evaluate_series의 지표 계산에 그 정밀도를 사용합니다.
+        """
+
+    def evaluate_series(self, chart: CandleChart) -> SignalSeries:
+        """
+        차트의 모든 봉에 대한 신호를 한 번에 계산합니다.
+        기본 구현은 봉마다 evaluate를 호출하며, 지표 비교로 표현되는 평가기는 벡터 연산으로 재정의합니다.
+        
+        Returns:
+            SignalSeries: 결과의 signal_at(i)는 evaluate(chart, i)와 같은 신호
+        """
+        return SignalSeries.from_signals([self.evaluate(chart, i) for i in range(len(chart))])
@@ -1,9 +1,12 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 from datetime import date
 from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
 from src.domain.strategy.strategy import Strategy
 from src.domain.strategy.trading_signal import TradingSignal, TradingSignal
 from src.domain.strategy.asset_evaluator import AssetEvaluator
+from src.domain.strategy.signal_series import SignalSeries
+from src.domain.shared.precision import Precision
 
 class PortfolioStrategy(Strategy):
     """
@@ -13,22 +16,40 @@ class PortfolioStrategy(Strategy):
     
     def __init__(self, evaluator: AssetEvaluator):
         self.evaluator = evaluator
+        self._prepared_universe: Optional[Mapping[str, CandleChart]] = None
+        self._signal_series: Dict[str, SignalSeries] = {}
+        self._schedule: Dict[date, List[Tuple[str, int]]] = {}
 
-    def analyze(self, universe_data: Dict[str, CandleChart], current_date: date) -> Dict[str, TradingSignal]:
+    def prepare(self, universe_data: Mapping[str, CandleChart], precision: Optional[Precision] = None) -> None:
+        """
+        종목별 전체 구간 신호(evaluator.evaluate_series)와 날짜별 거래 종목 일정을 한 번씩 미리 계산합니다.
+        이후 같은 유니버스에 대한 analyze는 그날 캔들이 있는 종목만 순회하며 계산된 신호를 읽습니다.
+        precision은 평가기에 그대로 전달합니다. (실행 단위 정밀도 정책)
+        """
+        universe = universe_data if isinstance(universe_data, MarketUniverse) else MarketUniverse(dict(universe_data))
+        self.evaluator.prepare(universe_data, precision)
+        self._schedule = dict(zip(universe.trading_dates, universe.active_schedule()))
+        self._signal_series = {code: self.evaluator.evaluate_series(chart) for code, chart in universe_data.items()}
+        self._prepared_universe = universe_data
+
+    def analyze(self, universe_data: Mapping[str, CandleChart], current_date: date) -> Dict[str, TradingSignal]:
         """
         전체 유니버스를 순회하며 각 종목을 평가하고, 최종 포트폴리오 신호를 생성합니다.
         """
         universe_signals: Dict[str, TradingSignal] = {}
+        # prepare된 유니버스면 미리 계산한 신호를 사용
+        prepared = self._signal_series if universe_data is self._prepared_universe else {}
         
         # 1. 개별 종목 평가 (Bottom-up)
-        for ticker_code, chart in universe_data.items():
-            # 해당 날짜의 데이터가 있는지 확인
-            idx = chart.find_index_by_date(current_date)
-            if idx == -1:
-                continue
+        for ticker_code, idx in self._active_rows(universe_data, current_date):
+            chart = universe_data[ticker_code]
                 
-            # 하위 평가기 실행
-            signal = self.evaluator.evaluate(chart, idx)
+            series = prepared.get(ticker_code)
+            if series is not None and idx < len(series):
+                signal = series.signal_at(idx)
+            else:
+                # 하위 평가기 실행
+                signal = self.evaluator.evaluate(chart, idx)
             
             # 시그널에 티커 정보가 없다면 주입 (Evaluator가 안 채워줬을 경우 대비)
             if signal.ticker is None:
@@ -41,6 +62,27 @@ class PortfolioStrategy(Strategy):
         # 2. 포트폴리오 레벨의 최종 판단
         return self._aggregate_signals(universe_signals)
 
+    def _active_rows(self, universe_data: Mapping[str, CandleChart], current_date: date) -> Iterable[Tuple[str, int]]:
+        """
+        해당 날짜에 캔들이 있는 (ticker_code, 차트 인덱스) 목록을 반환합니다.
+        prepare된 유니버스면 미리 계산한 일정을, MarketUniverse라면 날짜 단면을 읽고, 일반 매핑이면 차트별로 날짜를 조회합니다.
+        """
+        if universe_data is self._prepared_universe:
+            scheduled = self._schedule.get(current_date)
+            if scheduled is not None:
+                return scheduled
+
+        if isinstance(universe_data, MarketUniverse):
+            date_idx = universe_data.date_index(current_date)
+            return universe_data.active_rows(date_idx) if date_idx != -1 else []
+
+        active = []
+        for ticker_code, chart in universe_data.items():
+            idx = chart.find_index_by_date(current_date)
+            if idx != -1:
+                active.append((ticker_code, idx))
+        return active
+
     def _aggregate_signals(self, raw_signals: Dict[str, TradingSignal]) -> Dict[str, TradingSignal]:
         """
         개별 종목 신호들을 취합하여 최종 신호를 확정합니다.
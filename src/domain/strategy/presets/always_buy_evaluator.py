@@ -1,13 +1,17 @@
 from typing import Optional
 from decimal import Decimal
+import numpy as np
 from src.domain.strategy.asset_evaluator import AssetEvaluator
 from src.domain.market.candle_chart import CandleChart
 from src.domain.strategy.trading_signal import TradingSignal, SignalType
+from src.domain.strategy.signal_series import SignalSeries, SignalCode
 
 class AlwaysBuyEvaluator(AssetEvaluator):
     """
     무조건 매수 신호를 생성하는 평가기.
     """
+    REASON = "Always Buy Evaluator Triggered"
+
     def evaluate(self, chart: CandleChart, current_index: int) -> TradingSignal:
         """
         항상 BUY 신호를 반환합니다.
@@ -16,5 +20,9 @@ class AlwaysBuyEvaluator(AssetEvaluator):
         return TradingSignal(
             type=SignalType.BUY,
             quantity=None,
-            reason="Always Buy Evaluator Triggered"
+            reason=self.REASON
         )
+
+    def evaluate_series(self, chart: CandleChart) -> SignalSeries:
+        """모든 봉에서 BUY (수량 None)"""
+        return SignalSeries(np.full(len(chart), SignalCode.BUY, dtype=np.int8), reason=lambda _: self.REASON, ticker=chart.ticker)
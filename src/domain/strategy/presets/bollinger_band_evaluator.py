@@ -1,8 +1,14 @@
-from typing import Dict
+from typing import Any, Dict, Mapping, Optional, Tuple
+import numpy as np
 from src.domain.strategy.asset_evaluator import AssetEvaluator
 from src.domain.market.candle_chart import CandleChart
 from src.domain.strategy.trading_signal import TradingSignal, SignalType
+from src.domain.strategy.signal_series import SignalSeries, SignalCode
+from src.domain.market.candle_columns import to_decimal
+from src.domain.shared.precision import Precision
 from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.indicator import decimal_closes
+from src.domain.technical.indicator_cache import IndicatorCache
 from src.domain.shared.money import Money
 
 class BollingerBandEvaluator(AssetEvaluator):
@@ -10,18 +16,51 @@ class BollingerBandEvaluator(AssetEvaluator):
     볼린저 밴드 기반의 평균 회귀(Mean Reversion) 평가기.
     - 하락하여 하단 밴드 이하로 떨어지면 과매도로 판단하여 매수(BUY).
     - 상승하여 상단 밴드 이상으로 올라가면 과매수로 판단하여 매도(SELL).
+
+    밴드는 종목(차트 버전)당 한 번만 전체 계산하여 종목 코드별로 보관하고, 이후에는 인덱스로만 조회합니다.
+    종목마다 한 항목만 유지하므로 유니버스 크기와 무관하게 재계산되지 않습니다.
+    cache를 주면 다른 평가기와 계산 결과를 공유하며, 이 경우 크기는 호출자가 유니버스에 맞춰 정합니다.
+    precision이 DECIMAL이면 밴드와 비교를 Decimal로 계산합니다. (prepare로 실행마다 바꿀 수 있음)
     """
     
-    def __init__(self, period: int = 20, multiplier: float = 2.0):
-        self.bb = BollingerBands(period=period, std_dev_multiplier=multiplier)
+    def __init__(
+        self,
+        period: int = 20,
+        multiplier: float = 2.0,
+        cache: Optional[IndicatorCache] = None,
+        precision: Precision = Precision.DECIMAL,
+    ):
+        self.bb = BollingerBands(period=period, std_dev_multiplier=multiplier, precision=precision)
+        self.cache = cache
+        # 종목 코드 → (차트, 차트 version, 밴드)
+        self._bands: Dict[str, Tuple[CandleChart, int, Any]] = {}
+
+    def prepare(self, universe_data: Mapping[str, CandleChart], precision: Optional[Precision] = None) -> None:
+        """새 유니버스에 대한 시뮬레이션 전에 이전 유니버스의 밴드를 비우고, 주어진 정밀도로 전환합니다."""
+        if precision is not None and precision is not self.bb.precision:
+            self.bb = self.bb.model_copy(update={"precision": precision})
+        self._bands = {}
+
+    def _bands_for(self, chart: CandleChart) -> Any:
+        """
+        차트 전체의 볼린저 밴드를 반환합니다.
+        같은 종목이라도 차트 객체나 version이 다르면 다시 계산합니다. (항목이 차트를 참조하므로 id 재사용과 혼동하지 않음)
+        """
+        code = chart.ticker.code
+        version = chart.version
+        entry = self._bands.get(code)
+        if entry is not None and entry[0] is chart and entry[1] == version:
+            return entry[2]
+        bands = self.cache.calculate(self.bb, chart) if self.cache is not None else self.bb.calculate(chart)
+        self._bands[code] = (chart, version, bands)
+        return bands
 
     def evaluate(self, chart: CandleChart, current_index: int) -> TradingSignal:
         if current_index < self.bb.period - 1:
             return TradingSignal(type=SignalType.HOLD)
             
-        # 전체 차트에 대해 볼린저 밴드 계산 (매번 계산은 비효율적일 수 있으나 일단 명확성을 위해 구현)
-        # 최적화: 캐싱하거나 필요한 부분만 계산하도록 개선 가능
-        upper_band, _, lower_band = self.bb.calculate(chart)
+        # 전체 차트에 대한 볼린저 밴드 (차트 버전이 같으면 보관된 결과 재사용)
+        upper_band, _, lower_band = self._bands_for(chart)
         
         # 현재 시점의 데이터 확인
         current_candle = chart.candles[current_index]
@@ -50,3 +89,48 @@ class BollingerBandEvaluator(AssetEvaluator):
             )
             
         return TradingSignal(type=SignalType.HOLD)
+
+    def evaluate_series(self, chart: CandleChart) -> SignalSeries:
+        """
+        전체 구간의 신호를 밴드 배열과의 비교로 한 번에 계산합니다. (evaluate와 같은 조건, 매수 우선)
+        신호 사유 문자열은 BUY/SELL 신호를 꺼낼 때만 만듭니다.
+        """
+        if self.bb.precision is Precision.DECIMAL:
+            return self._evaluate_series_decimal(chart)
+
+        closes = chart.closes
+        upper, _, lower, _, _ = self.bb.compute(closes)
+        # warm-up 구간의 NaN 비교는 False이므로 HOLD
+        buy = closes <= lower
+        sell = ~buy & (closes >= upper)
+        codes = np.full(len(closes), SignalCode.HOLD, dtype=np.int8)
+        codes[sell] = SignalCode.SELL
+        codes[buy] = SignalCode.BUY
+
+        def reason(index: int) -> str:
+            close = to_decimal(float(closes[index]))
+            if codes[index] == SignalCode.BUY:
+                return f"Close({close}) <= LowerBand({to_decimal(float(lower[index])):.2f})"
+            return f"Close({close}) >= UpperBand({to_decimal(float(upper[index])):.2f})"
+
+        return SignalSeries(codes, reason=reason, ticker=chart.ticker)
+
+    def _evaluate_series_decimal(self, chart: CandleChart) -> SignalSeries:
+        """Precision.DECIMAL: Decimal 종가와 Decimal 밴드를 비교합니다. (evaluate와 같은 조건, 매수 우선)"""
+        closes = decimal_closes(chart)
+        upper, _, lower = self.bb.compute_decimal(closes)
+        codes = np.full(len(closes), SignalCode.HOLD, dtype=np.int8)
+        for i, (close, current_upper, current_lower) in enumerate(zip(closes, upper, lower)):
+            if current_upper is None or current_lower is None:
+                continue
+            if close <= current_lower:
+                codes[i] = SignalCode.BUY
+            elif close >= current_upper:
+                codes[i] = SignalCode.SELL
+
+        def reason(index: int) -> str:
+            if codes[index] == SignalCode.BUY:
+                return f"Close({closes[index]}) <= LowerBand({lower[index]:.2f})"
+            return f"Close({closes[index]}) >= UpperBand({upper[index]:.2f})"
+
+        return SignalSeries(codes, reason=reason, ticker=chart.ticker)
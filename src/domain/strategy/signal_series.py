@@ -0,0 +1,69 @@
+from enum import IntEnum
+from typing import Callable, List, Optional, Sequence
+import numpy as np
+from src.domain.market.candle_columns import to_decimal
+from src.domain.market.ticker import Ticker
+from src.domain.strategy.trading_signal import TradingSignal, SignalType
+
+class SignalCode(IntEnum):
+    """봉별 신호 코드 (SignalSeries.codes의 값)"""
+    HOLD = 0
+    BUY = 1
+    SELL = 2
+
+SIGNAL_TYPES = {SignalCode.HOLD: SignalType.HOLD, SignalCode.BUY: SignalType.BUY, SignalCode.SELL: SignalType.SELL}
+SIGNAL_CODES = {signal_type: code for code, signal_type in SIGNAL_TYPES.items()}
+
+class SignalSeries:
+    """
+    차트 전체 구간의 매매 신호를 배열로 표현한 결과. (AssetEvaluator.evaluate_series)
+
+    - codes: 봉별 SignalCode (int8 배열)
+    - quantities: 봉별 수량 (float64 배열, NaN은 가능한 최대 수량(None)) 또는 None
+    - reason: 위치를 받아 신호 사유를 만드는 함수 (BUY/SELL 신호를 꺼낼 때만 호출)
+
+    TradingSignal은 signal_at(index)로 조회할 때만 생성하며, HOLD 신호는 하나의 객체를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        quantities: Optional[np.ndarray] = None,
+        reason: Optional[Callable[[int], str]] = None,
+        ticker: Optional[Ticker] = None,
+    ):
+        self.codes = np.asarray(codes, dtype=np.int8)
+        if quantities is not None and len(quantities) != len(self.codes):
+            raise ValueError("quantities must have the same length as codes")
+        self.quantities = None if quantities is None else np.asarray(quantities, dtype=np.float64)
+        self.reason = reason
+        self.ticker = ticker
+        self._hold = TradingSignal(type=SignalType.HOLD, ticker=ticker)
+        self._signals: Optional[List[TradingSignal]] = None
+
+    @classmethod
+    def from_signals(cls, signals: Sequence[TradingSignal]) -> 'SignalSeries':
+        """봉별 TradingSignal 목록을 그대로 보관하는 SignalSeries (기본 evaluate_series 구현용)"""
+        series = cls(np.array([SIGNAL_CODES[signal.type] for signal in signals], dtype=np.int8))
+        series._signals = list(signals)
+        return series
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def signal_at(self, index: int) -> TradingSignal:
+        """index 위치의 TradingSignal"""
+        if self._signals is not None:
+            return self._signals[index]
+        code = self.codes[index]
+        if code == SignalCode.HOLD:
+            return self._hold
+        quantity = None
+        if self.quantities is not None and not np.isnan(self.quantities[index]):
+            quantity = to_decimal(float(self.quantities[index]))
+        return TradingSignal(
+            type=SIGNAL_TYPES[SignalCode(code)],
+            ticker=self.ticker,
+            quantity=quantity,
+            reason=self.reason(index) if self.reason is not None else "",
+        )
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
 from datetime import date
 from src.domain.market.candle_chart import CandleChart
 from src.domain.strategy.trading_signal import TradingSignal
+from src.domain.shared.precision import Precision
 
 class Strategy(ABC):
     """
@@ -11,15 +12,23 @@ class Strategy(ABC):
     """
     
     @abstractmethod
-    def analyze(self, universe_data: Dict[str, CandleChart], current_date: date) -> Dict[str, TradingSignal]:
+    def analyze(self, universe_data: Mapping[str, CandleChart], current_date: date) -> Dict[str, TradingSignal]:
         """
         특정 시점(current_date)의 시장 데이터를 분석하여 종목별 신호를 반환합니다.
         
         Args:
-            universe_data: {ticker_code: chart} 형태의 전체 시장 데이터
+            universe_data: {ticker_code: chart} 형태의 전체 시장 데이터 (MarketUniverse 포함)
             current_date: 현재 분석 시점
             
         Returns:
             {ticker_code: signal} 형태의 종목별 매매 신호 맵
         """
         pass
+
+    def prepare(self, universe_data: Mapping[str, CandleChart], precision: Optional[Precision] = None) -> None:
+        """
+        시뮬레이션 시작 전에 전체 시장 데이터를 한 번 전달받습니다. (사전 계산용, 기본 구현은 아무것도 하지 않음)
+
+        Args:
+            precision: 이번 실행의 지표 계산 정밀도 (None이면 전략/평가기 자체 설정 유지)
+        """
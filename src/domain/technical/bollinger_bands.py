@@ -1,11 +1,15 @@
-from typing import List, Optional, Tuple
 from decimal import Decimal
-import math
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from pydantic import BaseModel, field_validator
-from src.domain.technical.indicator import Indicator
+from src.domain.technical.indicator import Indicator, to_money_list, decimal_closes, decimals_to_money_list
+from src.domain.technical.indicator_result import IndicatorResult
+from src.domain.technical.series import SeriesLike, as_series
+from src.domain.technical import kernels, panel, pipeline, reference
+from src.domain.technical.streaming import StreamingBollingerBands
 from src.domain.market.candle_chart import CandleChart
 from src.domain.shared.money import Money
-from src.domain.technical.moving_average import MovingAverage
+from src.domain.shared.precision import Precision
 
 class BollingerBands(BaseModel, Indicator):
     """
@@ -16,6 +20,7 @@ class BollingerBands(BaseModel, Indicator):
     """
     period: int = 20
     std_dev_multiplier: float = 2.0
+    precision: Precision = Precision.DECIMAL
     
     @field_validator('period')
     @classmethod
@@ -24,6 +29,51 @@ class BollingerBands(BaseModel, Indicator):
             raise ValueError("Period must be positive")
         return v
 
+    def compute(self, closes, mask: Optional[np.ndarray] = None) -> kernels.BollingerSeries:
+        """
+        종가 배열에 대한 밴드 배열 (upper, middle, lower, percent_b, bandwidth).
+        이동 평균/분산을 한 번의 O(n) 계산으로 구하며, 앞부분 period - 1개는 NaN.
+        종목 × 날짜 행렬을 넘기면 모든 종목을 한 번에 계산합니다. (panel.apply 참고)
+        """
+        return panel.apply(kernels.bollinger_series, closes, self.period, self.std_dev_multiplier, mask=mask)
+
+    def compute_decimal(self, closes: Sequence[Decimal]) -> Tuple[List[Optional[Decimal]], ...]:
+        """Decimal 참조 계산 (upper, middle, lower) (Precision.DECIMAL)"""
+        return reference.bollinger(closes, self.period, Decimal(repr(self.std_dev_multiplier)))
+
+    def outputs(self, source: pipeline.Node) -> Dict[str, pipeline.Node]:
+        """
+        파이프라인 노드 선언.
+        중단은 SMA(source, period) 노드이므로 같은 기간의 MovingAverage와 공유됩니다.
+        """
+        middle = pipeline.sma(source, self.period)
+        width = pipeline.rolling_std(source, self.period)
+        upper = pipeline.band(middle, width, self.std_dev_multiplier)
+        lower = pipeline.band(middle, width, -self.std_dev_multiplier)
+        return {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "percent_b": pipeline.percent_b(source, upper, lower),
+            "bandwidth": pipeline.bandwidth(upper, lower, middle),
+        }
+
+    def streaming(self) -> StreamingBollingerBands:
+        """캔들 하나당 O(1)로 갱신되는 스트리밍 상태 객체"""
+        return StreamingBollingerBands(self.period, self.std_dev_multiplier)
+
+    def apply(self, source: SeriesLike) -> IndicatorResult:
+        """
+        가격 계열(거래량, 다른 지표의 출력 포함)에 대한 볼린저 밴드 결과.
+        (upper / middle / lower / percent_b / bandwidth 열, 날짜 조회 가능)
+        """
+        series = as_series(source)
+        return IndicatorResult.from_series(series, **series.evaluate(self.compute)._asdict())
+
+    def calculate_columns(self, chart: CandleChart) -> IndicatorResult:
+        """볼린저 밴드를 열 기반 결과로 계산합니다. (apply(chart)와 같음)"""
+        return self.apply(chart)
+
     def calculate(self, chart: CandleChart) -> Tuple[List[Optional[Money]], List[Optional[Money]], List[Optional[Money]]]:
         """
         볼린저 밴드를 계산합니다.
@@ -31,39 +81,11 @@ class BollingerBands(BaseModel, Indicator):
         Returns:
             (Upper Band, Middle Band, Lower Band)의 튜플 반환.
             각 리스트는 캔들 차트와 동일한 길이이며, 계산 불가능한 앞부분은 None.
+            precision이 DECIMAL이면 Decimal로 정확히 계산합니다.
         """
-        candles = chart.candles
-        if len(candles) < self.period:
-            empty = [None] * len(candles)
-            return empty, empty, empty
-            
-        # 1. Middle Band (SMA) 계산
-        ma_indicator = MovingAverage(period=self.period)
-        middle_band = ma_indicator.calculate(chart)
-        
-        upper_band: List[Optional[Money]] = [None] * len(candles)
-        lower_band: List[Optional[Money]] = [None] * len(candles)
-        
-        # 2. Standard Deviation 및 Upper/Lower Band 계산
-        for i in range(self.period - 1, len(candles)):
-            # 현재 윈도우의 종가 리스트
-            # i번째 포함, 뒤로 period개
-            window_slice = candles[i - self.period + 1 : i + 1]
-            prices = [float(c.close_price.amount) for c in window_slice]
-            
-            # 평균 (Middle Band 값)
-            mean_val = float(middle_band[i].amount) # type: ignore (middle_band[i] is ensured to be not None by logic)
-            
-            # 표준편차 계산
-            variance = sum([pow(p - mean_val, 2) for p in prices]) / len(prices)
-            std_dev = math.sqrt(variance)
-            
-            # 밴드폭 계산
-            bandwidth = std_dev * self.std_dev_multiplier
-            
-            # 상단/하단 밴드 설정
-            currency = candles[i].close_price.currency
-            upper_band[i] = Money(amount=Decimal(mean_val + bandwidth), currency=currency)
-            lower_band[i] = Money(amount=Decimal(mean_val - bandwidth), currency=currency)
-            
-        return upper_band, middle_band, lower_band
+        if self.precision is Precision.DECIMAL:
+            bands = self.compute_decimal(decimal_closes(chart))
+            return tuple(decimals_to_money_list(band, chart.currency) for band in bands)
+        series = self.compute(chart.closes)
+        currency = chart.currency
+        return tuple(to_money_list(band, currency) for band in (series.upper, series.middle, series.lower))
@@ -0,0 +1,73 @@
+"""
+정밀도 모드 간 drift 검증.
+
+같은 차트에 대해 지표를 float64(compute)와 Decimal 참조(compute_decimal)로 각각 계산하여
+출력별 최대 절대/상대 오차를 보고합니다. 실제 데이터에서 float64 모드를 사용해도 되는지 확인하는 용도입니다.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+import numpy as np
+from src.domain.market.candle_chart import CandleChart
+from src.domain.technical.indicator import Indicator, decimal_closes, decimals_to_array
+
+class DriftReport(NamedTuple):
+    """지표 출력 하나의 float64 vs Decimal 오차"""
+    indicator: str
+    output: int                 # 출력 순서 (단일 출력이면 0, 볼린저 밴드는 upper=0, middle=1, lower=2)
+    compared: int               # 두 모드 모두 값이 있는 위치 수
+    max_abs_error: float
+    max_rel_error: float        # |float64 - decimal| / |decimal| (decimal이 0인 위치 제외)
+    warmup_mismatches: int      # 한쪽만 값이 있는 위치 수 (0이어야 정상)
+
+def _name(indicator: Indicator) -> str:
+    """보고용 지표 이름 (정밀도 필드 제외) 예: MACD(fast_period=12, slow_period=26, signal_period=9)"""
+    dump = getattr(indicator, "model_dump", None)
+    if not callable(dump):
+        return repr(indicator)
+    params = ", ".join(f"{key}={value}" for key, value in dump(exclude={"precision"}).items())
+    return f"{type(indicator).__name__}({params})"
+
+def _parts(values) -> Tuple:
+    return tuple(values) if isinstance(values, tuple) else (values,)
+
+def measure_drift(indicator: Indicator, chart: CandleChart) -> List[DriftReport]:
+    """
+    지표 하나의 출력별 drift를 계산합니다.
+    지표는 compute(closes)와 compute_decimal(decimal_closes)를 제공해야 합니다.
+    """
+    fast_parts = _parts(indicator.compute(chart.closes))
+    exact_parts = _parts(indicator.compute_decimal(decimal_closes(chart)))
+    name = _name(indicator)
+
+    reports = []
+    # compute가 추가 출력(예: 볼린저 밴드의 %B, 밴드폭)을 가지면 참조 계산이 있는 앞쪽 출력만 비교
+    for output, (fast, exact_values) in enumerate(zip(fast_parts, exact_parts)):
+        fast = np.asarray(fast, dtype=np.float64)
+        exact = decimals_to_array(exact_values)
+        fast_valid, exact_valid = ~np.isnan(fast), ~np.isnan(exact)
+        both = fast_valid & exact_valid
+        errors = np.abs(fast[both] - exact[both])
+        scale = np.abs(exact[both])
+        nonzero = scale > 0
+        reports.append(DriftReport(
+            indicator=name,
+            output=output,
+            compared=int(both.sum()),
+            max_abs_error=float(errors.max()) if errors.size else 0.0,
+            max_rel_error=float((errors[nonzero] / scale[nonzero]).max()) if nonzero.any() else 0.0,
+            warmup_mismatches=int((fast_valid != exact_valid).sum()),
+        ))
+    return reports
+
+def max_drift(indicators: Iterable[Indicator], charts: Iterable[CandleChart]) -> Dict[str, DriftReport]:
+    """
+    여러 차트에 대해 지표별로 가장 큰 상대 오차를 낸 출력의 보고를 반환합니다. {지표 이름: DriftReport}
+    """
+    indicators = list(indicators)
+    worst: Dict[str, DriftReport] = {}
+    for chart in charts:
+        for indicator in indicators:
+            for report in measure_drift(indicator, chart):
+                current = worst.get(report.indicator)
+                if current is None or (report.max_rel_error, report.warmup_mismatches) > (current.max_rel_error, current.warmup_mismatches):
+                    worst[report.indicator] = report
+    return worst
@@ -1,15 +1,20 @@
-from typing import List, Optional
-from pydantic import BaseModel, field_validator
 from decimal import Decimal
-from src.domain.technical.indicator import Indicator
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from pydantic import BaseModel, field_validator
+from src.domain.technical.indicator import Indicator, to_money_list, decimal_closes, decimals_to_money_list
+from src.domain.technical import kernels, panel, pipeline, reference
+from src.domain.technical.streaming import StreamingEMA
 from src.domain.market.candle_chart import CandleChart
 from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
 
 class EMA(BaseModel, Indicator):
     """
     EMA (Exponential Moving Average) 지수 이동평균 지표
     """
     period: int = 12
+    precision: Precision = Precision.DECIMAL
 
     @field_validator('period')
     @classmethod
@@ -18,33 +23,27 @@ class EMA(BaseModel, Indicator):
             raise ValueError("Period must be at least 1")
         return v
 
-    def calculate(self, chart: CandleChart) -> List[Optional[Money]]:
-        candles = chart.candles
-        if len(candles) < self.period:
-            return [None] * len(candles)
+    def compute(self, closes, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        종가 배열에 대한 EMA 배열.
+        초기값은 첫 period의 SMA (TradingView 등 많은 플랫폼의 관례), 이후 k = 2 / (N + 1).
+        종목 × 날짜 행렬을 넘기면 모든 종목을 한 번에 계산합니다. (panel.apply 참고)
+        """
+        return panel.apply(kernels.ema, closes, self.period, mask=mask)
 
-        results: List[Optional[Money]] = [None] * (self.period - 1)
-        
-        # 1. 초기값: 첫 period의 SMA로 시작하는 것이 일반적 관례
-        # (TradingView 등 많은 플랫폼이 이 방식을 따름)
-        initial_sum = sum((c.close_price.amount for c in candles[:self.period]), Decimal(0))
-        initial_sma = initial_sum / self.period
-        
-        currency = candles[0].close_price.currency
-        results.append(Money(amount=initial_sma, currency=currency))
+    def compute_decimal(self, closes: Sequence[Decimal]) -> List[Optional[Decimal]]:
+        """Decimal 참조 계산 (Precision.DECIMAL)"""
+        return reference.ema(closes, self.period)
 
-        # 2. EMA 계산
-        # Multiplier: k = 2 / (N + 1)
-        k = Decimal(2) / (self.period + 1)
+    def outputs(self, source: pipeline.Node) -> Dict[str, pipeline.Node]:
+        """파이프라인 노드 선언: EMA(source, period)"""
+        return {"value": pipeline.ema(source, self.period)}
 
-        prev_ema = initial_sma
-        
-        for i in range(self.period, len(candles)):
-            close = candles[i].close_price.amount
-            # EMA = (Close - Prev_EMA) * k + Prev_EMA
-            #     = Close * k + Prev_EMA * (1 - k)
-            current_ema = (close * k) + (prev_ema * (Decimal(1) - k))
-            results.append(Money(amount=current_ema, currency=currency))
-            prev_ema = current_ema
+    def streaming(self) -> StreamingEMA:
+        """캔들 하나당 O(1)로 갱신되는 스트리밍 상태 객체"""
+        return StreamingEMA(self.period)
 
-        return results
+    def calculate(self, chart: CandleChart) -> List[Optional[Money]]:
+        if self.precision is Precision.DECIMAL:
+            return decimals_to_money_list(self.compute_decimal(decimal_closes(chart)), chart.currency)
+        return to_money_list(self.apply(chart).values, chart.currency)
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
 from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_columns import to_decimal
+from src.domain.shared.money import Money, Currency
+from src.domain.technical.series import PriceSeries, SeriesLike, as_series
 
 class Indicator(ABC):
     """
@@ -19,3 +24,41 @@ class Indicator(ABC):
             계산된 지표 결과 (지표마다 반환 타입이 다를 수 있음)
         """
         pass
+
+    def apply(self, source: SeriesLike) -> Any:
+        """
+        가격 계열(차트 종가, PriceSeries, 배열, 다른 지표의 출력)에 지표를 적용합니다.
+        단일 출력 지표는 같은 날짜 축의 PriceSeries를 반환합니다. (다중 출력 지표는 IndicatorResult)
+        """
+        compute = getattr(self, "compute", None)
+        if compute is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support series input")
+        series = as_series(source)
+        return series.derive(series.evaluate(compute), name=type(self).__name__)
+
+    def outputs(self, source: Any) -> Dict[str, Any]:
+        """
+        파이프라인(FeatureSet)에서 사용할 출력 노드를 {출력 이름: Node}로 선언합니다.
+        출력이 하나인 지표는 "value" 키를 사용합니다.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not declare pipeline outputs")
+
+def to_float_list(values: np.ndarray) -> List[Optional[float]]:
+    """커널 결과 배열을 리스트로 변환합니다. (NaN → None)"""
+    return [None if value != value else value for value in values.tolist()]
+
+def to_money_list(values: np.ndarray, currency: Currency) -> List[Optional[Money]]:
+    """커널 결과 배열을 Money 리스트로 변환합니다. (NaN → None)"""
+    return [None if value != value else Money.trusted(to_decimal(value), currency) for value in values.tolist()]
+
+def decimal_closes(chart: CandleChart) -> List[Decimal]:
+    """차트 종가를 Decimal 리스트로 반환합니다. (Precision.DECIMAL 참조 계산의 입력)"""
+    return [to_decimal(value) for value in chart.closes.tolist()]
+
+def decimals_to_money_list(values: Sequence[Optional[Decimal]], currency: Currency) -> List[Optional[Money]]:
+    """참조 계산 결과를 Money 리스트로 변환합니다. (None 유지)"""
+    return [None if value is None else Money.trusted(value, currency) for value in values]
+
+def decimals_to_array(values: Sequence[Optional[Decimal]]) -> np.ndarray:
+    """참조 계산 결과를 float64 배열로 변환합니다. (None → NaN)"""
+    return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Tuple
+from src.domain.market.candle_chart import CandleChart
+from src.domain.technical.indicator import Indicator
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class IndicatorCache:
+    """
+    지표 계산 결과를 메모이제이션하는 LRU 캐시.
+
+    키: (차트 식별자, 차트 version, 지표 클래스, 지표 파라미터)
+    - 차트에 캔들이 추가되면 version이 바뀌므로 이전 결과는 자연히 사용되지 않고 LRU로 밀려납니다.
+    - id() 재사용으로 다른 차트와 혼동하지 않도록, 항목마다 차트 참조를 보관하고 조회 시 동일 객체인지 확인합니다.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[CandleChart, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def _parameters(indicator: Indicator) -> Hashable:
+        """지표 파라미터를 해시 가능한 튜플로 변환합니다. (pydantic 모델이면 필드 값, 아니면 객체 자체)"""
+        dump = getattr(indicator, "model_dump", None)
+        if callable(dump):
+            fields = dump()
+            if isinstance(fields, dict):
+                return tuple(sorted(fields.items()))
+        return indicator
+
+    def get_or_compute(self, chart: CandleChart, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        (chart, version, key)에 대한 결과를 반환합니다. 없으면 compute()로 계산하여 저장합니다.
+        """
+        cache_key = (id(chart), getattr(chart, "version", None), key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] is chart:
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        value = compute()
+
+        with self._lock:
+            self._entries[cache_key] = (chart, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def calculate(self, indicator: Indicator, chart: CandleChart) -> Any:
+        """indicator.calculate(chart)의 결과를 캐시를 통해 반환합니다."""
+        key = (type(indicator), self._parameters(indicator))
+        return self.get_or_compute(chart, key, lambda: indicator.calculate(chart))
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Union
+import numpy as np
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_columns import to_day_number
+from src.domain.technical.series import PriceSeries
+
+class IndicatorResult(Sequence):
+    """
+    다중 출력 지표의 열(column) 기반 결과.
+
+    - result.macd / result["macd"]: 출력별 읽기 전용 ndarray (warm-up은 NaN)
+    - result[i]: i번째 봉의 행 {출력 이름: float 또는 None} (기존 List[Dict] 결과와 호환)
+    - result[start:stop]: 복사 없이 구간을 참조하는 IndicatorResult
+    - result.at(date) / result.index_of(date): 날짜로 조회 (하루에 여러 봉이면 그날의 마지막 봉)
+    봉마다 dict를 미리 만들지 않으며, 행은 조회 시점에만 생성합니다.
+
+    유니버스 계열(종목 × 날짜)의 결과는 열이 2차원이며, 길이/인덱스/슬라이스는 마지막 축(날짜) 기준입니다.
+    이때 행의 값은 float 대신 그날의 종목별 값 배열(비어 있는 칸은 NaN)입니다.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        day_numbers: Optional[np.ndarray] = None,
+        mask: Optional[np.ndarray] = None,
+    ):
+        self._columns: Dict[str, np.ndarray] = {}
+        shape = None
+        for name, values in columns.items():
+            values = np.asarray(values, dtype=np.float64).view()
+            values.flags.writeable = False
+            if shape is not None and values.shape != shape:
+                raise ValueError("All columns must have the same shape")
+            shape = values.shape
+            self._columns[name] = values
+        self._size = shape[-1] if shape else 0
+        if day_numbers is not None and len(day_numbers) != self._size:
+            raise ValueError("day_numbers must have the same length as the columns")
+        self._days = day_numbers
+        self._mask = mask
+
+    @classmethod
+    def from_chart(cls, chart: CandleChart, **columns: np.ndarray) -> 'IndicatorResult':
+        """차트의 날짜 축을 사용하는 결과를 생성합니다."""
+        return cls(columns, day_numbers=chart.day_numbers)
+
+    @classmethod
+    def from_series(cls, series: PriceSeries, **columns: np.ndarray) -> 'IndicatorResult':
+        """입력 계열의 날짜 축(2차원이면 마스크 포함)을 사용하는 결과를 생성합니다."""
+        return cls(columns, day_numbers=series.day_numbers, mask=series.mask)
+
+    def series(self, name: str) -> PriceSeries:
+        """출력 하나를 다른 지표의 입력으로 쓸 수 있는 PriceSeries로 반환합니다. (복사 없음)"""
+        return PriceSeries(self._columns[name], self._days, mask=self._mask, name=name)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._columns)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        columns = self.__dict__.get("_columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(f"{type(self).__name__} has no column '{name}'")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key: Union[int, str, slice]):
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, slice):
+            days = None if self._days is None else self._days[key]
+            mask = None if self._mask is None else self._mask[..., key]
+            return IndicatorResult({name: values[..., key] for name, values in self._columns.items()}, days, mask)
+        return self._row(key)
+
+    def _row(self, index: int) -> Dict[str, Union[Optional[float], np.ndarray]]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("IndicatorResult index out of range")
+        row = {}
+        for name, values in self._columns.items():
+            if values.ndim > 1:
+                # 유니버스 결과: 그날의 종목별 값 (복사 없는 읽기 전용 뷰)
+                row[name] = values[..., index]
+                continue
+            value = float(values[index])
+            row[name] = None if value != value else value
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Optional[float]]]:
+        for i in range(self._size):
+            yield self._row(i)
+
+    def index_of(self, target_date: date) -> int:
+        """target_date의 (마지막) 봉 위치를 반환합니다. 없으면 -1"""
+        if self._days is None:
+            raise ValueError("This result has no date axis")
+        day = to_day_number(target_date)
+        index = int(np.searchsorted(self._days, day, side="right")) - 1
+        return index if index >= 0 and self._days[index] == day else -1
+
+    def at(self, target_date: date) -> Dict[str, Optional[float]]:
+        """
+        target_date의 행을 반환합니다.
+
+        Raises:
+            KeyError: 해당 날짜의 봉이 없는 경우
+        """
+        index = self.index_of(target_date)
+        if index == -1:
+            raise KeyError(f"No value for {target_date}")
+        return self._row(index)
+
+    def __repr__(self) -> str:
+        return f"IndicatorResult(columns={self.names}, length={self._size})"
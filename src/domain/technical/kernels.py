@@ -0,0 +1,170 @@
+"""
+배열 기반 지표 커널.
+
+모든 함수는 종가 등 float64 배열을 받아 같은 모양의 배열을 반환하며,
+계산이 불가능한 앞부분(warm-up)은 NaN으로 채웁니다.
+2차원 배열(종목 × 날짜)을 넘기면 마지막 축(시간)을 따라 모든 행을 한 번에 계산합니다.
+(상장 전/거래정지로 비어 있는 칸의 처리는 panel.apply를, 이동 최대/최소/분위수 등은 rolling 모듈을 사용합니다.)
+Indicator 클래스들의 calculate(chart)는 이 커널 위의 얇은 어댑터입니다.
+"""
+import warnings
+from typing import NamedTuple, Optional, Tuple
+import numpy as np
+from scipy.signal import lfilter
+
+def _as_float_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+def _nan_like(values: np.ndarray) -> np.ndarray:
+    return np.full(values.shape, np.nan, dtype=np.float64)
+
+def sma(values, period: int) -> np.ndarray:
+    """
+    단순 이동평균. rolling_mean_var와 같은 블록 중심화 방식으로 O(n)에 계산합니다.
+    (볼린저 밴드의 중단과 비트 단위로 같은 값이므로 파이프라인에서 두 지표가 같은 노드를 공유할 수 있습니다.)
+    """
+    return _rolling_moments(values, period, with_var=False)[0]
+
+def smoothed(values, period: int, alpha: float) -> np.ndarray:
+    """
+    첫 period개의 SMA를 초기값으로 하는 지수 평활.
+    y[t] = alpha * x[t] + (1 - alpha) * y[t-1] 를 lfilter(IIR 필터)로 한 번에 계산합니다.
+    """
+    values = _as_float_array(values)
+    result = _nan_like(values)
+    if values.shape[-1] < period:
+        return result
+    seed = values[..., :period].mean(axis=-1)
+    result[..., period - 1] = seed
+    if values.shape[-1] > period:
+        decay = 1.0 - alpha
+        zi = (decay * seed)[..., None]
+        result[..., period:], _ = lfilter([alpha], [1.0, -decay], values[..., period:], axis=-1, zi=zi)
+    return result
+
+def ema(values, period: int) -> np.ndarray:
+    """지수 이동평균 (k = 2 / (period + 1), 초기값은 첫 period개의 SMA)"""
+    return smoothed(values, period, 2.0 / (period + 1))
+
+def wilder(values, period: int) -> np.ndarray:
+    """Wilder 평활 (alpha = 1 / period, 초기값은 첫 period개의 SMA)"""
+    return smoothed(values, period, 1.0 / period)
+
+def rsi(closes, period: int) -> np.ndarray:
+    """
+    RSI (Wilder 평활).
+    첫 값은 index=period에서 산출되며, 평균 하락폭이 0이면 100, 평균 상승폭이 0이면 0입니다.
+    """
+    closes = _as_float_array(closes)
+    result = _nan_like(closes)
+    if closes.shape[-1] <= period:
+        return result
+    deltas = np.diff(closes, axis=-1)
+    avg_up = wilder(np.clip(deltas, 0.0, None), period)[..., period - 1:]
+    avg_down = wilder(np.clip(-deltas, 0.0, None), period)[..., period - 1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+    values[avg_up == 0] = 0.0
+    values[avg_down == 0] = 100.0
+    result[..., period:] = values
+    return result
+
+def rolling_mean_var(values, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    이동 평균과 모분산(ddof=0)을 한 번에 O(n)으로 계산합니다.
+
+    전체 누적합 방식은 값의 크기에 비해 분산이 작을 때 상쇄 오차가 커지므로,
+    배열을 period 길이 블록으로 나누고 각 윈도우를 (직전 블록 접미 합 + 현재 블록 접두 합)으로 구합니다.
+    이때 값은 직전 블록 평균을 기준점으로 중심화하므로 누적 길이와 상쇄 오차가 모두 윈도우 크기 수준으로 제한됩니다.
+    NaN은 해당 NaN을 포함하는 윈도우에만 전파됩니다.
+    """
+    return _rolling_moments(values, period, with_var=True)
+
+def _rolling_moments(values, period: int, with_var: bool) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """rolling_mean_var 구현. with_var=False이면 제곱합을 생략하고 (평균, None)을 반환합니다."""
+    values = _as_float_array(values)
+    lead, n = values.shape[:-1], values.shape[-1]
+    mean = _nan_like(values)
+    if n < period:
+        return mean, (_nan_like(values) if with_var else None)
+
+    # (..., 블록 수, period) 모양으로 재배치 (끝은 0으로 채움)
+    blocks_count = -(-n // period)
+    blocks = np.zeros(lead + (blocks_count * period,), dtype=np.float64)
+    blocks[..., :n] = values
+    blocks = blocks.reshape(lead + (blocks_count, period))
+
+    # 기준점: 직전 블록 평균 (첫 블록은 자기 평균)
+    block_means = blocks.mean(axis=-1)
+    if np.isnan(block_means).any():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            block_means = np.nanmean(blocks, axis=-1)
+        block_means[np.isnan(block_means)] = 0.0
+    anchors = np.concatenate((block_means[..., :1], block_means[..., :-1]), axis=-1)[..., None]
+    previous = np.concatenate((blocks[..., :1, :], blocks[..., :-1, :]), axis=-2)
+
+    current = blocks - anchors
+    prefix_sum = np.cumsum(current, axis=-1)
+
+    # 직전 블록의 (r+1)번째 이후 합 (r = 블록 내 위치)
+    before = previous - anchors
+    suffix_sum = np.zeros_like(before)
+    suffix_sum[..., :-1] = np.cumsum(before[..., ::-1], axis=-1)[..., ::-1][..., 1:]
+
+    flat = lead + (blocks_count * period,)
+    centered_mean = ((prefix_sum + suffix_sum) / period).reshape(flat)[..., :n]
+    window_anchors = np.broadcast_to(anchors, blocks.shape).reshape(flat)[..., :n]
+    mean[..., period - 1:] = (window_anchors + centered_mean)[..., period - 1:]
+    if not with_var:
+        return mean, None
+
+    prefix_sq = np.cumsum(current * current, axis=-1)
+    suffix_sq = np.zeros_like(before)
+    suffix_sq[..., :-1] = np.cumsum((before * before)[..., ::-1], axis=-1)[..., ::-1][..., 1:]
+    centered_sq = ((prefix_sq + suffix_sq) / period).reshape(flat)[..., :n]
+    var = _nan_like(values)
+    var[..., period - 1:] = np.maximum(centered_sq - centered_mean * centered_mean, 0.0)[..., period - 1:]
+    return mean, var
+
+def rolling_std(values, period: int) -> np.ndarray:
+    """모표준편차(ddof=0) 이동 윈도우"""
+    return np.sqrt(rolling_mean_var(values, period)[1])
+
+class BollingerSeries(NamedTuple):
+    """볼린저 밴드 계산 결과 (모두 종가와 같은 길이, warm-up은 NaN)"""
+    upper: np.ndarray
+    middle: np.ndarray
+    lower: np.ndarray
+    percent_b: np.ndarray   # (종가 - 하단) / (상단 - 하단), 밴드폭이 0이면 NaN
+    bandwidth: np.ndarray   # (상단 - 하단) / 중단, 중단이 0이면 NaN
+
+def bollinger_series(closes, period: int, multiplier: float) -> BollingerSeries:
+    """이동 평균/분산 한 번의 계산으로 밴드와 %B, 밴드폭을 함께 구합니다."""
+    closes = _as_float_array(closes)
+    middle, var = rolling_mean_var(closes, period)
+    width = np.sqrt(var) * multiplier
+    upper, lower = middle + width, middle - width
+    spread = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = np.where(spread > 0, (closes - lower) / spread, np.nan)
+        bandwidth = np.where(middle != 0, spread / middle, np.nan)
+    return BollingerSeries(upper, middle, lower, percent_b, bandwidth)
+
+def bollinger(closes, period: int, multiplier: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """볼린저 밴드 (upper, middle, lower). middle은 SMA, 밴드폭은 multiplier × 모표준편차."""
+    upper, middle, lower, _, _ = bollinger_series(closes, period, multiplier)
+    return upper, middle, lower
+
+def macd(closes, fast_period: int, slow_period: int, signal_period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD (macd, signal, histogram).
+    signal은 MACD 선의 유효 구간(slow_period - 1 이후)에 대한 EMA입니다.
+    """
+    closes = _as_float_array(closes)
+    macd_line = ema(closes, fast_period) - ema(closes, slow_period)
+    signal = _nan_like(closes)
+    start = slow_period - 1
+    if closes.shape[-1] > start:
+        signal[..., start:] = ema(macd_line[..., start:], signal_period)
+    return macd_line, signal, macd_line - signal
@@ -1,8 +1,14 @@
-from typing import List, Dict, Optional
-from pydantic import BaseModel, model_validator, PrivateAttr
-from src.domain.technical.indicator import Indicator
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from pydantic import BaseModel, model_validator
+from src.domain.technical.indicator import Indicator, decimal_closes, decimals_to_array
+from src.domain.technical.indicator_result import IndicatorResult
+from src.domain.technical.series import SeriesLike, as_series
+from src.domain.technical import kernels, panel, pipeline, reference
+from src.domain.technical.streaming import StreamingMACD
 from src.domain.market.candle_chart import CandleChart
-from src.domain.technical.ema import EMA
+from src.domain.shared.precision import Precision
 
 class MACD(BaseModel, Indicator):
     """
@@ -12,13 +18,7 @@ class MACD(BaseModel, Indicator):
     fast_period: int = 12
     slow_period: int = 26
     signal_period: int = 9
-
-    _fast_ema: EMA = PrivateAttr()
-    _slow_ema: EMA = PrivateAttr()
-
-    def model_post_init(self, __context):
-        self._fast_ema = EMA(period=self.fast_period)
-        self._slow_ema = EMA(period=self.slow_period)
+    precision: Precision = Precision.DECIMAL
 
     @model_validator(mode='after')
     def validate_periods(self):
@@ -26,106 +26,49 @@ class MACD(BaseModel, Indicator):
             raise ValueError("Fast period must be less than slow period")
         return self
 
-    def calculate(self, chart: CandleChart) -> List[Dict[str, Optional[float]]]:
+    def compute(self, closes, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        MACD, Signal, Histogram을 계산합니다.
-        
-        Returns:
-            List[Dict]: [{'macd': float, 'signal': float, 'histogram': float}, ...]
+        종가 배열에 대한 (MACD, Signal, Histogram) 배열.
+        Signal은 MACD 선이 유효해진 시점부터의 EMA이며, 계산 불가능한 구간은 NaN.
+        종목 × 날짜 행렬을 넘기면 모든 종목을 한 번에 계산합니다. (panel.apply 참고)
         """
-        candles = chart.candles
-        if len(candles) < self.slow_period:
-            # 적어도 slow_period만큼은 있어야 MACD가 나옴
-            return [{'macd': None, 'signal': None, 'histogram': None}] * len(candles)
+        return panel.apply(kernels.macd, closes, self.fast_period, self.slow_period, self.signal_period, mask=mask)
 
-        # 1. Fast, Slow EMA 계산
-        fast_values = self._fast_ema.calculate(chart)
-        slow_values = self._slow_ema.calculate(chart)
-        
-        results: List[Dict[str, Optional[float]]] = []
-        macd_line_values = []
+    def compute_decimal(self, closes: Sequence[Decimal]) -> Tuple[List[Optional[Decimal]], ...]:
+        """Decimal 참조 계산 (macd, signal, histogram) (Precision.DECIMAL)"""
+        return reference.macd(closes, self.fast_period, self.slow_period, self.signal_period)
 
-        # MACD Line 계산
-        for i in range(len(candles)):
-            f_val = fast_values[i]
-            s_val = slow_values[i]
-            
-            current_result = {'macd': None, 'signal': None, 'histogram': None}
-            
-            if f_val is None or s_val is None:
-                macd_line_values.append(None)
-            else:
-                macd_val = float(f_val.amount - s_val.amount)
-                current_result['macd'] = macd_val
-                macd_line_values.append(macd_val)
-            
-            results.append(current_result)
+    def apply(self, source: SeriesLike) -> IndicatorResult:
+        """가격 계열(다른 지표의 출력 포함)에 대한 macd / signal / histogram 결과"""
+        series = as_series(source)
+        macd_line, signal, histogram = series.evaluate(self.compute)
+        return IndicatorResult.from_series(series, macd=macd_line, signal=signal, histogram=histogram)
 
-        # 2. Signal Line 계산 (MACD Line의 EMA)
-        # EMA 클래스는 CandleChart를 입력으로 받지만, 여기서는 숫자 리스트(macd_line)를 입력으로 받아야 함.
-        # EMA 클래스를 재사용하기 어렵다면 (CandleChart 의존성 때문에), EMA 로직을 분리하거나 직접 계산해야 함.
-        # 여기서는 내부적으로 간단한 EMA 로직을 구현하여 사용 (Signal Line용)
-        
-        signal_line_values = self._calculate_signal_ema(macd_line_values, self.signal_period)
-        
-        # 3. Histogram 및 최종 결과 병합
-        for i in range(len(candles)):
-            macd_val = macd_line_values[i]
-            signal_val = signal_line_values[i]
-            
-            if macd_val is not None and signal_val is not None:
-                results[i]['macd'] = macd_val
-                results[i]['signal'] = signal_val
-                results[i]['histogram'] = macd_val - signal_val
-            else:
-                # macd만 있고 signal이 없는 구간 (초기 signal_period 동안)
-                if macd_val is not None:
-                     results[i]['macd'] = macd_val
-    
-        return results
-
-    def _calculate_signal_ema(self, values: List[Optional[float]], period: int) -> List[Optional[float]]:
-        # None이 섞여있는 리스트의 EMA 계산
-        # 유효한 값이 period개 모인 시점부터 SMA -> EMA 전환
-        
-        results = [None] * len(values)
-        valid_values = []
-        first_valid_idx = -1
-        
-        for i, val in enumerate(values):
-            if val is not None:
-                if first_valid_idx == -1:
-                    first_valid_idx = i
-                valid_values.append(val)
-        
-        if len(valid_values) < period:
-            return results
+    def outputs(self, source: pipeline.Node) -> Dict[str, pipeline.Node]:
+        """
+        파이프라인 노드 선언.
+        fast/slow EMA는 EMA(source, period) 노드이므로 같은 기간의 EMA 지표와 공유됩니다.
+        """
+        line = pipeline.sub(pipeline.ema(source, self.fast_period), pipeline.ema(source, self.slow_period))
+        signal = pipeline.ema(line, self.signal_period)
+        return {"macd": line, "signal": signal, "histogram": pipeline.sub(line, signal)}
 
-        # period만큼의 초기 데이터로 SMA 계산
-        initial_sma = sum(valid_values[:period]) / period
-        
-        # results에 SMA 값 할당 (index = first_valid_idx + period - 1)
-        start_cal_idx = first_valid_idx + period - 1
-        results[start_cal_idx] = initial_sma
+    def streaming(self) -> StreamingMACD:
+        """캔들 하나당 O(1)로 갱신되는 스트리밍 상태 객체"""
+        return StreamingMACD(self.fast_period, self.slow_period, self.signal_period)
 
-        # EMA 계산
-        k = 2.0 / (period + 1.0)
-        prev_ema = initial_sma
-        
-        # valid_values의 period 이후부터 순회
-        # 매핑되는 원본 인덱스를 잘 찾아야 함
-        
-        # 이미 계산된 initial_sma 다음부터
-        current_valid_idx = period 
+    def calculate(self, chart: CandleChart) -> IndicatorResult:
+        """
+        MACD, Signal, Histogram을 계산합니다.
         
-        for i in range(start_cal_idx + 1, len(values)):
-             val = values[i]
-             if val is None:
-                 continue
-                 
-             # EMA = (Close - Prev) * k + Prev
-             ema = (val * k) + (prev_ema * (1 - k))
-             results[i] = ema
-             prev_ema = ema
-
-        return results
+        Returns:
+            IndicatorResult: macd / signal / histogram 열(ndarray)을 가진 결과.
+                             result[i]는 {'macd': float, 'signal': float, 'histogram': float} 행 (계산 불가 값은 None)
+                             precision이 DECIMAL이면 MACD/Signal을 Decimal로 계산한 뒤 float64로 변환하고,
+                             Histogram은 변환된 두 값의 차이입니다. (행의 macd - signal과 정확히 일치)
+        """
+        if self.precision is not Precision.DECIMAL:
+            return self.apply(chart)
+        macd_line, signal, _ = self.compute_decimal(decimal_closes(chart))
+        macd_line, signal = decimals_to_array(macd_line), decimals_to_array(signal)
+        return IndicatorResult.from_chart(chart, macd=macd_line, signal=signal, histogram=macd_line - signal)
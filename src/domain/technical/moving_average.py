@@ -1,9 +1,13 @@
-from typing import List, Optional
-from pydantic import BaseModel, field_validator
 from decimal import Decimal
-from src.domain.technical.indicator import Indicator
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from pydantic import BaseModel, field_validator
+from src.domain.technical.indicator import Indicator, to_money_list, decimal_closes, decimals_to_money_list
+from src.domain.technical import kernels, panel, pipeline, reference
+from src.domain.technical.streaming import StreamingSMA
 from src.domain.market.candle_chart import CandleChart
 from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
 
 class MovingAverage(BaseModel, Indicator):
     """
@@ -11,6 +15,7 @@ class MovingAverage(BaseModel, Indicator):
     종가(Close Price)를 기준으로 계산합니다.
     """
     period: int
+    precision: Precision = Precision.DECIMAL
 
     @field_validator('period')
     @classmethod
@@ -19,6 +24,25 @@ class MovingAverage(BaseModel, Indicator):
             raise ValueError("Period must be positive")
         return v
 
+    def compute(self, closes, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        종가 배열에 대한 SMA 배열 (앞부분 period - 1개는 NaN).
+        종목 × 날짜 행렬을 넘기면 모든 종목을 한 번에 계산합니다. (panel.apply 참고)
+        """
+        return panel.apply(kernels.sma, closes, self.period, mask=mask)
+
+    def compute_decimal(self, closes: Sequence[Decimal]) -> List[Optional[Decimal]]:
+        """Decimal 참조 계산 (Precision.DECIMAL)"""
+        return reference.sma(closes, self.period)
+
+    def outputs(self, source: pipeline.Node) -> Dict[str, pipeline.Node]:
+        """파이프라인 노드 선언: SMA(source, period)"""
+        return {"value": pipeline.sma(source, self.period)}
+
+    def streaming(self) -> StreamingSMA:
+        """캔들 하나당 O(1)로 갱신되는 스트리밍 상태 객체"""
+        return StreamingSMA(self.period)
+
     def calculate(self, chart: CandleChart) -> List[Optional[Money]]:
         """
         이동평균을 계산하여 리스트로 반환합니다.
@@ -27,29 +51,8 @@ class MovingAverage(BaseModel, Indicator):
         Returns:
             List[Optional[Money]]: 이동평균 값들의 리스트. 
                                  인덱스는 캔들 차트의 인덱스와 1:1로 대응됩니다.
+                                 precision이 DECIMAL이면 Decimal로 정확히 계산합니다.
         """
-        candles = chart.candles
-        if len(candles) < self.period:
-            return [None] * len(candles)
-
-        results: List[Optional[Money]] = [None] * (self.period - 1)
-        
-        # 첫 번째 윈도우 합계 계산
-        current_sum = Decimal(0)
-        for i in range(self.period):
-            current_sum += candles[i].close_price.amount
-            
-        # 첫 번째 평균 추가
-        currency = candles[0].close_price.currency
-        results.append(Money(amount=current_sum / self.period, currency=currency))
-
-        # 슬라이딩 윈도우로 나머지 계산
-        for i in range(self.period, len(candles)):
-            # 윈도우에서 빠지는 값(가장 오래된 값) 빼고, 들어오는 값(현재 값) 더하기
-            remove_idx = i - self.period
-            current_sum -= candles[remove_idx].close_price.amount
-            current_sum += candles[i].close_price.amount
-            
-            results.append(Money(amount=current_sum / self.period, currency=currency))
-
-        return results
+        if self.precision is Precision.DECIMAL:
+            return decimals_to_money_list(self.compute_decimal(decimal_closes(chart)), chart.currency)
+        return to_money_list(self.apply(chart).values, chart.currency)
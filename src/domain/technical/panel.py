@@ -0,0 +1,54 @@
+"""
+종목 × 날짜 행렬(패널)에 대한 지표 계산.
+
+MarketUniverse의 가격 행렬처럼 상장 전/거래정지 칸이 NaN(또는 mask=False)인 행렬에서,
+각 종목의 유효한 값만 왼쪽으로 모아(compact) 커널을 한 번에 적용한 뒤 원래 위치로 되돌립니다(expand).
+따라서 결과는 종목별 차트에 지표를 따로 계산한 것과 같고, 비어 있는 칸은 NaN입니다.
+"""
+from typing import Any, Callable, Optional, Tuple
+import numpy as np
+
+def compact(matrix: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    각 행의 유효한 값을 순서를 유지한 채 왼쪽으로 모읍니다. (나머지는 NaN)
+
+    Returns:
+        (compacted, order): order는 expand에 사용할 행별 원래 열 위치
+    """
+    order = np.argsort(~mask, axis=1, kind="stable")
+    compacted = np.take_along_axis(matrix, order, axis=1)
+    counts = mask.sum(axis=1)
+    compacted[np.arange(matrix.shape[1]) >= counts[:, None]] = np.nan
+    return compacted, order
+
+def expand(compacted: np.ndarray, order: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """compact로 모은 결과를 원래 열 위치로 되돌립니다. (비어 있던 칸은 NaN)"""
+    result = np.empty(compacted.shape, dtype=np.float64)
+    np.put_along_axis(result, order, compacted, axis=1)
+    result[~mask] = np.nan
+    return result
+
+def apply(kernel: Callable[..., Any], values, *args, mask: Optional[np.ndarray] = None) -> Any:
+    """
+    커널을 1차원 배열 또는 종목 × 날짜 행렬에 적용합니다.
+
+    Args:
+        kernel: kernels 모듈의 함수 (배열 또는 배열 튜플/NamedTuple 반환)
+        values: 1차원 종가 배열 또는 2차원 (종목 × 날짜) 행렬
+        mask: 2차원일 때 유효 칸 (None이면 NaN이 아닌 칸)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return kernel(values, *args)
+
+    valid = ~np.isnan(values) if mask is None else np.asarray(mask, dtype=bool)
+    if valid.all():
+        # 모든 칸이 채워져 있으면 재배치 없이 그대로 계산
+        return kernel(values, *args)
+
+    compacted, order = compact(values, valid)
+    result = kernel(compacted, *args)
+    if isinstance(result, tuple):
+        expanded = [expand(part, order, valid) for part in result]
+        return result._make(expanded) if hasattr(result, "_make") else tuple(expanded)
+    return expand(result, order, valid)
@@ -0,0 +1,191 @@
+"""
+선언형 지표 파이프라인 (Feature Set).
+
+지표는 계산 그래프의 노드(Node)로 자신의 의존 관계를 선언합니다.
+노드는 (연산, 입력 노드, 파라미터)로 식별되는 값 객체이므로, 같은 입력과 파라미터를 가진 노드는
+여러 지표가 요청해도 같은 노드가 되어 한 번만 계산됩니다.
+(예: MACD(12, 26, 9)와 EMA(12)의 EMA(12), BollingerBands(20)와 MovingAverage(20)의 SMA(20))
+
+FeatureSet은 등록된 모든 출력 노드를 위상 정렬하여 차트(1차원) 또는 유니버스 행렬(종목 × 날짜)에 대해 평가합니다.
+"""
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.technical import kernels, panel
+
+class Node(NamedTuple):
+    """계산 그래프의 노드 (연산 이름, 입력 노드들, 파라미터)"""
+    op: str
+    inputs: Tuple['Node', ...] = ()
+    params: Tuple = ()
+
+    @staticmethod
+    def source(field: str = "close") -> 'Node':
+        """입력 가격 계열 (open / high / low / close)"""
+        if field not in SOURCE_FIELDS:
+            raise ValueError(f"Unknown source field: {field}")
+        return Node("source", (), (field,))
+
+# 소스 이름 → 차트/유니버스 속성 이름
+SOURCE_FIELDS: Dict[str, str] = {"open": "opens", "high": "highs", "low": "lows", "close": "closes"}
+
+def sma(x: Node, period: int) -> Node:
+    return Node("sma", (x,), (period,))
+
+def ema(x: Node, period: int) -> Node:
+    """입력의 첫 유효값부터 시작하는 EMA (앞부분이 NaN인 파생 계열에도 사용 가능)"""
+    return Node("ema", (x,), (period,))
+
+def rolling_std(x: Node, period: int) -> Node:
+    return Node("rolling_std", (x,), (period,))
+
+def rsi(x: Node, period: int) -> Node:
+    return Node("rsi", (x,), (period,))
+
+def sub(a: Node, b: Node) -> Node:
+    return Node("sub", (a, b))
+
+def band(center: Node, width: Node, multiplier: float) -> Node:
+    """center + multiplier × width"""
+    return Node("band", (center, width), (float(multiplier),))
+
+def percent_b(x: Node, upper: Node, lower: Node) -> Node:
+    return Node("percent_b", (x, upper, lower))
+
+def bandwidth(upper: Node, lower: Node, middle: Node) -> Node:
+    return Node("bandwidth", (upper, lower, middle))
+
+def _from_first_valid(kernel: Callable[..., np.ndarray], values: np.ndarray, *args) -> np.ndarray:
+    """마지막 축에서 처음으로 유효한 값이 나오는 위치부터 커널을 적용합니다."""
+    valid_columns = ~np.isnan(values)
+    if values.ndim > 1:
+        valid_columns = valid_columns.any(axis=tuple(range(values.ndim - 1)))
+    result = np.full(values.shape, np.nan)
+    if valid_columns.any():
+        start = int(np.argmax(valid_columns))
+        result[..., start:] = kernel(values[..., start:], *args)
+    return result
+
+def _percent_b(x: np.ndarray, upper: np.ndarray, lower: np.ndarray) -> np.ndarray:
+    spread = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(spread > 0, (x - lower) / spread, np.nan)
+
+def _bandwidth(upper: np.ndarray, lower: np.ndarray, middle: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(middle != 0, (upper - lower) / middle, np.nan)
+
+# 연산 이름 → (입력 배열들, *파라미터) -> 배열
+OPERATIONS: Dict[str, Callable[..., np.ndarray]] = {
+    "sma": kernels.sma,
+    "ema": lambda x, period: _from_first_valid(kernels.ema, x, period),
+    "rolling_std": kernels.rolling_std,
+    "rsi": kernels.rsi,
+    "sub": np.subtract,
+    "band": lambda center, width, multiplier: center + multiplier * width,
+    "percent_b": _percent_b,
+    "bandwidth": _bandwidth,
+}
+
+class FeatureSet:
+    """
+    여러 지표의 출력을 이름으로 등록하고, 공유 노드를 한 번만 계산하여 평가하는 파이프라인.
+
+    사용 예:
+        features = FeatureSet()
+        features.add("macd", MACD())            # "macd.macd", "macd.signal", "macd.histogram"
+        features.add("ema12", EMA(period=12))   # "ema12"
+        values = features.evaluate_chart(chart)
+    """
+
+    def __init__(self, source: Optional[Node] = None):
+        self.source = source or Node.source("close")
+        self._outputs: Dict[str, Node] = {}
+
+    def add(self, name: str, indicator) -> 'FeatureSet':
+        """
+        지표를 등록합니다. 지표의 outputs(source)가 선언한 출력 노드들을 이름으로 등록하며,
+        출력이 하나("value")이면 name, 여럿이면 "name.출력이름"으로 등록합니다.
+        """
+        outputs = indicator.outputs(self.source)
+        if set(outputs) == {"value"}:
+            self.add_node(name, outputs["value"])
+        else:
+            for key, node in outputs.items():
+                self.add_node(f"{name}.{key}", node)
+        return self
+
+    def add_node(self, name: str, node: Node) -> 'FeatureSet':
+        if name in self._outputs:
+            raise ValueError(f"Feature already registered: {name}")
+        self._outputs[name] = node
+        return self
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._outputs)
+
+    def plan(self) -> List[Node]:
+        """평가 순서 (중복이 제거된 노드들의 위상 정렬)"""
+        order: List[Node] = []
+        visited = set()
+
+        def visit(node: Node):
+            if node in visited:
+                return
+            visited.add(node)
+            for child in node.inputs:
+                visit(child)
+            order.append(node)
+
+        for node in self._outputs.values():
+            visit(node)
+        return order
+
+    def evaluate(self, sources: Dict[str, np.ndarray], mask: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        소스 배열로 모든 출력을 계산합니다.
+
+        Args:
+            sources: {"close": 배열, ...} 1차원 또는 (종목 × 날짜) 행렬
+            mask: 행렬일 때 유효 칸 (None이면 종가가 NaN이 아닌 칸)
+        """
+        arrays = {field: np.asarray(values, dtype=np.float64) for field, values in sources.items()}
+        order = valid = None
+        reference = next(iter(arrays.values()), None)
+        if reference is not None and reference.ndim == 2:
+            valid = ~np.isnan(arrays.get("close", reference)) if mask is None else np.asarray(mask, dtype=bool)
+            if not valid.all():
+                # 종목별 유효 값을 왼쪽으로 모아 한 번에 계산한 뒤 출력만 원래 위치로 되돌림
+                compacted = {}
+                for field, values in arrays.items():
+                    compacted[field], order = panel.compact(values, valid)
+                arrays = compacted
+
+        values: Dict[Node, np.ndarray] = {}
+        for node in self.plan():
+            if node.op == "source":
+                field = node.params[0]
+                if field not in arrays:
+                    raise KeyError(f"Source not provided: {field}")
+                values[node] = arrays[field]
+            else:
+                values[node] = OPERATIONS[node.op](*(values[child] for child in node.inputs), *node.params)
+
+        results = {name: values[node] for name, node in self._outputs.items()}
+        if order is not None:
+            results = {name: panel.expand(result, order, valid) for name, result in results.items()}
+        return results
+
+    def _fields(self) -> List[str]:
+        return sorted({node.params[0] for node in self.plan() if node.op == "source"})
+
+    def evaluate_chart(self, chart: CandleChart) -> Dict[str, np.ndarray]:
+        """차트 하나에 대해 평가합니다. (각 출력은 차트 길이의 1차원 배열)"""
+        return self.evaluate({field: getattr(chart, SOURCE_FIELDS[field]) for field in self._fields()})
+
+    def evaluate_universe(self, universe: MarketUniverse) -> Dict[str, np.ndarray]:
+        """유니버스 전체에 대해 평가합니다. (각 출력은 종목 × 날짜 행렬, 비어 있는 칸은 NaN)"""
+        sources = {field: getattr(universe, SOURCE_FIELDS[field]) for field in self._fields()}
+        return self.evaluate(sources, mask=universe.mask)
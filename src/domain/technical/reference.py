@@ -0,0 +1,92 @@
+"""
+Decimal 참조(reference) 지표 계산.
+
+kernels 모듈과 같은 정의를 Decimal로 계산합니다. (Precision.DECIMAL 모드 및 float64 drift 검증용)
+입력은 Decimal 가격 시퀀스이며, 결과는 같은 길이의 리스트로 계산 불가능한 앞부분(warm-up)은 None입니다.
+한 번에 한 종목(1차원)만 계산하며 속도보다 정확성을 우선합니다.
+"""
+from decimal import Decimal
+from typing import List, Optional, Sequence, Tuple
+
+DecimalSeries = List[Optional[Decimal]]
+
+def sma(values: Sequence[Decimal], period: int) -> DecimalSeries:
+    """단순 이동평균 (윈도우 합은 Decimal 덧셈/뺄셈으로 정확히 유지)"""
+    n = len(values)
+    result: DecimalSeries = [None] * n
+    if n < period:
+        return result
+    window = sum(values[:period], Decimal(0))
+    result[period - 1] = window / period
+    for i in range(period, n):
+        window += values[i] - values[i - period]
+        result[i] = window / period
+    return result
+
+def smoothed(values: Sequence[Decimal], period: int, alpha: Decimal) -> DecimalSeries:
+    """첫 period개의 SMA를 초기값으로 하는 지수 평활 y[t] = alpha * x[t] + (1 - alpha) * y[t-1]"""
+    n = len(values)
+    result: DecimalSeries = [None] * n
+    if n < period:
+        return result
+    current = sum(values[:period], Decimal(0)) / period
+    result[period - 1] = current
+    decay = 1 - alpha
+    for i in range(period, n):
+        current = alpha * values[i] + decay * current
+        result[i] = current
+    return result
+
+def ema(values: Sequence[Decimal], period: int) -> DecimalSeries:
+    """지수 이동평균 (k = 2 / (period + 1))"""
+    return smoothed(values, period, Decimal(2) / (period + 1))
+
+def wilder(values: Sequence[Decimal], period: int) -> DecimalSeries:
+    """Wilder 평활 (alpha = 1 / period)"""
+    return smoothed(values, period, Decimal(1) / period)
+
+def rsi(closes: Sequence[Decimal], period: int) -> DecimalSeries:
+    """RSI (Wilder 평활). 평균 하락폭이 0이면 100, 평균 상승폭이 0이면 0"""
+    n = len(closes)
+    result: DecimalSeries = [None] * n
+    if n <= period:
+        return result
+    deltas = [closes[i] - closes[i - 1] for i in range(1, n)]
+    zero = Decimal(0)
+    avg_up = wilder([max(delta, zero) for delta in deltas], period)
+    avg_down = wilder([max(-delta, zero) for delta in deltas], period)
+    for i in range(period, n):
+        up, down = avg_up[i - 1], avg_down[i - 1]
+        if down == 0:
+            result[i] = Decimal(100)
+        elif up == 0:
+            result[i] = zero
+        else:
+            result[i] = 100 - 100 / (1 + up / down)
+    return result
+
+def bollinger(closes: Sequence[Decimal], period: int, multiplier: Decimal) -> Tuple[DecimalSeries, DecimalSeries, DecimalSeries]:
+    """볼린저 밴드 (upper, middle, lower). 분산은 윈도우마다 평균 편차 제곱합으로 직접 계산 (ddof=0)"""
+    n = len(closes)
+    upper: DecimalSeries = [None] * n
+    lower: DecimalSeries = [None] * n
+    middle = sma(closes, period)
+    for i in range(period - 1, n):
+        mean = middle[i]
+        variance = sum(((value - mean) ** 2 for value in closes[i - period + 1:i + 1]), Decimal(0)) / period
+        width = variance.sqrt() * multiplier
+        upper[i] = mean + width
+        lower[i] = mean - width
+    return upper, middle, lower
+
+def macd(closes: Sequence[Decimal], fast_period: int, slow_period: int, signal_period: int) -> Tuple[DecimalSeries, DecimalSeries, DecimalSeries]:
+    """MACD (macd, signal, histogram). signal은 MACD 선의 유효 구간에 대한 EMA"""
+    n = len(closes)
+    fast, slow = ema(closes, fast_period), ema(closes, slow_period)
+    line: DecimalSeries = [None if f is None or s is None else f - s for f, s in zip(fast, slow)]
+    signal: DecimalSeries = [None] * n
+    start = slow_period - 1
+    if n > start:
+        signal[start:] = ema(line[start:], signal_period)
+    histogram: DecimalSeries = [None if m is None or s is None else m - s for m, s in zip(line, signal)]
+    return line, signal, histogram
@@ -0,0 +1,131 @@
+"""
+이동 윈도우(rolling window) 커널.
+
+새 지표(Donchian 채널, 스토캐스틱, 최고가 기준 손절, 백분위 순위 등)를 만들 때 사용하는 공통 기본 연산입니다.
+kernels 모듈과 같이 마지막 축(시간)을 따라 계산하므로 1차원 배열과 (종목 × 날짜) 행렬을 모두 받으며,
+결과의 앞부분 period - 1개(warm-up)와 NaN을 포함하는 윈도우는 NaN입니다.
+
+- rolling_max / rolling_min: van Herk/Gil-Werman 블록 누적 최대/최소, O(n)
+- rolling_sum / rolling_var: kernels.rolling_mean_var의 블록 중심화 누적합, O(n)
+- rolling_quantile: sliding_window_view 청크를 np.sort로 정렬, O(n·w log w)
+- rolling_rank: sliding_window_view 청크에서 현재 값보다 작은/같은 개수 합산, O(n·w)
+  두 함수 모두 윈도우 연산은 numpy 안에서 이뤄지고 Python 루프는 청크 수만큼만 돕니다 (긴 윈도우보다 수백 이하에 적합).
+"""
+from typing import Callable
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.domain.technical.kernels import rolling_mean_var
+
+# 청크당 윈도우 복사본 원소 수 상한 (float64 기준 32MB)
+_CHUNK_ELEMENTS = 1 << 22
+
+def _as_float_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+def _validate_period(period: int) -> None:
+    if period < 1:
+        raise ValueError("Period must be at least 1")
+
+def _block_extreme(values, period: int, accumulate: np.ufunc) -> np.ndarray:
+    """
+    van Herk/Gil-Werman 이동 최대/최소.
+    period 길이 블록마다 접두 누적값(왼→오)과 접미 누적값(오→왼)을 구하면,
+    윈도우 [t - period + 1, t]의 결과는 (접미[t - period + 1], 접두[t]) 두 값의 비교 한 번입니다.
+    """
+    values = _as_float_array(values)
+    _validate_period(period)
+    lead, n = values.shape[:-1], values.shape[-1]
+    result = np.full(values.shape, np.nan)
+    if n < period:
+        return result
+
+    blocks_count = -(-n // period)
+    padded = np.full(lead + (blocks_count * period,), np.nan)
+    padded[..., :n] = values
+    blocks = padded.reshape(lead + (blocks_count, period))
+    # NaN은 비교 ufunc(maximum/minimum)에서 전파되므로 NaN을 포함하는 윈도우만 NaN이 됨
+    prefix = accumulate.accumulate(blocks, axis=-1).reshape(padded.shape)
+    suffix = accumulate.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+    result[..., period - 1:] = accumulate(suffix[..., :n - period + 1], prefix[..., period - 1:n])
+    return result
+
+def rolling_max(values, period: int) -> np.ndarray:
+    """이동 최대값"""
+    return _block_extreme(values, period, np.maximum)
+
+def rolling_min(values, period: int) -> np.ndarray:
+    """이동 최소값"""
+    return _block_extreme(values, period, np.minimum)
+
+def rolling_sum(values, period: int) -> np.ndarray:
+    """이동 합계"""
+    _validate_period(period)
+    return rolling_mean_var(values, period)[0] * period
+
+def rolling_var(values, period: int, ddof: int = 0) -> np.ndarray:
+    """이동 분산 (ddof=0: 모분산, ddof=1: 표본분산)"""
+    _validate_period(period)
+    if period <= ddof:
+        raise ValueError("Period must be greater than ddof")
+    var = rolling_mean_var(values, period)[1]
+    return var * (period / (period - ddof)) if ddof else var
+
+def _apply_windows(values, period: int, statistic: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> np.ndarray:
+    """
+    sliding_window_view로 만든 (…, 윈도우 수, period) 뷰를 시간축 청크 단위로 statistic(윈도우, 현재 값)에 넘깁니다.
+    청크 크기는 복사본이 _CHUNK_ELEMENTS 원소를 넘지 않도록 정하며, Python 루프는 청크 수만큼만 돕니다.
+    NaN은 0으로 채워 계산한 뒤, NaN을 포함하는 윈도우(블록 누적 최대로 O(n) 판정)의 결과를 NaN으로 덮어씁니다.
+    """
+    values = _as_float_array(values)
+    _validate_period(period)
+    result = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return result
+
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+    windows = sliding_window_view(filled, period, axis=-1)
+    current = filled[..., period - 1:]
+    out = result[..., period - 1:]
+    rows = max(1, int(np.prod(values.shape[:-1])))
+    step = max(1, _CHUNK_ELEMENTS // (rows * period))
+    for begin in range(0, current.shape[-1], step):
+        chunk = slice(begin, begin + step)
+        out[..., chunk] = statistic(windows[..., chunk, :], current[..., chunk])
+    out[_block_extreme(missing, period, np.maximum)[..., period - 1:] > 0] = np.nan
+    return result
+
+def rolling_quantile(values, period: int, q: float) -> np.ndarray:
+    """
+    이동 분위수 (0 <= q <= 1, 선형 보간: numpy.quantile의 기본 방식과 같음)
+    """
+    if not 0.0 <= q <= 1.0:
+        raise ValueError("Quantile must be between 0 and 1")
+
+    position = q * (period - 1)
+    lower = int(position)
+    upper = min(lower + 1, period - 1)
+
+    def quantile(windows: np.ndarray, _: np.ndarray) -> np.ndarray:
+        # 두 순서 통계를 고르는 np.partition(kth 2개)보다 윈도우 크기 수백까지는 C 정렬 한 번이 더 빠름
+        ordered = np.sort(windows, axis=-1)
+        low, high = ordered[..., lower], ordered[..., upper]
+        return low + (high - low) * (position - lower)
+
+    return _apply_windows(values, period, quantile)
+
+def rolling_median(values, period: int) -> np.ndarray:
+    """이동 중앙값"""
+    return rolling_quantile(values, period, 0.5)
+
+def rolling_rank(values, period: int) -> np.ndarray:
+    """
+    현재 값의 윈도우 내 백분위 순위 (0, 1].
+    (현재 값보다 작은 개수 + (같은 값 개수 + 1) / 2) / period  (동률은 평균 순위, pandas rank(pct=True)와 같음)
+    """
+    def rank(windows: np.ndarray, current: np.ndarray) -> np.ndarray:
+        less = (windows < current[..., None]).sum(axis=-1)
+        equal = (windows == current[..., None]).sum(axis=-1)
+        return (less + (equal + 1) / 2) / period
+
+    return _apply_windows(values, period, rank)
@@ -1,8 +1,12 @@
-from typing import List, Optional
-from pydantic import BaseModel, field_validator
 from decimal import Decimal
-from src.domain.technical.indicator import Indicator
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from pydantic import BaseModel, field_validator
+from src.domain.technical.indicator import Indicator, to_float_list, decimal_closes
+from src.domain.technical import kernels, panel, pipeline, reference
+from src.domain.technical.streaming import StreamingRSI
 from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.precision import Precision
 
 class RSI(BaseModel, Indicator):
     """
@@ -11,6 +15,7 @@ class RSI(BaseModel, Indicator):
     Pydantic을 사용하여 설정 값 검증.
     """
     period: int = 14
+    precision: Precision = Precision.DECIMAL
 
     @field_validator('period')
     @classmethod
@@ -19,57 +24,26 @@ class RSI(BaseModel, Indicator):
             raise ValueError("Period must be at least 1")
         return v
 
-    def calculate(self, chart: CandleChart) -> List[Optional[float]]:
-        candles = chart.candles
-        if len(candles) <= self.period:
-            return [None] * len(candles)
-
-        # 1. 등락폭(Diff) 계산
-        # diffs[i] = candles[i+1].close - candles[i].close
-        # 데이터 포인트: 0일에 대한 diff는 없음. 1일부터 시작.
-        closes = [float(c.close_price.amount) for c in candles]
-        deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-
-        # U(Up), D(Down) 분리
-        ups = [x if x > 0 else 0.0 for x in deltas]
-        downs = [-x if x < 0 else 0.0 for x in deltas]
+    def compute(self, closes, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        종가 배열에 대한 RSI 배열 (첫 값은 index = period, 그 앞은 NaN).
+        종목 × 날짜 행렬을 넘기면 모든 종목을 한 번에 계산합니다. (panel.apply 참고)
+        """
+        return panel.apply(kernels.rsi, closes, self.period, mask=mask)
 
-        rsi_values: List[Optional[float]] = [None] * len(candles)
+    def compute_decimal(self, closes: Sequence[Decimal]) -> List[Optional[Decimal]]:
+        """Decimal 참조 계산 (Precision.DECIMAL)"""
+        return reference.rsi(closes, self.period)
 
-        # 2. 초기 평균 (SMA): 첫 period 동안의 평균
-        # deltas 인덱스 0 ~ period-1 (총 period 개) 사용 => 캔들 인덱스로는 1 ~ period
-        # 따라서 첫 RSI 값은 index = period 일 때 산출됨
-        
-        avg_u = sum(ups[:self.period]) / self.period
-        avg_d = sum(downs[:self.period]) / self.period
+    def outputs(self, source: pipeline.Node) -> Dict[str, pipeline.Node]:
+        """파이프라인 노드 선언: RSI(source, period)"""
+        return {"value": pipeline.rsi(source, self.period)}
 
-        # 첫 번째 RSI 계산 (index = period)
-        rs = avg_u / avg_d if avg_d != 0 else 0
-        if avg_d == 0:
-            rsi_values[self.period] = 100.0
-        else:
-            rsi_values[self.period] = 100.0 - (100.0 / (1.0 + rs))
+    def streaming(self) -> StreamingRSI:
+        """캔들 하나당 O(1)로 갱신되는 스트리밍 상태 객체"""
+        return StreamingRSI(self.period)
 
-        # 3. Wilder's Smoothing 적용 (Calculated iteratively)
-        # index i는 period+1 부터 끝까지 (즉, deltas의 인덱스 period 부터)
-        for i in range(self.period, len(deltas)):
-            current_up = ups[i]
-            current_down = downs[i]
-
-            # 이전 평균값 사용
-            avg_u = (avg_u * (self.period - 1) + current_up) / self.period
-            avg_d = (avg_d * (self.period - 1) + current_down) / self.period
-
-            if avg_d == 0:
-                rsi_val = 100.0
-            elif avg_u == 0: # avg_d != 0
-                rsi_val = 0.0
-            else:
-                rs = avg_u / avg_d
-                rsi_val = 100.0 - (100.0 / (1.0 + rs))
-            
-            # deltas[i]는 candles[i+1]의 변동분이므로, rsi값은 candles[i+1]에 매핑
-            candle_idx = i + 1
-            rsi_values[candle_idx] = rsi_val
-
-        return rsi_values
+    def calculate(self, chart: CandleChart) -> List[Optional[float]]:
+        if self.precision is Precision.DECIMAL:
+            return [None if value is None else float(value) for value in self.compute_decimal(decimal_closes(chart))]
+        return to_float_list(self.apply(chart).values)
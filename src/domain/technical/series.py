@@ -0,0 +1,105 @@
+"""
+지표 입력/출력 계열 (PriceSeries).
+
+지표는 CandleChart 대신 가격 계열을 입력으로 받을 수 있습니다.
+종가 배열, 파생 계열(거래량, 스프레드 등), 다른 지표의 출력이 모두 같은 PriceSeries이므로
+신호선, 평활 RSI, 거래량 볼린저 밴드 같은 "지표의 지표"도 가짜 차트 없이 같은 커널로 계산합니다.
+
+    closes = PriceSeries.from_chart(chart)
+    smoothed_rsi = EMA(period=5).apply(RSI(period=14).apply(closes))
+    volume_bands = BollingerBands(period=20).apply(PriceSeries.from_chart(chart, "volume"))
+"""
+from typing import Any, Callable, Optional, Union
+import numpy as np
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Currency
+
+# 필드 이름 → 차트/유니버스 속성 이름
+SERIES_FIELDS = {"open": "opens", "high": "highs", "low": "lows", "close": "closes", "volume": "volumes"}
+
+class PriceSeries:
+    """
+    값 배열과 날짜 축을 가진 읽기 전용 계열.
+
+    - values: float64 배열 (1차원: 시간, 2차원: 종목 × 날짜). 입력이 float64면 복사하지 않는 뷰
+    - day_numbers: 마지막 축에 대응하는 일 번호 (없으면 None)
+    - mask: 2차원일 때 유효 칸 (None이면 NaN이 아닌 칸)
+    - currency: 가격 계열의 통화 (가격이 아닌 계열이면 None)
+    """
+
+    def __init__(
+        self,
+        values,
+        day_numbers: Optional[np.ndarray] = None,
+        currency: Optional[Currency] = None,
+        mask: Optional[np.ndarray] = None,
+        name: str = "",
+    ):
+        values = np.asarray(values, dtype=np.float64).view()
+        values.flags.writeable = False
+        if day_numbers is not None and len(day_numbers) != values.shape[-1]:
+            raise ValueError("day_numbers must match the length of the series")
+        self.values = values
+        self.day_numbers = day_numbers
+        self.currency = currency
+        self.mask = mask
+        self.name = name
+
+    @classmethod
+    def from_chart(cls, chart: CandleChart, field: str = "close") -> 'PriceSeries':
+        """차트의 가격(또는 거래량) 계열. 가격 계열은 차트 배열을 복사 없이 참조합니다."""
+        if field not in SERIES_FIELDS:
+            raise ValueError(f"Unknown series field: {field}")
+        currency = None if field == "volume" else chart.currency
+        return cls(getattr(chart, SERIES_FIELDS[field]), chart.day_numbers, currency, name=field)
+
+    @classmethod
+    def from_universe(cls, universe: MarketUniverse, field: str = "close") -> 'PriceSeries':
+        """유니버스의 (종목 × 날짜) 계열. 비어 있는 칸은 universe.mask로 표시됩니다."""
+        if field not in SERIES_FIELDS:
+            raise ValueError(f"Unknown series field: {field}")
+        return cls(getattr(universe, SERIES_FIELDS[field]), universe.dates.astype(np.int64), mask=universe.mask, name=field)
+
+    def derive(self, values, name: str = "") -> 'PriceSeries':
+        """같은 날짜 축/통화/마스크를 갖는 파생 계열"""
+        return PriceSeries(values, self.day_numbers, self.currency, self.mask, name)
+
+    def __len__(self) -> int:
+        return self.values.shape[-1]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def evaluate(self, compute: Callable[..., Any]) -> Any:
+        """
+        compute(values, mask=...) 형태의 배열 계산(지표의 compute)을 적용합니다.
+        1차원 계열의 앞쪽 NaN(다른 지표 출력의 warm-up)은 제외하고 계산한 뒤 결과 앞을 NaN으로 채웁니다.
+        (2차원은 panel.apply가 종목별 유효 값을 모아 계산하므로 그대로 전달)
+        """
+        if self.values.ndim > 1:
+            return compute(self.values, mask=self.mask)
+        valid = ~np.isnan(self.values)
+        start = int(np.argmax(valid)) if valid.any() else len(self.values)
+        if start == 0:
+            return compute(self.values)
+
+        result = compute(self.values[start:])
+        pad = np.full(start, np.nan)
+        if isinstance(result, tuple):
+            parts = [np.concatenate((pad, part)) for part in result]
+            return result._make(parts) if hasattr(result, "_make") else tuple(parts)
+        return np.concatenate((pad, result))
+
+    def __repr__(self) -> str:
+        return f"PriceSeries(name={self.name!r}, shape={self.values.shape})"
+
+SeriesLike = Union[PriceSeries, CandleChart, np.ndarray]
+
+def as_series(source: SeriesLike) -> PriceSeries:
+    """차트(종가), PriceSeries, 배열을 PriceSeries로 변환합니다."""
+    if isinstance(source, PriceSeries):
+        return source
+    if isinstance(source, CandleChart):
+        return PriceSeries.from_chart(source)
+    return PriceSeries(source)
@@ -0,0 +1,215 @@
+"""
+스트리밍(온라인) 지표 상태 객체.
+
+새 캔들 하나당 O(1)로 지표 값을 갱신합니다. 배치 커널(kernels)과 같은 정의를 따르며,
+warm-up 구간에서는 None을 반환합니다.
+
+- update(candle): 캔들의 종가로 갱신하고 현재 값을 반환
+- update_value(close): 종가(float)로 직접 갱신
+- snapshot() / restore(state): 상태 저장 및 복원 (되감기, 가정 시뮬레이션용)
+- CandleChart.attach(...)로 차트에 연결하면 캔들 추가 시 자동으로 갱신됩니다.
+"""
+import copy
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+from src.domain.market.candle import Candle
+
+class StreamingIndicator(ABC):
+    """스트리밍 지표의 기본 클래스"""
+
+    def __init__(self):
+        self.reset()
+
+    @abstractmethod
+    def reset(self) -> None:
+        """상태를 초기화합니다."""
+
+    @abstractmethod
+    def update_value(self, close: float) -> Any:
+        """종가 하나로 상태를 갱신하고 현재 지표 값을 반환합니다."""
+
+    @property
+    @abstractmethod
+    def value(self) -> Any:
+        """현재 지표 값 (warm-up 중이면 None)"""
+
+    def update(self, candle: Candle) -> Any:
+        return self.update_value(float(candle.close_price.amount))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태의 복사본을 반환합니다."""
+        return copy.deepcopy(self.__dict__)
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """snapshot()으로 저장한 상태로 되돌립니다."""
+        self.__dict__.update(copy.deepcopy(state))
+
+class StreamingSMA(StreamingIndicator):
+    """윈도우 합계를 유지하는 단순 이동평균"""
+
+    def __init__(self, period: int):
+        self.period = period
+        super().__init__()
+
+    def reset(self) -> None:
+        self._window: deque = deque()
+        self._sum = 0.0
+
+    def update_value(self, close: float) -> Optional[float]:
+        self._window.append(close)
+        self._sum += close
+        if len(self._window) > self.period:
+            self._sum -= self._window.popleft()
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._window) < self.period:
+            return None
+        return self._sum / self.period
+
+class StreamingSmoothing(StreamingIndicator):
+    """
+    첫 period개의 SMA를 초기값으로 하는 지수 평활 (kernels.smoothed와 동일)
+    y = alpha * x + (1 - alpha) * y_prev
+    """
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        super().__init__()
+
+    def reset(self) -> None:
+        self._count = 0
+        self._seed_sum = 0.0
+        self._value: Optional[float] = None
+
+    def update_value(self, close: float) -> Optional[float]:
+        self._count += 1
+        if self._count < self.period:
+            self._seed_sum += close
+        elif self._count == self.period:
+            self._value = (self._seed_sum + close) / self.period
+        else:
+            self._value = self.alpha * close + (1.0 - self.alpha) * self._value
+        return self._value
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._value
+
+class StreamingEMA(StreamingSmoothing):
+    """지수 이동평균 (k = 2 / (period + 1))"""
+
+    def __init__(self, period: int):
+        super().__init__(period, 2.0 / (period + 1))
+
+class StreamingWilder(StreamingSmoothing):
+    """Wilder 평활 (alpha = 1 / period)"""
+
+    def __init__(self, period: int):
+        super().__init__(period, 1.0 / period)
+
+class StreamingRSI(StreamingIndicator):
+    """상승/하락폭 각각의 Wilder 평균으로 계산하는 RSI"""
+
+    def __init__(self, period: int):
+        self.period = period
+        super().__init__()
+
+    def reset(self) -> None:
+        self._prev_close: Optional[float] = None
+        self._avg_up = StreamingWilder(self.period)
+        self._avg_down = StreamingWilder(self.period)
+
+    def update_value(self, close: float) -> Optional[float]:
+        if self._prev_close is not None:
+            delta = close - self._prev_close
+            self._avg_up.update_value(delta if delta > 0 else 0.0)
+            self._avg_down.update_value(-delta if delta < 0 else 0.0)
+        self._prev_close = close
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        avg_up, avg_down = self._avg_up.value, self._avg_down.value
+        if avg_up is None:
+            return None
+        if avg_down == 0:
+            return 100.0
+        if avg_up == 0:
+            return 0.0
+        return 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+
+class StreamingBollingerBands(StreamingIndicator):
+    """
+    윈도우 평균/분산을 Welford 방식(추가·제거)으로 유지하는 볼린저 밴드.
+    값은 (upper, middle, lower) 튜플입니다.
+    """
+
+    def __init__(self, period: int, std_dev_multiplier: float = 2.0):
+        self.period = period
+        self.std_dev_multiplier = std_dev_multiplier
+        super().__init__()
+
+    def reset(self) -> None:
+        self._window: deque = deque()
+        self._mean = 0.0
+        self._m2 = 0.0  # 평균으로부터의 편차 제곱합
+
+    def update_value(self, close: float) -> Optional[Tuple[float, float, float]]:
+        self._window.append(close)
+        count = len(self._window)
+        if count <= self.period:
+            # 추가: Welford 갱신
+            delta = close - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (close - self._mean)
+        else:
+            # 같은 크기 윈도우에서 가장 오래된 값과 교체
+            removed = self._window.popleft()
+            old_mean = self._mean
+            self._mean += (close - removed) / self.period
+            self._m2 += (close - removed) * (close - self._mean + removed - old_mean)
+        return self.value
+
+    @property
+    def value(self) -> Optional[Tuple[float, float, float]]:
+        if len(self._window) < self.period:
+            return None
+        width = math.sqrt(max(self._m2, 0.0) / self.period) * self.std_dev_multiplier
+        return self._mean + width, self._mean, self._mean - width
+
+class StreamingMACD(StreamingIndicator):
+    """
+    fast/slow EMA와, MACD 선이 유효해진 뒤부터 이어지는 signal EMA의 연쇄 상태.
+    값은 (macd, signal, histogram) 튜플이며, 아직 계산되지 않은 항목은 None입니다.
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        super().__init__()
+
+    def reset(self) -> None:
+        self._fast = StreamingEMA(self.fast_period)
+        self._slow = StreamingEMA(self.slow_period)
+        self._signal = StreamingEMA(self.signal_period)
+        self._macd: Optional[float] = None
+
+    def update_value(self, close: float) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        fast = self._fast.update_value(close)
+        slow = self._slow.update_value(close)
+        if slow is not None:
+            self._macd = fast - slow
+            self._signal.update_value(self._macd)
+        return self.value
+
+    @property
+    def value(self) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        signal = self._signal.value
+        histogram = None if signal is None else self._macd - signal
+        return self._macd, signal, histogram
@@ -0,0 +1,115 @@
+"""
+다중 파라미터 지표 스윕.
+
+같은 종가 배열에 대해 여러 기간(및 배수)의 지표를 한 번의 공통 계산으로 구합니다.
+결과는 (파라미터 × 날짜) 배열이며, 각 행은 kernels의 단일 계산 결과와 같습니다. (warm-up은 NaN)
+
+- SMA / 표준편차: 누적합과 제곱 누적합을 한 번만 만들고, 기간마다 차분 한 번으로 결과 행을 채움
+- EMA / Wilder: 공유 누적합에서 기간별 SMA 초기값을 얻고, 재귀식은 기간마다 lfilter(C 루프)로 계산
+  (시간축을 파이썬으로 순회하며 모든 기간을 벡터로 갱신하는 방식은 시점당 호출 비용 때문에 더 느림)
+"""
+from typing import Sequence, Tuple
+import numpy as np
+from scipy.signal import lfilter
+from src.domain.technical.kernels import BollingerSeries
+
+def _periods_array(periods: Sequence[int]) -> np.ndarray:
+    periods = np.asarray(periods, dtype=np.int64)
+    if periods.ndim != 1 or not len(periods) or (periods <= 0).any():
+        raise ValueError("Periods must be a non-empty sequence of positive integers")
+    return periods
+
+def _window_sums(prefix: np.ndarray, periods: np.ndarray, n: int) -> np.ndarray:
+    """앞에 0을 붙인 누적합 prefix로 (기간 × 날짜) 윈도우 합을 구합니다. (윈도우가 덜 찬 칸은 NaN)"""
+    sums = np.empty((len(periods), n))
+    for row, period in zip(sums, periods.tolist()):
+        row[:period - 1] = np.nan
+        if period <= n:
+            np.subtract(prefix[period:], prefix[:n + 1 - period], out=row[period - 1:])
+    return sums
+
+def _centered(values) -> Tuple[np.ndarray, float]:
+    """상쇄 오차를 줄이기 위해 전체 평균을 뺀 값과 그 평균을 반환합니다."""
+    values = np.asarray(values, dtype=np.float64)
+    offset = float(np.nanmean(values)) if len(values) and not np.isnan(values).all() else 0.0
+    return values - offset, offset
+
+def sma_sweep(values, periods: Sequence[int]) -> np.ndarray:
+    """여러 기간의 단순 이동평균 (기간 × 날짜)"""
+    periods = _periods_array(periods)
+    centered, offset = _centered(values)
+    prefix = np.concatenate(([0.0], np.cumsum(centered)))
+    result = _window_sums(prefix, periods, len(centered))
+    result /= periods[:, None]
+    result += offset
+    return result
+
+def mean_var_sweep(values, periods: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """여러 기간의 이동 평균과 모분산 (각각 기간 × 날짜). 누적합/제곱 누적합을 공유합니다."""
+    periods = _periods_array(periods)
+    centered, offset = _centered(values)
+    n = len(centered)
+    prefix = np.concatenate(([0.0], np.cumsum(centered)))
+    prefix_sq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    mean = _window_sums(prefix, periods, n)
+    mean /= periods[:, None]
+    var = _window_sums(prefix_sq, periods, n)
+    var /= periods[:, None]
+    var -= mean * mean
+    np.maximum(var, 0.0, out=var)
+    mean += offset
+    return mean, var
+
+def bollinger_sweep(closes, params: Sequence[Tuple[int, float]]) -> BollingerSeries:
+    """
+    여러 (기간, 배수) 조합의 볼린저 밴드.
+    기간별 평균/분산은 한 번씩만 계산하고 배수만 다르게 적용하며, 결과 각 필드는 (조합 × 날짜) 배열입니다.
+    """
+    if not len(params):
+        raise ValueError("Params must not be empty")
+    closes = np.asarray(closes, dtype=np.float64)
+    periods = np.array([period for period, _ in params], dtype=np.int64)
+    multipliers = np.array([multiplier for _, multiplier in params], dtype=np.float64)[:, None]
+
+    unique_periods, inverse = np.unique(periods, return_inverse=True)
+    mean, var = mean_var_sweep(closes, unique_periods)
+    middle = mean[inverse]
+    width = np.sqrt(var[inverse]) * multipliers
+    upper, lower = middle + width, middle - width
+    spread = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = np.where(spread > 0, (closes[None, :] - lower) / spread, np.nan)
+        bandwidth = np.where(middle != 0, spread / middle, np.nan)
+    return BollingerSeries(upper, middle, lower, percent_b, bandwidth)
+
+def smoothed_sweep(values, periods: Sequence[int], alphas: Sequence[float]) -> np.ndarray:
+    """
+    기간별 (SMA 초기값 → 지수 평활)을 계산합니다. (기간 × 날짜)
+    초기값은 공유 누적합에서 한 번에 구하고, y = alpha * x + (1 - alpha) * y_prev 는 기간마다 lfilter로 계산합니다.
+    """
+    periods = _periods_array(periods)
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    result = np.full((len(periods), n), np.nan)
+
+    centered, offset = _centered(values)
+    prefix = np.concatenate(([0.0], np.cumsum(centered)))
+    for row, period, alpha in zip(result, periods.tolist(), np.asarray(alphas, dtype=np.float64).tolist()):
+        if period > n:
+            continue
+        seed = prefix[period] / period + offset
+        row[period - 1] = seed
+        if period < n:
+            decay = 1.0 - alpha
+            row[period:], _ = lfilter([alpha], [1.0, -decay], values[period:], zi=[decay * seed])
+    return result
+
+def ema_sweep(values, periods: Sequence[int]) -> np.ndarray:
+    """여러 기간의 EMA (k = 2 / (period + 1))"""
+    periods = _periods_array(periods)
+    return smoothed_sweep(values, periods, 2.0 / (periods + 1.0))
+
+def wilder_sweep(values, periods: Sequence[int]) -> np.ndarray:
+    """여러 기간의 Wilder 평활 (alpha = 1 / period)"""
+    periods = _periods_array(periods)
+    return smoothed_sweep(values, periods, 1.0 / periods)
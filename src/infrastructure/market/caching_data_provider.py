@@ -0,0 +1,232 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_columns import to_day_number
+from src.infrastructure.market.memmap_chart_store import MemmapChartStore
+from src.ports.market_data_provider import MarketDataProvider
+
+try:
+    import fcntl  # 프로세스 간 잠금 (POSIX)
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DateRange = Tuple[date, date]
+
+class CachingDataProvider(MarketDataProvider):
+    """
+    다른 MarketDataProvider를 감싸는 읽기 캐시(Read-through Cache) 데코레이터.
+
+    - 조회한 OHLCV를 종목별로 MemmapChartStore에 저장합니다.
+    - 종목별로 이미 조회한 기간(coverage)을 기록하고, 요청 기간 중 빠진 구간만 상위 제공자에서 조회하여 병합합니다.
+    - 조회 당일의 캔들은 장중 데이터일 수 있으므로, 조회 시각으로부터 stale_after가 지나면 다시 조회합니다.
+    - 여러 스레드, 그리고 같은 캐시 디렉터리를 쓰는 여러 인스턴스/프로세스에서 동시에 호출할 수 있습니다.
+      같은 종목의 조회/병합은 종목별 잠금(스레드 잠금 + 잠금 파일)으로 직렬화하고,
+      coverage는 잠금 안에서 디스크의 최신 기록을 다시 읽은 뒤 계산/갱신/저장합니다.
+    """
+    COVERAGE_FILE = "coverage.json"
+
+    def __init__(
+        self,
+        upstream: MarketDataProvider,
+        store: MemmapChartStore,
+        stale_after: timedelta = timedelta(minutes=30),
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        self.upstream = upstream
+        self.store = store
+        self.stale_after = stale_after
+        self.clock = clock
+        self._coverage: Dict[str, List[dict]] = {}
+        # 마지막으로 읽은 coverage 파일의 (inode, 수정 시각, 크기)
+        self._coverage_stamp: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+        self._ticker_locks: Dict[str, threading.Lock] = {}
+
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        with self._ticker_locked(ticker.code):
+            missing = self.missing_ranges(ticker.code, start_date, end_date)
+            if missing:
+                self._fetch_and_merge(ticker, missing)
+
+        if not self.store.has(ticker.code):
+            return CandleChart(ticker, CandleUnit.day())
+        return self.store.read_range(ticker.code, start_date, end_date)
+
+    def missing_ranges(self, ticker_code: str, start_date: date, end_date: date) -> List[DateRange]:
+        """
+        요청 기간 중 캐시에 없는(또는 오래된) 날짜 구간 목록을 반환합니다.
+        다른 인스턴스/프로세스가 기록했을 수 있으므로 디스크의 coverage가 바뀌었으면 다시 읽고 계산합니다.
+        """
+        now = self.clock()
+        with self._locked():
+            entries = list(self._refresh_coverage().get(ticker_code, []))
+        covered: List[DateRange] = []
+        for entry in entries:
+            range_start = date.fromisoformat(entry["start"])
+            range_end = date.fromisoformat(entry["end"])
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            # 조회 당일의 캔들은 유효 시간이 지나면 다시 조회 대상
+            if range_end >= fetched_at.date() and now - fetched_at > self.stale_after:
+                range_end = fetched_at.date() - timedelta(days=1)
+            if range_start <= range_end:
+                covered.append((range_start, range_end))
+
+        missing: List[DateRange] = []
+        cursor = start_date
+        for range_start, range_end in sorted(covered):
+            if range_end < cursor:
+                continue
+            if range_start > end_date:
+                break
+            if range_start > cursor:
+                missing.append((cursor, range_start - timedelta(days=1)))
+            cursor = range_end + timedelta(days=1)
+        if cursor <= end_date:
+            missing.append((cursor, end_date))
+        return missing
+
+    def _fetch_and_merge(self, ticker: Ticker, missing: List[DateRange]) -> None:
+        """빠진 구간만 조회하여 기존 캐시와 병합 후 저장합니다."""
+        fetched_at = self.clock()
+        parts = [self.upstream.get_ohlcv(ticker, range_start, range_end) for range_start, range_end in missing]
+
+        # 1. 기존 데이터 중 재조회 구간에 속한 캔들은 새 데이터로 교체
+        sources: List[CandleChart] = []
+        if self.store.has(ticker.code):
+            cached = self.store.open(ticker.code)
+            days = cached.day_numbers
+            keep = np.ones(len(days), dtype=bool)
+            for range_start, range_end in missing:
+                keep &= (days < to_day_number(range_start)) | (days > to_day_number(range_end))
+            sources.append(self._take(cached, keep))
+        sources.extend(part for part in parts if len(part))
+
+        # 2. 병합 후 저장
+        unit = next((chart.unit for chart in sources if len(chart)), CandleUnit.day())
+        currency = next((chart.currency for chart in sources if chart.currency), None)
+        if currency is not None:
+            merged = CandleChart.from_arrays(
+                ticker, unit,
+                *(np.concatenate([getattr(chart, field) for chart in sources]) for field in MemmapChartStore.FIELDS),
+                currency=currency,
+            )
+            self.store.write(merged)
+
+        # 3. 조회한 구간 기록 (미래 날짜는 아직 데이터가 없으므로 조회 당일까지만 기록)
+        #    잠금 안에서 디스크의 최신 coverage를 다시 읽어 그 위에 기록하므로 다른 인스턴스의 기록을 덮어쓰지 않음
+        with self._locked():
+            self._coverage = self._load_coverage()
+            for range_start, range_end in missing:
+                self._add_coverage(ticker.code, range_start, min(range_end, fetched_at.date()), fetched_at)
+            self._save_coverage()
+
+    def _ticker_lock(self, ticker_code: str) -> threading.Lock:
+        with self._lock:
+            return self._ticker_locks.setdefault(ticker_code, threading.Lock())
+
+    @contextmanager
+    def _ticker_locked(self, ticker_code: str) -> Iterator[None]:
+        """종목별 조회/병합 잠금 (같은 프로세스: 종목별 threading.Lock, 다른 프로세스: 종목별 잠금 파일의 flock)"""
+        with self._ticker_lock(ticker_code):
+            with self._file_lock(f"{self.COVERAGE_FILE}.{ticker_code}.lock"):
+                yield
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """coverage 조회/갱신 잠금 (같은 프로세스: threading.Lock, 다른 프로세스: 잠금 파일의 flock)"""
+        with self._lock:
+            with self._file_lock(f"{self.COVERAGE_FILE}.lock"):
+                yield
+
+    @contextmanager
+    def _file_lock(self, name: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        directory = Path(self.store.root) / ".locks"
+        directory.mkdir(exist_ok=True)
+        with open(directory / name, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _take(chart: CandleChart, keep: np.ndarray) -> CandleChart:
+        return CandleChart.from_arrays(
+            chart.ticker, chart.unit,
+            chart.timestamps[keep], chart.opens[keep], chart.highs[keep],
+            chart.lows[keep], chart.closes[keep], chart.volumes[keep],
+            currency=chart.currency,
+        )
+
+    def _add_coverage(self, ticker_code: str, range_start: date, range_end: date, fetched_at: datetime) -> None:
+        """새 구간을 기록하고, 겹치는 기존 구간은 잘라냅니다. (구간별 조회 시각 유지, _locked() 안에서 호출)"""
+        if range_start > range_end:
+            return
+        entries: List[dict] = []
+        for entry in self._coverage.get(ticker_code, []):
+            old_start = date.fromisoformat(entry["start"])
+            old_end = date.fromisoformat(entry["end"])
+            if old_end < range_start or old_start > range_end:
+                entries.append(entry)
+                continue
+            if old_start < range_start:
+                entries.append({**entry, "end": (range_start - timedelta(days=1)).isoformat()})
+            if old_end > range_end:
+                entries.append({**entry, "start": (range_end + timedelta(days=1)).isoformat()})
+        entries.append({
+            "start": range_start.isoformat(),
+            "end": range_end.isoformat(),
+            "fetched_at": fetched_at.isoformat(),
+        })
+        self._coverage[ticker_code] = sorted(entries, key=lambda e: e["start"])
+
+    def _coverage_file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(Path(self.store.root) / self.COVERAGE_FILE)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _refresh_coverage(self) -> Dict[str, List[dict]]:
+        """coverage 파일이 마지막으로 읽은 뒤 바뀌었으면 다시 읽습니다. (_locked() 안에서 호출)"""
+        stamp = self._coverage_file_stamp()
+        if stamp != self._coverage_stamp:
+            self._coverage = self._load_coverage()
+            self._coverage_stamp = stamp
+        return self._coverage
+
+    def _load_coverage(self) -> Dict[str, List[dict]]:
+        path = Path(self.store.root) / self.COVERAGE_FILE
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_coverage(self) -> None:
+        """
+        coverage를 고유한 임시 파일에 쓴 뒤 rename으로 교체합니다.
+        (_locked() 안에서, 디스크의 최신 기록을 다시 읽어 갱신한 뒤 호출)
+        """
+        root = Path(self.store.root)
+        fd, temp = tempfile.mkstemp(prefix=f"{self.COVERAGE_FILE}.", suffix=".tmp", dir=root)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._coverage, f, indent=2)
+            os.replace(temp, root / self.COVERAGE_FILE)
+        except BaseException:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+        self._coverage_stamp = self._coverage_file_stamp()
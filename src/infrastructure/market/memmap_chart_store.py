@@ -0,0 +1,218 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit, UnitType
+from src.domain.shared.money import Currency
+
+try:
+    import fcntl  # 프로세스 간 잠금 (POSIX)
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# 같은 프로세스 안에서 같은 저장소 디렉터리를 쓰는 인스턴스들이 공유하는 잠금
+_ROOT_LOCKS: Dict[str, threading.Lock] = {}
+_ROOT_LOCKS_GUARD = threading.Lock()
+
+def _root_lock(root: Path) -> threading.Lock:
+    key = str(root.resolve())
+    with _ROOT_LOCKS_GUARD:
+        return _ROOT_LOCKS.setdefault(key, threading.Lock())
+
+class MemmapChartStore:
+    """
+    종목별 캔들 차트를 로컬 디렉터리에 필드별 바이너리 배열(.npy)로 저장하는 저장소.
+
+    디렉터리 구조:
+        root/index.json                        # 메타데이터 인덱스 (종목명, 단위, 통화, 길이, 기간, 데이터 디렉터리)
+        root/<code>/<data>/timestamps.npy      # datetime64[us]
+        root/<code>/<data>/opens.npy ...       # float64 (opens, highs, lows, closes)
+        root/<code>/<data>/volumes.npy         # int64
+
+    쓰기는 매번 새 데이터 디렉터리에 모든 필드를 기록한 뒤, 인덱스가 그 디렉터리를 가리키도록 교체합니다.
+    따라서 중간에 중단되어도 인덱스는 항상 완전한 필드 묶음을 가리킵니다.
+    인덱스 갱신은 스레드/프로세스 잠금 안에서 디스크의 인덱스를 다시 읽어 병합하므로, 여러 인스턴스가 서로의 항목을 덮어쓰지 않습니다.
+
+    열린 차트는 인스턴스 안에서 재사용하되, 열 때마다 인덱스 파일이 바뀌었는지 확인하여
+    다른 인스턴스/프로세스가 교체한 종목은 새 데이터 디렉터리로 다시 엽니다.
+
+    읽기는 numpy.memmap(읽기 전용)으로 열기 때문에 로딩 비용이 거의 없고,
+    실제로 요청된 기간의 페이지만 디스크에서 읽힙니다.
+    여러 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유합니다.
+    """
+    INDEX_FILE = "index.json"
+    FIELDS = ("timestamps", "opens", "highs", "lows", "closes", "volumes")
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = _root_lock(self.root)
+        self._index: Dict[str, dict] = {}
+        # 마지막으로 읽은 인덱스 파일의 (inode, 수정 시각, 크기)
+        self._index_stamp: Optional[Tuple[int, int, int]] = None
+        # 종목 코드 → (열 때의 인덱스 항목, 차트)
+        self._opened: Dict[str, Tuple[dict, CandleChart]] = {}
+        with self._lock:
+            self._refresh_index()
+
+    def tickers(self) -> List[str]:
+        """저장된 종목 코드 목록"""
+        with self._lock:
+            return sorted(self._refresh_index())
+
+    def has(self, ticker_code: str) -> bool:
+        with self._lock:
+            return ticker_code in self._refresh_index()
+
+    def metadata(self, ticker_code: str) -> Optional[dict]:
+        """종목 메타데이터 (없으면 None)"""
+        with self._lock:
+            return self._refresh_index().get(ticker_code)
+
+    def write(self, chart: CandleChart) -> None:
+        """
+        차트를 저장합니다. 같은 종목이 이미 있으면 교체합니다.
+        새 데이터 디렉터리에 모든 필드를 쓴 뒤 인덱스를 교체하므로, 이미 열려 있는 memmap은 이전 데이터를 계속 안전하게 참조합니다.
+        """
+        code = chart.ticker.code
+        ticker_directory = self.root / code
+        ticker_directory.mkdir(exist_ok=True)
+
+        # 1. 모든 필드 파일을 고유한 새 디렉터리에 기록
+        directory = Path(tempfile.mkdtemp(prefix="data-", dir=ticker_directory))
+        arrays = (chart.timestamps, chart.opens, chart.highs, chart.lows, chart.closes, chart.volumes)
+        try:
+            for field, array in zip(self.FIELDS, arrays):
+                with open(directory / f"{field}.npy", "wb") as f:
+                    np.save(f, np.ascontiguousarray(array))
+                    f.flush()
+                    os.fsync(f.fileno())
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+
+        timestamps = chart.timestamps
+        entry = {
+            "name": chart.ticker.name,
+            "unit": {"unit_type": chart.unit.unit_type.name, "value": chart.unit.value},
+            "currency": chart.currency.value if chart.currency else None,
+            "length": len(chart),
+            "first": str(timestamps[0]) if len(chart) else None,
+            "last": str(timestamps[-1]) if len(chart) else None,
+            "data": directory.name,
+        }
+
+        # 2. 필드가 모두 기록된 뒤 인덱스를 갱신 (디스크의 최신 인덱스에 병합)
+        with self._locked():
+            index = self._load_index()
+            previous = index.get(code)
+            index[code] = entry
+            self._save_index(index)
+            self._index = index
+            self._index_stamp = self._stamp()
+            self._opened.pop(code, None)
+
+        # 3. 이전 데이터 디렉터리 정리 (열려 있는 memmap은 POSIX에서 계속 유효, 삭제 실패는 무시)
+        if previous and previous.get("data") and previous["data"] != directory.name:
+            shutil.rmtree(ticker_directory / previous["data"], ignore_errors=True)
+
+    def open(self, ticker_code: str) -> CandleChart:
+        """
+        저장된 차트 전체를 memmap 기반 읽기 전용 차트로 엽니다.
+        인덱스 항목이 그대로인 동안은 한 번 연 차트를 재사용하고, 다른 인스턴스/프로세스가 교체했으면 다시 엽니다.
+        잠금 안에서 열기 때문에, 열던 데이터 디렉터리가 동시에 교체되어 삭제되는 일은 없습니다.
+
+        Raises:
+            KeyError: 저장되지 않은 종목인 경우
+        """
+        with self._locked():
+            meta = self._refresh_index()[ticker_code]
+            cached = self._opened.get(ticker_code)
+            if cached is not None and cached[0] == meta:
+                return cached[1]
+
+            arrays = self._load_arrays(ticker_code, meta)
+            ticker = Ticker(code=ticker_code, name=meta["name"])
+            unit = CandleUnit(unit_type=UnitType[meta["unit"]["unit_type"]], value=meta["unit"]["value"])
+            currency = Currency(meta["currency"]) if meta["currency"] else Currency.KRW
+
+            # 저장 시점에 이미 검증된 데이터이므로 재검증하지 않음
+            chart = CandleChart.from_arrays(ticker, unit, *arrays, currency=currency, copy=False, validate=False)
+            self._opened[ticker_code] = (meta, chart)
+            return chart
+
+    def read_range(self, ticker_code: str, start_date: date, end_date: date) -> CandleChart:
+        """
+        [start_date, end_date] 기간의 캔들만 참조하는 읽기 전용 차트 뷰를 반환합니다.
+        경계는 memmap 위에서 이진 탐색하므로 범위 밖의 데이터는 읽지 않습니다.
+        """
+        chart = self.open(ticker_code)
+        timestamps = chart.timestamps
+        start = np.searchsorted(timestamps, np.datetime64(start_date, "D"), side="left")
+        end = np.searchsorted(timestamps, np.datetime64(end_date, "D") + np.timedelta64(1, "D"), side="left")
+        return chart.slice(int(start), int(end))
+
+    def _load_arrays(self, ticker_code: str, meta: dict) -> List[np.ndarray]:
+        directory = self.root / ticker_code
+        # 데이터 디렉터리가 없는 항목은 이전 형식 (종목 디렉터리에 바로 저장)
+        if meta.get("data"):
+            directory = directory / meta["data"]
+        return [np.load(directory / f"{field}.npy", mmap_mode="r") for field in self.FIELDS]
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """인덱스 갱신용 잠금 (같은 프로세스: threading.Lock, 다른 프로세스: 잠금 파일의 flock)"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.root / f"{self.INDEX_FILE}.lock", "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        """인덱스 파일의 (inode, 수정 시각, 크기). rename으로 교체되면 inode가 바뀝니다. (없으면 None)"""
+        try:
+            stat = os.stat(self.root / self.INDEX_FILE)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _refresh_index(self) -> Dict[str, dict]:
+        """인덱스 파일이 마지막으로 읽은 뒤 바뀌었으면 다시 읽습니다. (self._lock 안에서 호출)"""
+        stamp = self._stamp()
+        if stamp != self._index_stamp:
+            self._index = self._load_index()
+            self._index_stamp = stamp
+        return self._index
+
+    def _load_index(self) -> Dict[str, dict]:
+        path = self.root / self.INDEX_FILE
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["charts"]
+
+    def _save_index(self, index: Dict[str, dict]) -> None:
+        """고유한 임시 파일에 쓴 뒤 rename으로 교체합니다. (_locked() 안에서 호출)"""
+        path = self.root / self.INDEX_FILE
+        fd, temp = tempfile.mkstemp(prefix=f"{self.INDEX_FILE}.", suffix=".tmp", dir=self.root)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "charts": index}, f, ensure_ascii=False, indent=2)
+            os.replace(temp, path)
+        except BaseException:
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
@@ -0,0 +1,20 @@
+from datetime import date
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit
+from src.infrastructure.market.memmap_chart_store import MemmapChartStore
+from src.ports.market_data_provider import MarketDataProvider
+
+class MemmapDataProvider(MarketDataProvider):
+    """
+    로컬 MemmapChartStore에서 시장 데이터를 제공하는 구현체.
+    네트워크 조회 없이 memmap 위의 읽기 전용 차트 뷰를 반환하므로 로딩 시간이 거의 없습니다.
+    """
+    def __init__(self, store: MemmapChartStore):
+        self.store = store
+
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        if not self.store.has(ticker.code):
+            # 저장되지 않은 종목은 빈 차트 반환 (BacktestService에서 제외됨)
+            return CandleChart(ticker, CandleUnit.day())
+        return self.store.read_range(ticker.code, start_date, end_date)
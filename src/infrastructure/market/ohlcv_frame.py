@@ -0,0 +1,79 @@
+from datetime import date
+from typing import Dict, Tuple
+import numpy as np
+import pandas as pd
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.market_snapshot import MarketSnapshot
+from src.domain.shared.money import Currency
+
+# pykrx get_market_ohlcv 컬럼명
+PYKRX_COLUMNS: Dict[str, str] = {
+    "open": "시가",
+    "high": "고가",
+    "low": "저가",
+    "close": "종가",
+    "volume": "거래량",
+}
+
+def repair_ohlc(opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """고가/저가를 OHLC 전체의 최댓값/최솟값으로 재계산합니다. (컬럼 단위)"""
+    return np.maximum.reduce([opens, highs, lows, closes]), np.minimum.reduce([opens, highs, lows, closes])
+
+def frame_to_snapshot(
+    df: pd.DataFrame,
+    target_date: date,
+    columns: Dict[str, str] = PYKRX_COLUMNS,
+    currency: Currency = Currency.KRW,
+) -> MarketSnapshot:
+    """
+    종목 코드를 인덱스로 가진 하루치 시장 전체 DataFrame을 MarketSnapshot으로 변환합니다.
+    종가가 0 이하인 종목(상장 전/데이터 없음)과 시가가 0인 종목(거래정지/무거래, 종가만 전일 값으로 채워짐)은
+    해당 날짜에 캔들이 없는 것으로 보고 제외합니다.
+    """
+    opens = df[columns["open"]].to_numpy(dtype=np.float64)
+    highs = df[columns["high"]].to_numpy(dtype=np.float64)
+    lows = df[columns["low"]].to_numpy(dtype=np.float64)
+    closes = df[columns["close"]].to_numpy(dtype=np.float64)
+    volumes = df[columns["volume"]].to_numpy(dtype=np.int64)
+    real_highs, real_lows = repair_ohlc(opens, highs, lows, closes)
+
+    # 거래정지 행은 저가 보정 시 0이 되므로 보정 결과와 무관하게 원본 시가/종가로 판정
+    traded = (closes > 0) & (opens > 0)
+    return MarketSnapshot(
+        target_date, df.index.to_numpy(dtype=str)[traded],
+        opens[traded], real_highs[traded], real_lows[traded], closes[traded], volumes[traded],
+        currency=currency,
+    )
+
+def frame_to_chart(
+    df: pd.DataFrame,
+    ticker: Ticker,
+    unit: CandleUnit,
+    columns: Dict[str, str] = PYKRX_COLUMNS,
+    currency: Currency = Currency.KRW,
+) -> CandleChart:
+    """
+    DatetimeIndex를 가진 OHLCV DataFrame을 컬럼 단위 연산으로 CandleChart로 변환합니다.
+    행마다 Candle/Money 객체를 만들지 않고 배열을 그대로 차트에 넘기므로, 비용은 행 수가 아닌 컬럼 수에 비례합니다.
+
+    - 데이터 정합성 보정: 고가/저가를 OHLC 전체의 최댓값/최솟값으로 재계산 (High가 Open보다 낮은 경우 등 방지)
+    - 프레임 단위 1회 검증: validate_ohlcv_arrays (가격은 유한한 값, 거래량은 0 이상 등)
+
+    Args:
+        columns: {"open", "high", "low", "close", "volume"} → DataFrame 컬럼명 매핑
+
+    Raises:
+        CandleValidationError: 검증에 실패한 행이 있는 경우 (문제 행의 위치와 시각 포함)
+    """
+    opens = df[columns["open"]].to_numpy(dtype=np.float64)
+    highs = df[columns["high"]].to_numpy(dtype=np.float64)
+    lows = df[columns["low"]].to_numpy(dtype=np.float64)
+    closes = df[columns["close"]].to_numpy(dtype=np.float64)
+    volumes = df[columns["volume"]].to_numpy(dtype=np.int64)
+    timestamps = pd.DatetimeIndex(df.index).to_numpy(dtype="datetime64[us]")
+
+    # 고가/저가 보정 (컬럼 단위) 후 차트 생성 시 배열 전체를 한 번에 검증
+    real_highs, real_lows = repair_ohlc(opens, highs, lows, closes)
+    return CandleChart.from_arrays(ticker, unit, timestamps, opens, real_highs, real_lows, closes, volumes, currency=currency)
@@ -1,16 +1,27 @@
-from datetime import date
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
 from pykrx import stock
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_chart import CandleChart
 from src.domain.market.candle_unit import CandleUnit
-from src.domain.market.candle import Candle
-from src.domain.shared.money import Money
+from src.domain.market.market_snapshot import MarketSnapshot, pivot_snapshots
+from src.infrastructure.market.ohlcv_frame import frame_to_chart, frame_to_snapshot
 from src.ports.market_data_provider import MarketDataProvider
 
 class PyKrxDataProvider(MarketDataProvider):
     """
     pykrx 라이브러리를 사용하여 시장 데이터를 제공하는 구현체.
+    여러 종목을 조회할 때 종목 수가 거래일 수보다 많으면(prefers_market_snapshot), 날짜별 시장 전체 단면을 받아 종목별로 변환합니다.
+    그렇지 않으면 호출자(UniverseLoader)가 get_ohlcv를 종목별로 동시에 호출합니다.
+    조회한 단면은 snapshot_cache_size개까지 메모리에 보관합니다.
     """
+    def __init__(self, snapshot_cache_size: int = 512):
+        self.snapshot_cache_size = snapshot_cache_size
+        self._snapshots: "OrderedDict[date, MarketSnapshot]" = OrderedDict()
+        # 마지막으로 조회한 (기간, 거래일 목록) (판단과 일괄 조회 사이의 중복 호출 방지)
+        self._last_trading_days: Optional[Tuple[Tuple[date, date], List[date]]] = None
+
     def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
         # pykrx 요구 포맷: "YYYYMMDD"
         s_date_str = start_date.strftime("%Y%m%d")
@@ -19,22 +30,61 @@ class PyKrxDataProvider(MarketDataProvider):
         # 데이터 조회 (Dataframe 반환)
         df = stock.get_market_ohlcv(s_date_str, e_date_str, ticker.code)
         
-        # 도메인 객체로 변환
-        chart = CandleChart(ticker, CandleUnit.day()) # 일단 일봉 고정
-        
-        for timestamp, row in df.iterrows():
-            # 데이터 정합성 보정 (High가 Open보다 낮은 경우 등 방지)
-            real_high = max(row['시가'], row['고가'], row['저가'], row['종가'])
-            real_low = min(row['시가'], row['고가'], row['저가'], row['종가'])
-
-            candle = Candle(
-                open_price=Money.krw(row['시가']),
-                high_price=Money.krw(real_high),
-                low_price=Money.krw(real_low),
-                close_price=Money.krw(row['종가']),
-                volume=int(row['거래량']),
-                timestamp=timestamp
-            )
-            chart.add_candle(candle)
-            
-        return chart
+        # 도메인 객체로 변환 (컬럼 단위 보정/검증 후 배열을 그대로 전달, 일단 일봉 고정)
+        return frame_to_chart(df, ticker, CandleUnit.day())
+
+    @property
+    def supports_market_snapshot(self) -> bool:
+        return True
+
+    def get_market_snapshot(self, target_date: date, before_call: Optional[Callable[[], None]] = None) -> MarketSnapshot:
+        cached = self._snapshots.get(target_date)
+        if cached is not None:
+            self._snapshots.move_to_end(target_date)
+            return cached
+
+        if before_call:
+            before_call()
+
+        # 시장 전체(KOSPI + KOSDAQ + KONEX) 하루치 단면 조회
+        df = stock.get_market_ohlcv(target_date.strftime("%Y%m%d"), market="ALL")
+        snapshot = frame_to_snapshot(df, target_date)
+
+        self._snapshots[target_date] = snapshot
+        if len(self._snapshots) > self.snapshot_cache_size:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+    def prefers_market_snapshot(
+        self,
+        tickers: List[Ticker],
+        start_date: date,
+        end_date: date,
+        before_call: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """단면 조회 호출 수(거래일 수)가 종목별 조회 호출 수(종목 수)보다 적을 때만 일괄 조회"""
+        return len(tickers) > len(self._trading_days(start_date, end_date, before_call))
+
+    def get_universe_ohlcv(
+        self,
+        tickers: List[Ticker],
+        start_date: date,
+        end_date: date,
+        before_call: Optional[Callable[[], None]] = None,
+    ) -> Dict[str, CandleChart]:
+        """거래일마다 시장 전체 단면을 받아 종목별 차트로 변환합니다. (캐시에 없는 날짜만 상위 호출, 호출마다 before_call)"""
+        trading_days = self._trading_days(start_date, end_date, before_call)
+        snapshots = [self.get_market_snapshot(day, before_call) for day in trading_days]
+        return pivot_snapshots(snapshots, tickers)
+
+    def _trading_days(self, start_date: date, end_date: date, before_call: Optional[Callable[[], None]] = None) -> List[date]:
+        """기간의 거래일 목록. 직전 조회와 같은 기간이면 상위 호출 없이 재사용합니다."""
+        key = (start_date, end_date)
+        if self._last_trading_days is not None and self._last_trading_days[0] == key:
+            return self._last_trading_days[1]
+        if before_call:
+            before_call()
+        days = stock.get_previous_business_days(fromdate=start_date.strftime("%Y%m%d"), todate=end_date.strftime("%Y%m%d"))
+        trading_days = [datetime(d.year, d.month, d.day).date() for d in days]
+        self._last_trading_days = (key, trading_days)
+        return trading_days
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import Callable, Dict, List, Optional
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_snapshot import MarketSnapshot
 
 class MarketDataProvider(ABC):
     """
@@ -23,3 +25,53 @@ class MarketDataProvider(ABC):
             CandleChart: 조회된 캔들 차트 데이터
         """
         pass
+
+    @property
+    def supports_market_snapshot(self) -> bool:
+        """시장 전체 단면(get_market_snapshot)을 한 번에 조회할 수 있는지 여부"""
+        return False
+
+    def prefers_market_snapshot(
+        self,
+        tickers: List[Ticker],
+        start_date: date,
+        end_date: date,
+        before_call: Optional[Callable[[], None]] = None,
+    ) -> bool:
+        """
+        이 종목/기간을 get_universe_ohlcv(시장 단면 일괄 조회)로 가져오는 편이 종목별 조회보다 유리한지 여부.
+        기본 구현은 supports_market_snapshot을 그대로 반환하며, 호출 수가 종목/거래일 수에 따라 달라지는 구현체는 재정의합니다.
+
+        Args:
+            before_call: 판단을 위해 상위 데이터 소스를 호출하는 경우 그 직전마다 호출되는 함수 (호출 속도 제한용)
+        """
+        return self.supports_market_snapshot
+
+    def get_market_snapshot(self, target_date: date) -> MarketSnapshot:
+        """
+        특정 날짜의 시장 전체 OHLCV 단면을 조회합니다.
+        지원하지 않는 데이터 소스는 NotImplementedError를 발생시킵니다.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support market snapshots")
+
+    def get_universe_ohlcv(
+        self,
+        tickers: List[Ticker],
+        start_date: date,
+        end_date: date,
+        before_call: Optional[Callable[[], None]] = None,
+    ) -> Dict[str, CandleChart]:
+        """
+        시장 전체 단면으로 여러 종목의 기간별 OHLCV를 한 번에 조회합니다. (supports_market_snapshot인 구현체만 재정의)
+        종목별 조회는 UniverseLoader가 스레드 풀/호출 속도 제한/종목별 실패 기록과 함께 수행하므로, 여기에는 종목별 순차 조회 대체 구현이 없습니다.
+
+        Args:
+            before_call: 상위 데이터 소스를 호출하기 직전마다 호출되는 함수 (호출 속도 제한용)
+        
+        Returns:
+            {ticker_code: chart} (요청 순서 유지)
+
+        Raises:
+            NotImplementedError: 시장 단면 일괄 조회를 지원하지 않는 데이터 소스
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support universe snapshots")
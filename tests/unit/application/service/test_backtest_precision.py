@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
+from src.domain.strategy.presets.buy_and_hold_strategy import BuyAndHoldStrategy
+from src.domain.strategy.presets.bollinger_band_strategy import BollingerBandStrategy
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.ports.market_data_provider import MarketDataProvider
+from src.application.service.backtest_service import BacktestService
+
+class StubProvider(MarketDataProvider):
+    """종목 코드별로 다른 가격 경로를 반환하는 스텁 제공자"""
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        seed = int(ticker.code)
+        candles = []
+        for day in range(40):
+            price = Money.krw(f"{1000 + seed * 17 + (day * 31) % 97}.5")
+            candles.append(Candle(
+                open_price=price, high_price=price, low_price=price, close_price=price,
+                volume=10, timestamp=datetime(2025, 1, 1) + timedelta(days=day),
+            ))
+        return CandleChart.from_candles(ticker, CandleUnit.day(), candles)
+
+def _run(precision: Precision, strategy=None):
+    tickers = [Ticker(code=f"{i:06d}", name=f"T{i}") for i in range(1, 4)]
+    service = BacktestService(StubProvider(), max_workers=1, precision=precision)
+    strategy = strategy or BuyAndHoldStrategy()
+    return service.run(tickers, strategy, date(2025, 1, 1), date(2025, 2, 28), Money.krw("1000000.3"))
+
+def test_float_valuation_matches_decimal_valuation():
+    exact = _run(Precision.DECIMAL)
+    fast = _run(Precision.FLOAT64)
+
+    assert list(fast.daily_equity_curve) == list(exact.daily_equity_curve)
+    for day, value in exact.daily_equity_curve.items():
+        assert abs(fast.daily_equity_curve[day] - value) <= 1e-6
+    # 체결/거래 로그는 정밀도 모드와 무관
+    assert fast.trade_logs == exact.trade_logs
+
+def test_default_precision_is_decimal():
+    """기본은 정확한 Decimal 계산 (서비스/지표/평가기 모두), float64는 명시적으로 선택"""
+    assert BacktestService(StubProvider()).precision is Precision.DECIMAL
+    assert BollingerBands().precision is Precision.DECIMAL
+    assert BollingerBandStrategy().evaluator.bb.precision is Precision.DECIMAL
+
+def test_default_run_matches_explicit_decimal_run():
+    """precision을 지정하지 않은 실행은 DECIMAL 실행과 자산 곡선/거래가 정확히 같음"""
+    tickers = [Ticker(code=f"{i:06d}", name=f"T{i}") for i in range(1, 4)]
+    arguments = (tickers, BollingerBandStrategy(period=5, multiplier=1.0), date(2025, 1, 1), date(2025, 2, 28), Money.krw("1000000.3"))
+    default = BacktestService(StubProvider(), max_workers=1).run(*arguments)
+    exact = _run(Precision.DECIMAL, BollingerBandStrategy(period=5, multiplier=1.0))
+
+    assert default.daily_equity_curve == exact.daily_equity_curve
+    assert default.trade_logs == exact.trade_logs
+
+def test_precision_policy_reaches_strategy_indicators():
+    """서비스의 정밀도가 실행마다 전략의 지표 계산에 전달됨 (같은 전략 객체를 두 모드로 재사용)"""
+    strategy = BollingerBandStrategy(period=5, multiplier=1.0)
+
+    exact = _run(Precision.DECIMAL, strategy)
+    assert strategy.evaluator.bb.precision is Precision.DECIMAL
+    fast = _run(Precision.FLOAT64, strategy)
+    assert strategy.evaluator.bb.precision is Precision.FLOAT64
+
+    assert exact.trade_logs and fast.trade_logs == exact.trade_logs
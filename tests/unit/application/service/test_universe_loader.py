@@ -0,0 +1,167 @@
+import threading
+import pytest
+import time
+from datetime import date, datetime
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.strategy.presets.buy_and_hold_strategy import BuyAndHoldStrategy
+from src.ports.market_data_provider import MarketDataProvider
+from src.application.service.backtest_service import BacktestService
+from src.application.service.universe_loader import UniverseLoader, RateLimiter
+
+class SlowProvider(MarketDataProvider):
+    """지연(latency)을 주입하는 스텁 제공자. failing에 포함된 종목은 예외 발생"""
+    def __init__(self, latency: float, failing: tuple = ()):
+        self.latency = latency
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        if ticker.code in self.failing:
+            raise ConnectionError("upstream timeout")
+        price = Money.krw(1000)
+        candle = Candle(open_price=price, high_price=price, low_price=price, close_price=price, volume=1, timestamp=datetime(2025, 1, 2))
+        return CandleChart.from_candles(ticker, CandleUnit.day(), [candle])
+
+def _tickers(count: int) -> list:
+    return [Ticker(code=f"{i:06d}", name=f"T{i}") for i in range(1, count + 1)]
+
+def test_concurrent_load_is_faster_than_sequential():
+    """지연 0.05초 × 16종목: 순차 0.8초 → 동시 8개면 약 0.1초"""
+    provider = SlowProvider(latency=0.05)
+    report = UniverseLoader(provider, max_workers=8).load(_tickers(16), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert len(report.charts) == 16
+    assert provider.max_in_flight <= 8
+    assert report.elapsed_seconds < 0.05 * 16 / 2
+
+def test_failures_do_not_abort_load():
+    """일부 종목 실패 시에도 나머지는 로딩되고 실패는 보고됨"""
+    progress = []
+    provider = SlowProvider(latency=0.0, failing=("000002",))
+    loader = UniverseLoader(provider, max_workers=4, on_progress=lambda done, total, ticker, error: progress.append((done, total, ticker.code, error)))
+    report = loader.load(_tickers(3), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert list(report.charts) == ["000001", "000003"]
+    assert "ConnectionError" in report.failures["000002"]
+    assert sorted(p[0] for p in progress) == [1, 2, 3]
+    assert all(p[1] == 3 for p in progress)
+    assert any(p[2] == "000002" and isinstance(p[3], ConnectionError) for p in progress)
+
+def test_rate_limiter_spacing():
+    """초당 50회 제한이면 5회 호출에 최소 약 0.08초"""
+    limiter = RateLimiter(calls_per_second=50)
+    started = time.perf_counter()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.perf_counter() - started >= 0.07
+
+def test_backtest_reports_failed_tickers():
+    """백테스트 결과에 로딩 실패 종목이 기록됨"""
+    service = BacktestService(SlowProvider(latency=0.0, failing=("000002",)), max_workers=2)
+    result = service.run(_tickers(2), BuyAndHoldStrategy(), date(2025, 1, 1), date(2025, 1, 31), Money.krw(1_000_000))
+
+    assert list(result.failed_tickers) == ["000002"]
+    assert len(result.daily_equity_curve) == 1
+
+class SnapshotProvider(SlowProvider):
+    """시장 단면 일괄 조회를 지원하는 스텁 제공자 (상위 호출 = 거래일 수, 종목 수 > 거래일 수일 때만 일괄 조회)"""
+    def __init__(self, trading_days: int = 3, broken: bool = False, latency: float = 0.0, failing: tuple = ()):
+        super().__init__(latency=latency, failing=failing)
+        self.trading_days = trading_days
+        self.broken = broken
+        self.universe_calls = 0
+        self.ticker_calls = 0
+
+    @property
+    def supports_market_snapshot(self) -> bool:
+        return True
+
+    def prefers_market_snapshot(self, tickers, start_date, end_date, before_call=None) -> bool:
+        return len(tickers) > self.trading_days
+
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        with self._lock:
+            self.ticker_calls += 1
+        return super().get_ohlcv(ticker, start_date, end_date)
+
+    def get_universe_ohlcv(self, tickers, start_date, end_date, before_call=None):
+        self.universe_calls += 1
+        if self.broken:
+            raise KeyError("bad snapshot column")
+        for _ in range(self.trading_days):
+            if before_call:
+                before_call()
+        return {ticker.code: self.get_ohlcv(ticker, start_date, end_date) for ticker in tickers}
+
+class CountingLimiter:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self) -> None:
+        self.calls += 1
+
+def test_snapshot_path_applies_rate_limit():
+    """일괄 조회 경로에서도 상위 호출마다 rate limiter 적용"""
+    provider = SnapshotProvider(trading_days=3)
+    loader = UniverseLoader(provider, rate_limit=1000)
+    loader.rate_limiter = CountingLimiter()
+    report = loader.load(_tickers(5), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert provider.universe_calls == 1
+    assert loader.rate_limiter.calls == 3
+    assert len(report.charts) == 5 and report.snapshot_error is None
+
+def test_snapshot_failure_is_reported_and_falls_back():
+    """일괄 조회 실패는 보고되고 종목별 조회로 대체됨"""
+    provider = SnapshotProvider(broken=True)
+    report = UniverseLoader(provider, max_workers=2).load(_tickers(4), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert provider.universe_calls == 1
+    assert list(report.charts) == ["000001", "000002", "000003", "000004"]
+    assert report.snapshot_error == "KeyError: 'bad snapshot column'"
+
+def test_small_universe_on_snapshot_provider_uses_pool():
+    """일괄 조회가 유리하지 않으면 단면 지원 제공자도 스레드 풀로 동시 조회하고 실패는 종목별로 기록"""
+    provider = SnapshotProvider(trading_days=20, latency=0.1, failing=("000004",))
+    report = UniverseLoader(provider, max_workers=10).load(_tickers(10), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert provider.universe_calls == 0
+    assert provider.ticker_calls == 10
+    assert provider.max_in_flight > 1
+    assert report.elapsed_seconds < 0.5
+    assert len(report.charts) == 9
+    assert list(report.failures) == ["000004"]
+    assert report.snapshot_error is None
+
+class FlagOnlyProvider(SlowProvider):
+    """단면 지원 플래그만 켜고 get_universe_ohlcv는 재정의하지 않은 제공자"""
+    @property
+    def supports_market_snapshot(self) -> bool:
+        return True
+
+def test_port_has_no_sequential_universe_fallback():
+    """포트의 get_universe_ohlcv는 종목별 순차 조회를 하지 않고, 로더가 스레드 풀로 대체 조회"""
+    provider = FlagOnlyProvider(latency=0.05, failing=("000003",))
+    with pytest.raises(NotImplementedError):
+        provider.get_universe_ohlcv(_tickers(2), date(2025, 1, 1), date(2025, 1, 31))
+
+    progress = []
+    loader = UniverseLoader(provider, max_workers=8, on_progress=lambda done, total, ticker, error: progress.append(ticker.code))
+    report = loader.load(_tickers(8), date(2025, 1, 1), date(2025, 1, 31))
+
+    assert provider.max_in_flight > 1
+    assert len(report.charts) == 7 and list(report.failures) == ["000003"]
+    assert report.snapshot_error.startswith("NotImplementedError")
+    assert sorted(progress) == [ticker.code for ticker in _tickers(8)]
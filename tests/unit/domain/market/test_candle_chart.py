@@ -1,10 +1,13 @@
 import pytest
-from datetime import datetime
+import numpy as np
+from decimal import Decimal
+from datetime import date, datetime, timedelta
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_unit import CandleUnit
 from src.domain.market.candle import Candle
 from src.domain.market.candle_chart import CandleChart
-from src.domain.shared.money import Money
+from src.domain.market.candle_sequence import CandleSequence
+from src.domain.shared.money import Money, Currency
 
 class TestCandleChart:
     def setup_method(self):
@@ -67,3 +70,150 @@ class TestCandleChart:
         candles = [c for c in chart.candles]
         assert len(candles) == 2
         assert candles[0] == self.candle1
+
+    def test_columnar_arrays(self):
+        """필드별 배열 접근 테스트"""
+        chart = CandleChart(ticker=self.ticker, unit=self.unit, candles=[self.candle2, self.candle1])
+
+        assert chart.closes.dtype == np.float64
+        assert chart.volumes.tolist() == [100, 200]
+        assert chart.timestamps[0].item() == self.timestamp1
+
+        # 외부에서 배열을 수정할 수 없어야 함
+        with pytest.raises(ValueError):
+            chart.closes[0] = 0.0
+
+    def test_getitem_materializes_candle(self):
+        """인덱스 접근 시 Candle 객체가 원본과 동일하게 복원되는지 테스트"""
+        candle = Candle(open_price=Money.krw(1000), high_price=Money.krw("1010.5"), low_price=Money.krw(990), close_price=Money.krw(1005), volume=10, timestamp=self.timestamp1)
+        chart = CandleChart(ticker=self.ticker, unit=self.unit, candles=[candle, self.candle2])
+
+        assert chart[0] == candle
+        assert chart[-1] == self.candle2
+        assert chart[0].high_price.amount == Decimal("1010.5")
+        with pytest.raises(IndexError):
+            chart[2]
+
+    def test_memory_per_candle(self):
+        """캔들 1개당 메모리 사용량 (timestamp + OHLC + volume = 48 bytes)"""
+        chart = CandleChart(ticker=self.ticker, unit=self.unit, candles=[self.candle1, self.candle2])
+        assert chart._columns.nbytes == 48 * 2
+
+    def test_currency_mismatch_error(self):
+        """한 차트에 서로 다른 통화의 캔들 추가 시 에러 테스트"""
+        usd = Money(amount=Decimal("10"), currency=Currency.USD)
+        usd_candle = Candle(open_price=usd, high_price=usd, low_price=usd, close_price=usd, volume=1, timestamp=self.timestamp2)
+        chart = CandleChart(ticker=self.ticker, unit=self.unit, candles=[self.candle1])
+
+        with pytest.raises(ValueError, match="Currency mismatch"):
+            chart.add_candle(usd_candle)
+
+    def _candle_at(self, minute_offset: int, price: int = 1000) -> Candle:
+        money = Money.krw(price)
+        return Candle(open_price=money, high_price=money, low_price=money, close_price=money, volume=100, timestamp=self.timestamp1 + timedelta(minutes=minute_offset))
+
+    def test_from_candles_sorts_once(self):
+        """일괄 생성 시 정렬 테스트"""
+        candles = [self._candle_at(offset) for offset in (20, 5, 15, 0, 10)]
+        chart = CandleChart.from_candles(self.ticker, self.unit, candles)
+
+        assert len(chart) == 5
+        assert [c.timestamp for c in chart.candles] == sorted(c.timestamp for c in candles)
+
+    def test_from_candles_duplicate_error(self):
+        """일괄 생성 시 묶음 내 중복 검출 테스트"""
+        candles = [self._candle_at(0), self._candle_at(5), self._candle_at(0, price=2000)]
+        with pytest.raises(ValueError, match="already exists"):
+            CandleChart.from_candles(self.ticker, self.unit, candles)
+
+    def test_extend_appends_after_latest(self):
+        """기존 차트 뒤에 이어 붙이기"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(0), self._candle_at(5)])
+        chart.extend([self._candle_at(15), self._candle_at(10)])
+
+        assert chart.timestamps.tolist() == [self.timestamp1 + timedelta(minutes=m) for m in (0, 5, 10, 15)]
+
+    def test_extend_merges_interleaved(self):
+        """기존 차트 사이사이에 끼워 넣는 병합"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(0, 1000), self._candle_at(10, 3000)])
+        chart.extend([self._candle_at(15, 4000), self._candle_at(5, 2000), self._candle_at(-5, 500)])
+
+        assert chart.closes.tolist() == [500, 1000, 2000, 3000, 4000]
+        assert chart.verify() == []
+
+    def test_extend_duplicate_leaves_chart_unchanged(self):
+        """기존 캔들과 중복되면 에러, 차트는 변경되지 않음"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(0), self._candle_at(10)])
+
+        with pytest.raises(ValueError, match="already exists"):
+            chart.extend([self._candle_at(5), self._candle_at(10)])
+        assert len(chart) == 2
+
+    def test_candles_is_read_only_view(self):
+        """candles 프로퍼티는 복사 없는 읽기 전용 뷰"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(m) for m in (0, 5, 10)])
+        candles = chart.candles
+
+        assert isinstance(candles, CandleSequence)
+        assert np.shares_memory(candles._columns.closes, chart._columns.closes)
+        assert candles[1:] == [chart[1], chart[2]]
+        with pytest.raises(TypeError):
+            candles[0] = self.candle1  # type: ignore[index]
+
+    def test_slice_and_window_views(self):
+        """slice / window는 원본 배열을 공유하는 읽기 전용 차트 뷰"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(m * 5, 1000 + m) for m in range(10)])
+
+        sliced = chart.slice(2, 5)
+        assert sliced.is_view
+        assert sliced.closes.tolist() == [1002, 1003, 1004]
+        assert np.shares_memory(sliced.closes, chart.closes)
+
+        window = chart.window(end_idx=6, length=3)
+        assert window.closes.tolist() == [1004, 1005, 1006]
+        # 앞쪽 데이터가 부족하면 0번부터
+        assert len(chart.window(end_idx=1, length=5)) == 2
+
+        with pytest.raises(ValueError, match="read-only"):
+            window.add_candle(self._candle_at(100))
+
+    def test_view_is_stable_after_parent_append(self):
+        """원본 차트에 캔들이 추가되어도 뷰의 내용은 유지"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(0), self._candle_at(5)])
+        view = chart.slice()
+        chart.extend([self._candle_at(-5), self._candle_at(10)])
+
+        assert len(view) == 2
+        assert len(chart) == 4
+
+    def test_find_index_by_date(self):
+        """날짜로 인덱스 조회 (같은 날 분봉이 여러 개면 마지막 캔들)"""
+        day1 = [self._candle_at(m) for m in (0, 5, 10)]
+        day3 = [self._candle_at(60 * 48 + m) for m in (0, 5)]
+        chart = CandleChart.from_candles(self.ticker, self.unit, day1 + day3)
+
+        assert chart.find_index_by_date(date(2023, 1, 1)) == 2
+        assert chart.find_index_by_date(date(2023, 1, 3)) == 4
+        assert chart.find_index_by_date(date(2023, 1, 2)) == -1
+        assert chart.find_index_by_date(date(2022, 12, 31)) == -1
+
+    def test_find_index_at_or_before(self):
+        """해당 날짜 또는 직전 날짜의 캔들 인덱스 조회"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(0), self._candle_at(60 * 48)])
+
+        assert chart.find_index_at_or_before(date(2022, 12, 31)) == -1
+        assert chart.find_index_at_or_before(date(2023, 1, 1)) == 0
+        assert chart.find_index_at_or_before(date(2023, 1, 2)) == 0
+        assert chart.find_index_at_or_before(date(2023, 1, 3)) == 1
+        assert chart.find_index_at_or_before(date(2030, 1, 1)) == 1
+
+    def test_date_index_follows_insertions(self):
+        """캔들 추가/중간 삽입 후에도 날짜 인덱스가 갱신되는지 테스트"""
+        chart = CandleChart.from_candles(self.ticker, self.unit, [self._candle_at(60 * 24 * d) for d in (0, 2)])
+        assert chart.find_index_by_date(date(2023, 1, 3)) == 1
+
+        chart.add_candle(self._candle_at(60 * 24 * 1))
+        chart.add_candle(self._candle_at(60 * 24 * 5))
+        assert chart.find_index_by_date(date(2023, 1, 2)) == 1
+        assert chart.find_index_by_date(date(2023, 1, 3)) == 2
+        assert chart.find_index_by_date(date(2023, 1, 6)) == 3
@@ -58,8 +58,9 @@ class TestCandleChartValidation:
         chart.add_candle(c2)
         
         # 강제로 순서 변경 (테스트 목적)
-        # _candles는 private이지만 테스트를 위해 접근
-        chart._candles[0], chart._candles[1] = chart._candles[1], chart._candles[0]
+        # _columns는 private이지만 테스트를 위해 내부 timestamp 배열에 직접 접근
+        timestamps = chart._columns.timestamps
+        timestamps[[0, 1]] = timestamps[[1, 0]]
         
         messages = chart.verify()
         assert len(messages) > 0
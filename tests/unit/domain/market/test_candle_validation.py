@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from datetime import datetime
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_validation import CandleValidationError, validate_ohlcv_arrays
+from src.domain.shared.money import Money, Currency
+
+def _arrays():
+    timestamps = np.array(["2025-01-02", "2025-01-03", "2025-01-06"], dtype="datetime64[us]")
+    opens = np.array([100.0, 110.0, 120.0])
+    highs = np.array([105.0, 115.0, 125.0])
+    lows = np.array([95.0, 105.0, 115.0])
+    closes = np.array([102.0, 112.0, 122.0])
+    volumes = np.array([10, 20, 30], dtype=np.int64)
+    return timestamps, opens, highs, lows, closes, volumes
+
+def test_validate_passes_for_valid_arrays():
+    timestamps, *prices = _arrays()
+    validate_ohlcv_arrays(*prices, timestamps=timestamps)
+
+def test_validate_reports_all_failed_rows():
+    """실패한 모든 행 인덱스와 사유를 한 번에 보고"""
+    timestamps, opens, highs, lows, closes, volumes = _arrays()
+    highs[0] = 90.0            # 고가 < 시가
+    volumes[2] = -1            # 음수 거래량
+    closes[2] = np.nan         # 유한하지 않은 가격
+
+    with pytest.raises(CandleValidationError) as exc:
+        validate_ohlcv_arrays(opens, highs, lows, closes, volumes, timestamps)
+
+    assert exc.value.rows.tolist() == [0, 2]
+    message = str(exc.value)
+    assert "row 0 (2025-01-02" in message and "high price" in message
+    assert "volume cannot be negative" in message and "not finite" in message
+
+def test_from_arrays_validates_once():
+    timestamps, opens, highs, lows, closes, volumes = _arrays()
+    lows[1] = 111.0  # 저가 > 시가
+
+    with pytest.raises(CandleValidationError, match="row 1"):
+        CandleChart.from_arrays(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), timestamps, opens, highs, lows, closes, volumes, Currency.KRW)
+
+    # 이미 검증된 데이터는 검증을 건너뛸 수 있음
+    chart = CandleChart.from_arrays(
+        Ticker(code="005930", name="삼성전자"), CandleUnit.day(), timestamps, opens, highs, lows, closes, volumes, Currency.KRW, validate=False,
+    )
+    assert len(chart) == 3
+
+def test_trusted_candle_equals_validated_candle():
+    """trusted 생성자는 검증만 생략하고 동일한 Candle을 만든다"""
+    kwargs = dict(
+        open_price=Money.krw(100), high_price=Money.krw(110), low_price=Money.krw(90),
+        close_price=Money.krw(105), volume=1000, timestamp=datetime(2025, 1, 2),
+    )
+    trusted = Candle.trusted(**kwargs)
+
+    assert trusted == Candle(**kwargs)
+    assert trusted.is_bullish
+    assert Money.trusted(Money.krw(100).amount, Currency.KRW) == Money.krw(100)
+
+def test_materialized_candles_use_trusted_path():
+    timestamps, *prices = _arrays()
+    chart = CandleChart.from_arrays(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), timestamps, *prices, Currency.KRW)
+
+    candle = chart[1]
+    assert candle.close_price == Money.krw(112)
+    assert candle.timestamp == datetime(2025, 1, 3)
@@ -0,0 +1,32 @@
+import numpy as np
+from datetime import date
+from src.domain.market.ticker import Ticker
+from src.domain.market.market_snapshot import MarketSnapshot, pivot_snapshots
+from src.domain.shared.money import Money
+
+def _snapshot(day: int, codes: list, closes: list) -> MarketSnapshot:
+    prices = np.array(closes, dtype=float)
+    return MarketSnapshot(date(2025, 1, day), np.array(codes), prices, prices, prices, prices, np.ones(len(codes), dtype=np.int64))
+
+def test_pivot_snapshots_to_charts():
+    """날짜별 단면 → 종목별 차트"""
+    snapshots = [
+        _snapshot(2, ["005930", "000660", "035420"], [100, 200, 300]),
+        _snapshot(3, ["000660", "005930"], [210, 110]),  # 035420 거래정지
+        _snapshot(6, ["035420", "005930"], [320, 120]),
+    ]
+    tickers = [Ticker(code="005930", name="삼성전자"), Ticker(code="035420", name="NAVER"), Ticker(code="000001", name="신규")]
+
+    charts = pivot_snapshots(snapshots, tickers)
+
+    assert list(charts) == ["005930", "035420", "000001"]
+    assert charts["005930"].closes.tolist() == [100, 110, 120]
+    assert charts["035420"].closes.tolist() == [300, 320]
+    assert charts["035420"].find_index_by_date(date(2025, 1, 6)) == 1
+    assert charts["035420"][0].close_price == Money.krw(300)
+    # 데이터가 없는 종목은 빈 차트
+    assert len(charts["000001"]) == 0
+
+def test_pivot_empty_snapshots():
+    charts = pivot_snapshots([], [Ticker(code="005930", name="삼성전자")])
+    assert len(charts["005930"]) == 0
@@ -0,0 +1,66 @@
+import numpy as np
+from datetime import date, datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Money
+
+class TestMarketUniverse:
+    def setup_method(self):
+        self.base_time = datetime(2023, 1, 2, 15, 30)
+        # A: 1/2, 1/3, 1/4 / B: 1/3, 1/5 (1/4 거래정지)
+        self.chart_a = self._create_chart("000001", {0: 100, 1: 110, 2: 120})
+        self.chart_b = self._create_chart("000002", {1: 200, 3: 210})
+
+    def _create_chart(self, code: str, prices: dict) -> CandleChart:
+        candles = []
+        for offset, price in prices.items():
+            money = Money.krw(price)
+            candles.append(Candle(open_price=money, high_price=money, low_price=money, close_price=money, volume=price, timestamp=self.base_time + timedelta(days=offset)))
+        return CandleChart.from_candles(Ticker(code=code, name=code), CandleUnit.day(), candles)
+
+    def test_master_date_axis(self):
+        """모든 종목의 거래일을 합친 정렬된 날짜 축"""
+        universe = MarketUniverse.from_charts([self.chart_b, self.chart_a])
+
+        assert universe.trading_dates == [date(2023, 1, 2), date(2023, 1, 3), date(2023, 1, 4), date(2023, 1, 5)]
+        assert universe.date_index(date(2023, 1, 4)) == 2
+        assert universe.date_index(date(2023, 1, 7)) == -1
+
+    def test_aligned_matrices(self):
+        """(종목 × 날짜) 행렬과 마스크"""
+        universe = MarketUniverse.from_charts([self.chart_a, self.chart_b])
+
+        assert universe.codes == ["000001", "000002"]
+        np.testing.assert_array_equal(universe.closes[0], [100, 110, 120, np.nan])
+        np.testing.assert_array_equal(universe.closes[1], [np.nan, 200, np.nan, 210])
+        assert universe.mask.tolist() == [[True, True, True, False], [False, True, False, True]]
+        assert universe.volumes[1].tolist() == [0, 200, 0, 210]
+
+    def test_cross_section_and_rows(self):
+        """날짜 단면과 종목별 차트 인덱스 조회"""
+        universe = MarketUniverse.from_charts([self.chart_a, self.chart_b])
+
+        np.testing.assert_array_equal(universe.cross_section(1), [110, 200])
+        assert universe.row_index("000002", 3) == 1
+        assert universe.row_index("000002", 2) == -1
+        assert universe.active_rows(2) == [("000001", 2)]
+        assert universe["000002"][universe.row_index("000002", 3)].close_price == Money.krw(210)
+
+    def test_active_schedule(self):
+        """날짜별 거래 종목 일정 == 날짜별 active_rows"""
+        universe = MarketUniverse.from_charts([self.chart_a, self.chart_b])
+        schedule = universe.active_schedule()
+
+        assert schedule == [universe.active_rows(i) for i in range(len(universe.trading_dates))]
+        assert schedule[1] == [("000001", 1), ("000002", 0)]
+        assert schedule[3] == [("000002", 1)]
+
+    def test_mapping_compatibility(self):
+        """기존 Dict[str, CandleChart]처럼 사용 가능"""
+        universe = MarketUniverse.from_charts([self.chart_a, self.chart_b])
+
+        assert len(universe) == 2
+        assert dict(universe.items()) == {"000001": self.chart_a, "000002": self.chart_b}
@@ -0,0 +1,60 @@
+import random
+import pytest
+from decimal import Decimal, localcontext
+from src.domain.shared.money import Money, Currency
+from src.domain.shared.fast_money import FastMoney
+
+def _same(fast: FastMoney, money: Money):
+    """값뿐 아니라 Decimal 지수(표현)까지 동일한지 확인"""
+    assert str(fast.amount) == str(money.amount)
+    assert fast.currency == money.currency
+
+def test_round_trip_money():
+    for amount in ["0", "100", "1234.5600", "-0.001", "1E+5"]:
+        money = Money(amount=Decimal(amount), currency=Currency.USD)
+        fast = FastMoney.from_money(money)
+        _same(fast, money)
+        assert fast.to_money() == money
+
+def test_arithmetic_matches_money():
+    """덧셈/뺄셈/곱셈/비교 결과가 Money(Decimal)와 동일"""
+    rng = random.Random(0)
+    rates = [Decimal("0.003"), Decimal("1.5"), 3, 0.1, Decimal("0.002") + Decimal("0.001")]
+    for _ in range(500):
+        a = Money(amount=Decimal(rng.randint(-10**9, 10**9)).scaleb(-rng.randint(0, 6)), currency=Currency.KRW)
+        b = Money(amount=Decimal(rng.randint(-10**9, 10**9)).scaleb(-rng.randint(0, 6)), currency=Currency.KRW)
+        fa, fb = FastMoney.from_money(a), FastMoney.from_money(b)
+        factor = rng.choice(rates)
+
+        _same(fa + fb, a + b)
+        _same(fa - fb, a - b)
+        _same(fa * factor, a * factor)
+        assert (fa < fb) == (a < b) and (fa >= fb) == (a >= b) and (fa == fb) == (a == b)
+
+def test_precision_overflow_rounds_like_decimal():
+    """정밀도를 넘는 결과는 Decimal 컨텍스트 반올림을 그대로 따름"""
+    with localcontext() as ctx:
+        ctx.prec = 6
+        a = Money(amount=Decimal("999999"), currency=Currency.KRW)
+        _same(FastMoney.from_money(a) * Decimal("1.23"), a * Decimal("1.23"))
+        _same(FastMoney.from_money(a) + FastMoney.from_money(a), a + a)
+
+def test_division_delegates_to_decimal():
+    fast = FastMoney.from_money(Money.krw(10000)) / Decimal(3)
+    assert fast.amount == Decimal(10000) / Decimal(3)
+
+def test_minor_units():
+    assert FastMoney.from_minor_units(1234, Currency.USD).amount == Decimal("12.34")
+    assert FastMoney.from_decimal(Decimal("12.3"), Currency.USD).minor_units == 1230
+    assert FastMoney.from_money(Money.krw(5000)).minor_units == 5000
+    with pytest.raises(ValueError):
+        FastMoney.from_decimal(Decimal("0.5"), Currency.KRW).minor_units
+
+def test_currency_mismatch():
+    krw = FastMoney.from_money(Money.krw(1000))
+    usd = FastMoney.from_decimal(Decimal("10"), Currency.USD)
+    with pytest.raises(ValueError, match="different currencies"):
+        krw + usd
+    with pytest.raises(TypeError):
+        krw + Money.krw(1000)
+    assert krw != usd
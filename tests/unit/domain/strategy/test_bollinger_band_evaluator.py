@@ -1,9 +1,22 @@
+import numpy as np
 from unittest.mock import MagicMock, patch
 from decimal import Decimal
 from src.domain.strategy.presets.bollinger_band_evaluator import BollingerBandEvaluator
 from src.domain.strategy.trading_signal import SignalType
 from src.domain.market.ticker import Ticker
 from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Currency
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.shared.precision import Precision
+
+def _chart(code: str, length: int = 30) -> CandleChart:
+    closes = 1000 + 10 * np.sin(np.arange(length, dtype=np.float64))
+    timestamps = (np.datetime64("2024-01-01") + np.arange(length)).astype("datetime64[us]")
+    return CandleChart.from_arrays(
+        Ticker(code=code, name=code), CandleUnit.day(), timestamps,
+        closes, closes, closes, closes, np.full(length, 100), Currency.KRW,
+    )
 
 class TestBollingerBandEvaluator:
     @patch('src.domain.strategy.presets.bollinger_band_evaluator.BollingerBands')
@@ -59,3 +72,55 @@ class TestBollingerBandEvaluator:
         signal2 = evaluator.evaluate(mock_chart, 22)
         assert signal2.type == SignalType.SELL
         assert "UpperBand" in signal2.reason
+
+    def test_bands_kept_per_ticker_for_large_universe(self):
+        """유니버스가 커도 (기본 LRU 크기 256 초과) 종목당 한 번만 밴드를 계산"""
+        evaluator = BollingerBandEvaluator(period=5)
+        charts = [_chart(f"{i:06d}") for i in range(300)]
+
+        with patch.object(BollingerBands, "calculate", autospec=True, side_effect=BollingerBands.calculate) as calculate:
+            for index in (10, 11):
+                for chart in charts:
+                    evaluator.evaluate(chart, index)
+
+        assert calculate.call_count == 300
+
+    def test_new_chart_for_same_ticker_is_recomputed(self):
+        """같은 종목 코드라도 다른 차트 객체면 이전 밴드를 재사용하지 않음"""
+        evaluator = BollingerBandEvaluator(period=5)
+        first = _chart("005930")
+        evaluator.evaluate(first, 10)
+
+        second = _chart("005930", length=40)
+        with patch.object(BollingerBands, "calculate", autospec=True, side_effect=BollingerBands.calculate) as calculate:
+            evaluator.evaluate(second, 35)
+            evaluator.evaluate(second, 36)
+
+        assert calculate.call_count == 1
+
+    def test_decimal_series_matches_decimal_evaluate(self):
+        """DECIMAL 모드의 evaluate_series는 Decimal 밴드로 비교하며 봉별 evaluate와 같은 신호/사유"""
+        closes = 1000 + np.round(40 * np.sin(np.arange(60) / 3.0), 1)
+        timestamps = (np.datetime64("2024-01-01") + np.arange(60)).astype("datetime64[us]")
+        chart = CandleChart.from_arrays(
+            Ticker(code="005930", name="005930"), CandleUnit.day(), timestamps,
+            closes, closes, closes, closes, np.full(60, 100), Currency.KRW,
+        )
+        evaluator = BollingerBandEvaluator(period=5, multiplier=1.0, precision=Precision.DECIMAL)
+
+        with patch.object(BollingerBands, "compute", autospec=True) as compute:
+            series = evaluator.evaluate_series(chart)
+        assert compute.call_count == 0
+
+        signals = [series.signal_at(i) for i in range(len(chart))]
+        expected = [evaluator.evaluate(chart, i) for i in range(len(chart))]
+        assert {signal.type for signal in signals} == {SignalType.BUY, SignalType.SELL, SignalType.HOLD}
+        assert [(s.type, s.reason) for s in signals] == [(s.type, s.reason) for s in expected]
+
+    def test_prepare_switches_precision(self):
+        evaluator = BollingerBandEvaluator(period=5)
+        evaluator.prepare({}, Precision.DECIMAL)
+        assert evaluator.bb.precision is Precision.DECIMAL
+        # precision을 주지 않으면 현재 설정 유지
+        evaluator.prepare({})
+        assert evaluator.bb.precision is Precision.DECIMAL
@@ -1,5 +1,13 @@
 from unittest.mock import MagicMock
-from datetime import date
+from datetime import date, datetime, timedelta
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Money
+from src.domain.strategy.signal_series import SignalSeries
 from src.domain.strategy.trading_signal import TradingSignal, SignalType
 from src.domain.strategy.portfolio_strategy import PortfolioStrategy
 
@@ -59,3 +67,27 @@ def test_portfolio_strategy_analysis_flow():
     # 나머지 정보는 Evaluator가 반환한 것과 같아야 함
     assert result_signal.type == expected_base_signal.type
     assert result_signal.reason == expected_base_signal.reason
+
+def _chart(code: str, days) -> CandleChart:
+    price = Money.krw(100)
+    candles = [
+        Candle(open_price=price, high_price=price, low_price=price, close_price=price, volume=1, timestamp=datetime(2025, 1, 1) + timedelta(days=d))
+        for d in days
+    ]
+    return CandleChart.from_candles(Ticker(code=code, name=code), CandleUnit.day(), candles)
+
+def test_prepared_strategy_visits_only_active_tickers():
+    """prepare 후에는 날짜별 일정으로 그날 거래된 종목만 평가 (상장 전/상장폐지 종목은 조회하지 않음)"""
+    # 000001: 전 기간, 000002: 상장폐지, 000003: 신규 상장
+    universe = MarketUniverse.from_charts([_chart("000001", range(10)), _chart("000002", range(3)), _chart("000003", range(8, 10))])
+    mock_evaluator = MagicMock()
+    mock_evaluator.evaluate_series.side_effect = lambda chart: SignalSeries(np.zeros(len(chart)), ticker=chart.ticker)
+    strategy = PortfolioStrategy(evaluator=mock_evaluator)
+    strategy.prepare(universe)
+
+    universe.active_rows = MagicMock(side_effect=AssertionError("prepared schedule should be used"))
+    assert list(strategy.analyze(universe, date(2025, 1, 2))) == ["000001", "000002"]
+    assert list(strategy.analyze(universe, date(2025, 1, 6))) == ["000001"]
+    assert list(strategy.analyze(universe, date(2025, 1, 10))) == ["000001", "000003"]
+    assert strategy.analyze(universe, date(2025, 2, 1)) == {}
+    mock_evaluator.evaluate.assert_not_called()
@@ -0,0 +1,85 @@
+from datetime import date
+from unittest.mock import MagicMock
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Currency
+from src.domain.strategy.asset_evaluator import AssetEvaluator
+from src.domain.strategy.portfolio_strategy import PortfolioStrategy
+from src.domain.strategy.signal_series import SignalSeries, SignalCode
+from src.domain.strategy.trading_signal import TradingSignal, SignalType
+from src.domain.strategy.presets.always_buy_evaluator import AlwaysBuyEvaluator
+from src.domain.strategy.presets.bollinger_band_evaluator import BollingerBandEvaluator
+
+def _chart(code: str = "005930", length: int = 150, seed: int = 3) -> CandleChart:
+    closes = np.round(1000 + np.cumsum(np.random.default_rng(seed).normal(0, 15, length)), 2)
+    timestamps = (np.datetime64("2024-01-01") + np.arange(length)).astype("datetime64[us]")
+    return CandleChart.from_arrays(
+        Ticker(code=code, name=code), CandleUnit.day(), timestamps,
+        closes, closes, closes, closes, np.full(length, 100), Currency.KRW,
+    )
+
+def test_bollinger_series_matches_per_bar_evaluate():
+    chart = _chart()
+    evaluator = BollingerBandEvaluator(period=20, multiplier=1.5)
+    series = evaluator.evaluate_series(chart)
+
+    assert len(series) == len(chart)
+    assert {SignalCode.BUY, SignalCode.SELL} <= set(series.codes.tolist())
+    for i in range(len(chart)):
+        expected = evaluator.evaluate(chart, i)
+        actual = series.signal_at(i)
+        assert (actual.type, actual.quantity, actual.reason) == (expected.type, expected.quantity, expected.reason)
+        assert actual.ticker == chart.ticker
+
+def test_always_buy_series():
+    chart = _chart(length=5)
+    series = AlwaysBuyEvaluator().evaluate_series(chart)
+
+    assert series.codes.tolist() == [SignalCode.BUY] * 5
+    assert series.signal_at(3) == AlwaysBuyEvaluator().evaluate(chart, 3).model_copy(update={"ticker": chart.ticker})
+
+def test_quantities_and_shared_hold():
+    series = SignalSeries(np.array([0, 1, 2, 0]), quantities=np.array([np.nan, 10, np.nan, np.nan]))
+
+    assert series.signal_at(0) is series.signal_at(3)
+    assert series.signal_at(1).type == SignalType.BUY and series.signal_at(1).quantity == 10
+    assert series.signal_at(2).type == SignalType.SELL and series.signal_at(2).quantity is None
+
+class CountingEvaluator(AssetEvaluator):
+    """evaluate 호출 횟수를 세는 평가기 (evaluate_series는 기본 구현 사용)"""
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, chart, current_index: int) -> TradingSignal:
+        self.calls += 1
+        return TradingSignal.sell(reason=str(current_index)) if current_index % 2 else TradingSignal.hold()
+
+def test_default_evaluate_series_loops_evaluate():
+    evaluator = CountingEvaluator()
+    series = evaluator.evaluate_series(_chart(length=4))
+
+    assert evaluator.calls == 4
+    assert series.codes.tolist() == [SignalCode.HOLD, SignalCode.SELL] * 2
+    assert series.signal_at(3).reason == "3"
+
+def test_prepared_strategy_reads_precomputed_signals():
+    universe = MarketUniverse.from_charts([_chart("000001", seed=1), _chart("000002", 80, seed=2)])
+    evaluator = BollingerBandEvaluator()
+    evaluator.evaluate = MagicMock(wraps=evaluator.evaluate)
+    strategy = PortfolioStrategy(evaluator)
+    strategy.prepare(universe)
+
+    for current_date in (date(2024, 2, 15), date(2024, 4, 1)):
+        signals = strategy.analyze(universe, current_date)
+        for code, signal in signals.items():
+            idx = universe[code].find_index_by_date(current_date)
+            assert signal.type == BollingerBandEvaluator().evaluate(universe[code], idx).type
+            assert signal.ticker == universe[code].ticker
+    evaluator.evaluate.assert_not_called()
+
+    # prepare하지 않은 다른 매핑은 evaluate로 평가
+    strategy.analyze(dict(universe), date(2024, 2, 15))
+    assert evaluator.evaluate.call_count == 2
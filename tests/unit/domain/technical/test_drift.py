@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.drift import measure_drift, max_drift
+
+def _candle(day: int, price: int) -> Candle:
+    return Candle(
+        open_price=Money.krw(price), high_price=Money.krw(price), low_price=Money.krw(price),
+        close_price=Money.krw(price), volume=100, timestamp=datetime(2023, 1, 1) + timedelta(days=day),
+    )
+
+def _chart(prices) -> CandleChart:
+    return CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(i, p) for i, p in enumerate(prices)])
+
+def test_measure_drift_per_output():
+    chart = _chart([50000 + (i * 7919) % 1000 for i in range(120)])
+    reports = measure_drift(BollingerBands(period=20), chart)
+
+    # 참조 계산이 있는 upper / middle / lower만 비교
+    assert [r.output for r in reports] == [0, 1, 2]
+    assert all(r.compared == 101 and r.warmup_mismatches == 0 for r in reports)
+    assert all(r.max_rel_error < 1e-12 for r in reports)
+    assert reports[0].indicator == "BollingerBands(period=20, std_dev_multiplier=2.0)"
+
+def test_max_drift_across_charts():
+    charts = [_chart([1000 + i * step for i in range(60)]) for step in (1, 3, -2)]
+    worst = max_drift([MovingAverage(period=5), MACD()], charts)
+
+    assert set(worst) == {"MovingAverage(period=5)", "MACD(fast_period=12, slow_period=26, signal_period=9)"}
+    assert worst["MovingAverage(period=5)"].max_rel_error < 1e-12
+    assert worst["MACD(fast_period=12, slow_period=26, signal_period=9)"].warmup_mismatches == 0
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.indicator_cache import IndicatorCache
+
+def _candle(day: int, price: int) -> Candle:
+    return Candle(
+        open_price=Money.krw(price), high_price=Money.krw(price), low_price=Money.krw(price),
+        close_price=Money.krw(price), volume=100, timestamp=datetime(2023, 1, 1) + timedelta(days=day),
+    )
+
+def _chart(prices) -> CandleChart:
+    return CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(i, p) for i, p in enumerate(prices)])
+
+def test_hit_and_miss_counters():
+    cache = IndicatorCache()
+    chart = _chart(range(100, 130))
+    bb = BollingerBands(period=5)
+
+    with patch.object(BollingerBands, "calculate", wraps=bb.calculate) as calculate:
+        first = cache.calculate(bb, chart)
+        second = cache.calculate(bb, chart)
+        # 파라미터가 같은 다른 인스턴스도 같은 키
+        third = cache.calculate(BollingerBands(period=5), chart)
+
+    assert calculate.call_count == 1
+    assert first is second is third
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+def test_parameters_and_class_are_part_of_key():
+    cache = IndicatorCache()
+    chart = _chart(range(100, 130))
+
+    cache.calculate(MovingAverage(period=5), chart)
+    cache.calculate(MovingAverage(period=10), chart)
+    cache.calculate(BollingerBands(period=5), chart)
+
+    assert cache.cache_info().misses == 3
+
+def test_chart_mutation_invalidates():
+    """캔들이 추가되면 version이 바뀌어 다시 계산"""
+    cache = IndicatorCache()
+    chart = _chart([100, 200, 300])
+    ma = MovingAverage(period=2)
+    version = chart.version
+
+    assert cache.calculate(ma, chart)[-1] == Money.krw(250)
+    chart.add_candle(_candle(3, 400))
+
+    assert chart.version > version
+    result = cache.calculate(ma, chart)
+    assert len(result) == 4 and result[-1] == Money.krw(350)
+    assert cache.cache_info().misses == 2
+
+def test_lru_eviction():
+    cache = IndicatorCache(maxsize=2)
+    charts = [_chart([100, 200, 300]) for _ in range(3)]
+    ma = MovingAverage(period=2)
+
+    cache.calculate(ma, charts[0])
+    cache.calculate(ma, charts[1])
+    cache.calculate(ma, charts[0])  # charts[0]을 최근 사용으로 갱신
+    cache.calculate(ma, charts[2])  # charts[1] 축출
+
+    cache.calculate(ma, charts[0])
+    assert cache.cache_info().hits == 2
+    cache.calculate(ma, charts[1])
+    assert cache.cache_info().misses == 4
+    assert cache.cache_info().currsize == 2
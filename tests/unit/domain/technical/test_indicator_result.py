@@ -0,0 +1,72 @@
+from datetime import date, datetime, timedelta
+import numpy as np
+import pytest
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.indicator_result import IndicatorResult
+from src.domain.technical.macd import MACD
+
+def _candle(day: int, price: int) -> Candle:
+    return Candle(
+        open_price=Money.krw(price), high_price=Money.krw(price), low_price=Money.krw(price),
+        close_price=Money.krw(price), volume=100, timestamp=datetime(2023, 1, 1) + timedelta(days=day),
+    )
+
+def _chart(prices) -> CandleChart:
+    return CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(i, p) for i, p in enumerate(prices)])
+
+def test_macd_columns_match_compute():
+    chart = _chart([100 + (i % 7) * 3 for i in range(60)])
+    macd = MACD(fast_period=3, slow_period=6, signal_period=4, precision=Precision.FLOAT64)
+    result = macd.calculate(chart)
+    macd_line, signal, histogram = macd.compute(chart.closes)
+
+    assert result.names == ["macd", "signal", "histogram"]
+    np.testing.assert_array_equal(result.macd, macd_line)
+    np.testing.assert_array_equal(result["signal"], signal)
+    np.testing.assert_array_equal(result.histogram, histogram)
+
+    # 기본(DECIMAL) 결과도 같은 열 구성이며 float64 계산과 오차 범위 안에서 일치
+    exact = MACD(fast_period=3, slow_period=6, signal_period=4).calculate(chart)
+    assert exact.names == result.names
+    np.testing.assert_allclose(exact.macd, macd_line, rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(exact.histogram, exact.macd - exact.signal)
+
+def test_rows_use_none_for_warm_up():
+    result = MACD(fast_period=3, slow_period=6, signal_period=4).calculate(_chart(range(100, 130)))
+
+    assert result[0] == {"macd": None, "signal": None, "histogram": None}
+    assert result[5]["macd"] is not None and result[5]["signal"] is None
+    assert result[-1] == list(result)[-1]
+    with pytest.raises(IndexError):
+        result[len(result)]
+
+def test_short_input_rows_are_independent():
+    result = MACD().calculate(_chart([100, 101]))
+    first, second = result[0], result[1]
+    first["macd"] = 1.0
+    assert second["macd"] is None and result[0]["macd"] is None
+
+def test_columns_are_read_only():
+    result = MACD(fast_period=3, slow_period=6, signal_period=4).calculate(_chart(range(100, 130)))
+    with pytest.raises(ValueError):
+        result.macd[0] = 1.0
+
+def test_date_lookup_and_slice():
+    chart = _chart(range(100, 130))
+    result = BollingerBands(period=5).calculate_columns(chart)
+
+    assert result.at(date(2023, 1, 11)) == result[10]
+    assert result.index_of(date(2022, 12, 31)) == -1
+    with pytest.raises(KeyError):
+        result.at(date(2024, 1, 1))
+
+    window = result[10:20]
+    assert isinstance(window, IndicatorResult) and len(window) == 10
+    assert np.shares_memory(window.upper, result.upper)
+    assert window.at(date(2023, 1, 15)) == result[14]
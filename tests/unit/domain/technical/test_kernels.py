@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from src.domain.technical import kernels
+
+def _reference_ema(values, period, alpha):
+    """단순 루프 기준 구현 (SMA 초기값 → 지수 평활)"""
+    result = [np.nan] * len(values)
+    if len(values) < period:
+        return np.array(result)
+    prev = sum(values[:period]) / period
+    result[period - 1] = prev
+    for i in range(period, len(values)):
+        prev = alpha * values[i] + (1 - alpha) * prev
+        result[i] = prev
+    return np.array(result)
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return 10_000 + np.cumsum(rng.normal(0, 50, 500))
+
+def test_sma_matches_window_mean(closes):
+    result = kernels.sma(closes, 20)
+    assert np.isnan(result[:19]).all()
+    expected = np.array([closes[i - 19:i + 1].mean() for i in range(19, len(closes))])
+    np.testing.assert_allclose(result[19:], expected, rtol=1e-12)
+
+def test_ema_and_wilder_match_loop(closes):
+    np.testing.assert_allclose(kernels.ema(closes, 12), _reference_ema(closes, 12, 2 / 13), rtol=1e-12)
+    np.testing.assert_allclose(kernels.wilder(closes, 14), _reference_ema(closes, 14, 1 / 14), rtol=1e-12)
+
+def test_rolling_std_and_bollinger(closes):
+    upper, middle, lower = kernels.bollinger(closes, 20, 2.0)
+    expected_std = np.array([closes[i - 19:i + 1].std() for i in range(19, len(closes))])
+    np.testing.assert_allclose(kernels.rolling_std(closes, 20)[19:], expected_std, rtol=1e-9)
+    np.testing.assert_allclose(upper[19:] - middle[19:], 2.0 * expected_std, rtol=1e-9)
+    np.testing.assert_allclose(middle[19:] - lower[19:], 2.0 * expected_std, rtol=1e-9)
+
+def test_rsi_bounds_and_warmup(closes):
+    result = kernels.rsi(closes, 14)
+    assert np.isnan(result[:14]).all()
+    assert ((result[14:] >= 0) & (result[14:] <= 100)).all()
+    assert kernels.rsi([1.0, 2.0, 3.0, 4.0], 2)[2:].tolist() == [100.0, 100.0]
+
+def test_macd_signal_starts_after_macd(closes):
+    macd_line, signal, histogram = kernels.macd(closes, 12, 26, 9)
+    assert np.isnan(macd_line[:25]).all() and not np.isnan(macd_line[25:]).any()
+    assert np.isnan(signal[:33]).all() and not np.isnan(signal[33:]).any()
+    np.testing.assert_allclose(signal[33:], _reference_ema(macd_line[25:], 9, 0.2)[8:], rtol=1e-12)
+    np.testing.assert_allclose(histogram[33:], macd_line[33:] - signal[33:])
+
+def test_short_input_is_all_nan():
+    assert np.isnan(kernels.sma([1.0, 2.0], 3)).all()
+    assert np.isnan(kernels.ema([], 3)).size == 0
+    assert all(np.isnan(values).all() for values in kernels.macd([1.0] * 10, 12, 26, 9))
+
+def test_rolling_mean_var_is_stable_with_large_offset():
+    """값에 비해 분산이 매우 작아도 상쇄 오차 없이 윈도우 2-pass 결과와 일치"""
+    values = 1e9 + np.random.default_rng(1).normal(0, 1, 10_000)
+    mean, var = kernels.rolling_mean_var(values, 20)
+    windows = np.lib.stride_tricks.sliding_window_view(values, 20)
+    np.testing.assert_allclose(mean[19:], windows.mean(axis=1), rtol=1e-14)
+    np.testing.assert_allclose(np.sqrt(var[19:]), windows.std(axis=1), rtol=1e-9)
+
+def test_rolling_mean_var_nan_only_affects_containing_windows():
+    values = np.arange(30, dtype=float)
+    values[12] = np.nan
+    mean, _ = kernels.rolling_mean_var(values, 5)
+    assert np.isnan(mean[12:17]).all()
+    assert not np.isnan(mean[4:12]).any() and not np.isnan(mean[17:]).any()
+    assert mean[20] == pytest.approx(18.0)
+
+def test_bollinger_series_percent_b_and_bandwidth(closes):
+    series = kernels.bollinger_series(closes, 20, 2.0)
+    spread = series.upper - series.lower
+    np.testing.assert_allclose(series.percent_b[19:], (closes[19:] - series.lower[19:]) / spread[19:])
+    np.testing.assert_allclose(series.bandwidth[19:], spread[19:] / series.middle[19:])
+    # 변동이 없으면 밴드폭 0 → %B는 NaN
+    flat = kernels.bollinger_series([100.0] * 5, 3, 2.0)
+    assert flat.bandwidth[2:].tolist() == [0.0] * 3
+    assert np.isnan(flat.percent_b).all()
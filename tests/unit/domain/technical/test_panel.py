@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Currency
+from src.domain.technical import panel
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.ema import EMA
+from src.domain.technical.rsi import RSI
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+
+def _chart(code: str, days: np.ndarray, seed: int) -> CandleChart:
+    closes = 1000 + np.cumsum(np.random.default_rng(seed).normal(0, 10, len(days)))
+    timestamps = (np.datetime64("2024-01-01") + days).astype("datetime64[us]")
+    return CandleChart.from_arrays(
+        Ticker(code=code, name=code), CandleUnit.day(), timestamps,
+        closes, closes, closes, closes, np.full(len(days), 100), Currency.KRW,
+    )
+
+@pytest.fixture
+def universe() -> MarketUniverse:
+    all_days = np.arange(120)
+    suspended = np.setdiff1d(all_days, np.arange(40, 55))  # 거래정지 구간
+    return MarketUniverse.from_charts([
+        _chart("000001", all_days, 1),
+        _chart("000002", all_days[30:], 2),   # 늦게 상장
+        _chart("000003", suspended, 3),
+        _chart("000004", all_days[:10], 4),   # 기간보다 짧은 데이터
+    ])
+
+@pytest.mark.parametrize("indicator", [
+    MovingAverage(period=20), EMA(period=12), RSI(period=14), BollingerBands(period=20), MACD(),
+])
+def test_matrix_matches_per_chart(universe, indicator):
+    """행렬 한 번 계산 결과 == 종목별 차트 계산 결과 (비어 있는 칸은 NaN)"""
+    matrix_result = indicator.compute(universe.closes, mask=universe.mask)
+    matrix_parts = matrix_result if isinstance(matrix_result, tuple) else (matrix_result,)
+
+    for i, code in enumerate(universe.codes):
+        chart_result = indicator.compute(universe[code].closes)
+        chart_parts = chart_result if isinstance(chart_result, tuple) else (chart_result,)
+        columns = np.flatnonzero(universe.mask[i])
+        for matrix_part, chart_part in zip(matrix_parts, chart_parts):
+            np.testing.assert_allclose(matrix_part[i, columns], chart_part, rtol=1e-9, atol=1e-9)
+            assert np.isnan(matrix_part[i, ~universe.mask[i]]).all()
+
+def test_mask_defaults_to_non_nan(universe):
+    np.testing.assert_array_equal(
+        MovingAverage(period=5).compute(universe.closes),
+        MovingAverage(period=5).compute(universe.closes, mask=universe.mask),
+    )
+
+def test_compact_and_expand_round_trip():
+    matrix = np.array([[np.nan, 1.0, np.nan, 2.0], [3.0, 4.0, 5.0, 6.0]])
+    mask = ~np.isnan(matrix)
+    compacted, order = panel.compact(matrix, mask)
+    np.testing.assert_array_equal(compacted[0], [1.0, 2.0, np.nan, np.nan])
+    np.testing.assert_array_equal(panel.expand(compacted, order, mask), matrix)
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from unittest.mock import patch
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Currency
+from src.domain.technical import kernels, pipeline
+from src.domain.technical.pipeline import FeatureSet, Node
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.ema import EMA
+from src.domain.technical.rsi import RSI
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+
+def _chart(code: str, days: np.ndarray, seed: int) -> CandleChart:
+    closes = 1000 + np.cumsum(np.random.default_rng(seed).normal(0, 10, len(days)))
+    timestamps = (np.datetime64("2024-01-01") + days).astype("datetime64[us]")
+    return CandleChart.from_arrays(
+        Ticker(code=code, name=code), CandleUnit.day(), timestamps,
+        closes, closes + 5, closes - 5, closes, np.full(len(days), 100), Currency.KRW,
+    )
+
+def _features() -> FeatureSet:
+    return (
+        FeatureSet()
+        .add("macd", MACD(fast_period=12, slow_period=26, signal_period=9))
+        .add("ema12", EMA(period=12))
+        .add("ma20", MovingAverage(period=20))
+        .add("bb", BollingerBands(period=20))
+        .add("rsi", RSI(period=14))
+    )
+
+def test_shared_nodes_are_planned_once():
+    features = _features()
+    plan = features.plan()
+    close = Node.source("close")
+
+    assert len(plan) == len(set(plan))
+    assert plan.count(pipeline.ema(close, 12)) == 1
+    assert plan.count(pipeline.sma(close, 20)) == 1
+    # 입력은 항상 사용하는 노드보다 먼저 평가
+    for i, node in enumerate(plan):
+        assert all(plan.index(child) < i for child in node.inputs)
+
+def test_shared_nodes_are_computed_once():
+    chart = _chart("000001", np.arange(200), 1)
+    original = pipeline.OPERATIONS["sma"]
+    calls = []
+
+    def counting_sma(x, period):
+        calls.append(period)
+        return original(x, period)
+
+    with patch.dict(pipeline.OPERATIONS, {"sma": counting_sma}):
+        _features().evaluate_chart(chart)
+    # MovingAverage(20)과 BollingerBands(20)의 중단이 같은 노드
+    assert calls == [20]
+
+def test_chart_outputs_match_indicators():
+    chart = _chart("000001", np.arange(200), 1)
+    closes = chart.closes
+    values = _features().evaluate_chart(chart)
+
+    macd_line, signal, histogram = kernels.macd(closes, 12, 26, 9)
+    np.testing.assert_allclose(values["macd.macd"], macd_line, rtol=1e-12)
+    np.testing.assert_allclose(values["macd.signal"], signal, rtol=1e-12)
+    np.testing.assert_allclose(values["macd.histogram"], histogram, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(values["ema12"], kernels.ema(closes, 12), rtol=1e-12)
+    np.testing.assert_allclose(values["rsi"], kernels.rsi(closes, 14), rtol=1e-12)
+
+    expected = kernels.bollinger_series(closes, 20, 2.0)
+    for key in ("upper", "middle", "lower", "percent_b", "bandwidth"):
+        np.testing.assert_allclose(values[f"bb.{key}"], getattr(expected, key), rtol=1e-9)
+    assert values["ma20"] is values["bb.middle"]
+
+def test_bollinger_outputs_are_bit_identical_to_compute():
+    """파이프라인의 밴드와 BollingerBands.compute / MovingAverage.compute는 같은 커널이므로 오차 없이 일치"""
+    chart = _chart("000001", np.arange(300), 4)
+    values = _features().evaluate_chart(chart)
+
+    expected = BollingerBands(period=20).compute(chart.closes)
+    for key in ("upper", "middle", "lower", "percent_b", "bandwidth"):
+        np.testing.assert_array_equal(values[f"bb.{key}"], getattr(expected, key))
+    np.testing.assert_array_equal(MovingAverage(period=20).compute(chart.closes), expected.middle)
+
+def test_universe_outputs_match_per_chart():
+    all_days = np.arange(150)
+    universe = MarketUniverse.from_charts([
+        _chart("000001", all_days, 1),
+        _chart("000002", all_days[40:], 2),
+        _chart("000003", np.setdiff1d(all_days, np.arange(60, 70)), 3),
+    ])
+    features = _features()
+    matrix = features.evaluate_universe(universe)
+
+    for i, code in enumerate(universe.codes):
+        per_chart = features.evaluate_chart(universe[code])
+        columns = np.flatnonzero(universe.mask[i])
+        for name in features.names:
+            np.testing.assert_allclose(matrix[name][i, columns], per_chart[name], rtol=1e-9, atol=1e-9)
+            assert np.isnan(matrix[name][i, ~universe.mask[i]]).all()
+
+def test_other_sources_and_errors():
+    chart = _chart("000001", np.arange(30), 1)
+    highs = FeatureSet(source=Node.source("high")).add("ma", MovingAverage(period=5)).evaluate_chart(chart)
+    np.testing.assert_allclose(highs["ma"], kernels.sma(chart.highs, 5))
+
+    with pytest.raises(ValueError):
+        Node.source("vwap")
+    with pytest.raises(ValueError, match="already registered"):
+        FeatureSet().add("ma", MovingAverage(period=5)).add("ma", MovingAverage(period=10))
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+import numpy as np
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.shared.precision import Precision
+from src.domain.technical import kernels, reference
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.ema import EMA
+from src.domain.technical.macd import MACD
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.rsi import RSI
+
+PRICES = [10000 + ((i * 37) % 23) * 50 - (i % 5) * 10 for i in range(80)]
+
+def _candle(day: int, price: int) -> Candle:
+    return Candle(
+        open_price=Money.krw(price), high_price=Money.krw(price), low_price=Money.krw(price),
+        close_price=Money.krw(price), volume=100, timestamp=datetime(2023, 1, 1) + timedelta(days=day),
+    )
+
+def _chart(prices) -> CandleChart:
+    return CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(i, p) for i, p in enumerate(prices)])
+
+def _as_array(values) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values])
+
+def test_reference_matches_float_kernels():
+    closes = np.array(PRICES, dtype=np.float64)
+    decimals = [Decimal(p) for p in PRICES]
+
+    np.testing.assert_allclose(_as_array(reference.sma(decimals, 20)), kernels.sma(closes, 20), rtol=1e-12)
+    np.testing.assert_allclose(_as_array(reference.ema(decimals, 12)), kernels.ema(closes, 12), rtol=1e-12)
+    np.testing.assert_allclose(_as_array(reference.rsi(decimals, 14)), kernels.rsi(closes, 14), rtol=1e-10)
+    for exact, fast in zip(reference.bollinger(decimals, 20, Decimal(2)), kernels.bollinger(closes, 20, 2.0)):
+        np.testing.assert_allclose(_as_array(exact), fast, rtol=1e-10)
+    for exact, fast in zip(reference.macd(decimals, 12, 26, 9), kernels.macd(closes, 12, 26, 9)):
+        np.testing.assert_allclose(_as_array(exact), fast, rtol=1e-8, atol=1e-8)
+
+def test_rsi_reference_flat_and_rising():
+    assert reference.rsi([Decimal(100)] * 5, 3)[3:] == [Decimal(100), Decimal(100)]
+    assert reference.rsi([Decimal(p) for p in (5, 4, 3, 2, 1)], 3)[3:] == [Decimal(0), Decimal(0)]
+
+def test_decimal_precision_is_exact():
+    """DECIMAL 모드의 SMA는 10진 가격에 대해 정확 (0.1 + 0.4 + 0.4) / 3 = 0.3"""
+    chart = _chart(["0.1", "0.4", "0.4"])
+    assert MovingAverage(period=3, precision=Precision.FLOAT64).calculate(chart)[2].amount != Decimal("0.3")
+    exact = MovingAverage(period=3, precision=Precision.DECIMAL).calculate(chart)
+    assert exact[2].amount == Decimal("0.3")
+    # 기본값은 DECIMAL (float64는 명시적으로 선택)
+    assert MovingAverage(period=3).calculate(chart)[2].amount == Decimal("0.3")
+
+def test_decimal_mode_keeps_result_types():
+    chart = _chart(PRICES)
+
+    assert all(isinstance(v, Money) for v in EMA(period=5, precision=Precision.DECIMAL).calculate(chart)[4:])
+    assert RSI(precision=Precision.DECIMAL).calculate(chart)[:14] == [None] * 14
+    upper, middle, lower = BollingerBands(period=20, precision=Precision.DECIMAL).calculate(chart)
+    assert upper[18] is None and upper[19] > middle[19] > lower[19]
+
+    exact = MACD(precision=Precision.DECIMAL).calculate(chart)
+    fast = MACD().calculate(chart)
+    assert exact.names == fast.names
+    np.testing.assert_allclose(exact.histogram, fast.histogram, rtol=1e-6, atol=1e-8)
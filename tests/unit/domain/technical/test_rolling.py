@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+from src.domain.technical import rolling
+
+def _naive(values: np.ndarray, period: int, reduce) -> np.ndarray:
+    """윈도우마다 직접 계산한 기준값 (warm-up은 NaN)"""
+    result = np.full(values.shape, np.nan)
+    if values.shape[-1] >= period:
+        result[..., period - 1:] = reduce(sliding_window_view(values, period, axis=-1))
+    return result
+
+def _prices(shape) -> np.ndarray:
+    return np.random.default_rng(7).normal(100.0, 5.0, shape).round(1)
+
+@pytest.mark.parametrize("period", [1, 3, 20, 64])
+def test_min_max_match_naive(period):
+    values = _prices((3, 200))
+    np.testing.assert_array_equal(rolling.rolling_max(values, period), _naive(values, period, lambda w: w.max(axis=-1)))
+    np.testing.assert_array_equal(rolling.rolling_min(values, period), _naive(values, period, lambda w: w.min(axis=-1)))
+
+def test_sum_and_var_match_naive():
+    values = _prices(300) + 1e6
+    np.testing.assert_allclose(rolling.rolling_sum(values, 10), _naive(values, 10, lambda w: w.sum(axis=-1)), rtol=1e-12)
+    np.testing.assert_allclose(rolling.rolling_var(values, 10, ddof=1), _naive(values, 10, lambda w: w.var(axis=-1, ddof=1)), rtol=1e-6)
+
+@pytest.mark.parametrize("q", [0.0, 0.25, 0.5, 0.9, 1.0])
+def test_quantile_matches_numpy(q):
+    values = _prices((2, 150))
+    np.testing.assert_allclose(rolling.rolling_quantile(values, 15, q), _naive(values, 15, lambda w: np.quantile(w, q, axis=-1)))
+
+def test_rank_uses_average_ties():
+    values = np.array([3.0, 1.0, 3.0, 2.0, 3.0])
+    # 윈도우 [3, 1, 3] → 3은 2, 3위 동률 → 2.5 / 3
+    expected = [np.nan, np.nan, 2.5 / 3, 2 / 3, 2.5 / 3]
+    np.testing.assert_allclose(rolling.rolling_rank(values, 3), expected)
+
+def test_nan_only_affects_windows_containing_it():
+    values = np.arange(10, dtype=np.float64)
+    values[4] = np.nan
+    for result in (rolling.rolling_max(values, 3), rolling.rolling_median(values, 3), rolling.rolling_rank(values, 3)):
+        assert np.isnan(result[4:7]).all()
+        assert not np.isnan(result[[2, 3, 7, 8, 9]]).any()
+    assert rolling.rolling_max(values, 3)[9] == 9.0
+
+def test_short_input_and_invalid_arguments():
+    assert np.isnan(rolling.rolling_min([1.0, 2.0], 5)).all()
+    with pytest.raises(ValueError):
+        rolling.rolling_max([1.0], 0)
+    with pytest.raises(ValueError):
+        rolling.rolling_quantile([1.0], 1, 1.5)
+
+def test_quantile_and_rank_at_benchmark_size():
+    """10만 개 × 윈도우 64 규모에서 기준 구현과 일치 (청크 경계 포함)"""
+    values = _prices(100_000)
+    values[[500, 70_000]] = np.nan
+    period = 64
+    expected_median = _naive(values, period, lambda w: np.median(w, axis=-1))
+    expected_rank = _naive(values, period, lambda w: ((w < w[..., -1:]).sum(-1) + ((w == w[..., -1:]).sum(-1) + 1) / 2) / period)
+    expected_rank[np.isnan(expected_median)] = np.nan
+
+    np.testing.assert_allclose(rolling.rolling_median(values, period), expected_median)
+    np.testing.assert_allclose(rolling.rolling_rank(values, period), expected_rank)
+
+def test_windows_are_chunked(monkeypatch):
+    """청크가 여러 개로 나뉘어도 결과가 같음"""
+    values = _prices((3, 400))
+    whole = rolling.rolling_quantile(values, 10, 0.3), rolling.rolling_rank(values, 10)
+    monkeypatch.setattr(rolling, "_CHUNK_ELEMENTS", 97)
+    np.testing.assert_array_equal(rolling.rolling_quantile(values, 10, 0.3), whole[0])
+    np.testing.assert_array_equal(rolling.rolling_rank(values, 10), whole[1])
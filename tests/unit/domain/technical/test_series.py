@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle_chart import CandleChart
+from src.domain.market.market_universe import MarketUniverse
+from src.domain.shared.money import Currency
+from src.domain.technical import kernels
+from src.domain.technical.series import PriceSeries, as_series
+from src.domain.technical.indicator_result import IndicatorResult
+from src.domain.technical.ema import EMA
+from src.domain.technical.rsi import RSI
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+
+def _chart(code: str = "005930", length: int = 120, seed: int = 1) -> CandleChart:
+    rng = np.random.default_rng(seed)
+    closes = 1000 + np.cumsum(rng.normal(0, 10, length))
+    timestamps = (np.datetime64("2024-01-01") + np.arange(length)).astype("datetime64[us]")
+    volumes = rng.integers(100, 1000, length)
+    return CandleChart.from_arrays(
+        Ticker(code=code, name=code), CandleUnit.day(), timestamps,
+        closes, closes, closes, closes, volumes, Currency.KRW,
+    )
+
+def test_chart_series_is_zero_copy_view():
+    chart = _chart()
+    series = PriceSeries.from_chart(chart)
+
+    assert np.shares_memory(series.values, chart.closes)
+    assert series.currency == Currency.KRW and len(series) == len(chart)
+    np.testing.assert_array_equal(series.day_numbers, chart.day_numbers)
+    with pytest.raises(ValueError):
+        series.values[0] = 1.0
+    with pytest.raises(ValueError):
+        PriceSeries.from_chart(chart, "vwap")
+
+def test_apply_accepts_chart_series_and_array():
+    chart = _chart()
+    expected = EMA(period=12).compute(chart.closes)
+
+    for source in (chart, PriceSeries.from_chart(chart), chart.closes):
+        np.testing.assert_array_equal(EMA(period=12).apply(source).values, expected)
+    assert as_series(chart.closes).day_numbers is None
+
+def test_indicator_of_indicator_skips_warm_up():
+    """평활 RSI: RSI 출력의 warm-up(NaN)을 건너뛰고 EMA를 적용"""
+    chart = _chart()
+    rsi = RSI(period=14).apply(chart)
+    smoothed = EMA(period=5).apply(rsi)
+
+    assert np.isnan(smoothed.values[:18]).all()
+    np.testing.assert_allclose(smoothed.values[18:], kernels.ema(rsi.values[14:], 5)[4:])
+    np.testing.assert_array_equal(smoothed.day_numbers, chart.day_numbers)
+
+def test_macd_signal_is_ema_of_macd_line():
+    result = MACD().apply(_chart())
+    signal = EMA(period=9).apply(result.series("macd"))
+
+    assert isinstance(result, IndicatorResult)
+    np.testing.assert_allclose(signal.values, result.signal, equal_nan=True)
+
+def test_bollinger_on_volume():
+    chart = _chart()
+    volume = PriceSeries.from_chart(chart, "volume")
+    bands = BollingerBands(period=20).apply(volume)
+
+    assert volume.currency is None
+    np.testing.assert_allclose(bands.middle, kernels.sma(chart.volumes.astype(np.float64), 20), equal_nan=True)
+
+def test_universe_series_matches_per_chart():
+    charts = [_chart("000001", 120, 1), _chart("000002", 60, 2)]
+    universe = MarketUniverse.from_charts(charts)
+    result = RSI(period=14).apply(PriceSeries.from_universe(universe))
+
+    assert result.values.shape == universe.closes.shape
+    for i, chart in enumerate(charts):
+        row = result.values[i][universe.mask[i]]
+        np.testing.assert_allclose(row, RSI(period=14).compute(chart.closes), equal_nan=True)
+
+def test_multi_output_indicators_on_universe_series():
+    """MACD/볼린저 밴드도 (종목 × 날짜) 계열에 적용되며 길이/행/슬라이스는 날짜 축 기준"""
+    charts = [_chart("000001", 120, 1), _chart("000002", 60, 2), _chart("000003", 90, 3)]
+    universe = MarketUniverse.from_charts(charts)
+    series = PriceSeries.from_universe(universe)
+
+    macd = MACD().apply(series)
+    bands = BollingerBands(period=20).apply(series)
+
+    for result in (macd, bands):
+        assert len(result) == len(universe.trading_dates)
+        assert all(result[name].shape == universe.closes.shape for name in result.names)
+    for i, chart in enumerate(charts):
+        columns = universe.mask[i]
+        for expected, name in zip(MACD().compute(chart.closes), ("macd", "signal", "histogram")):
+            np.testing.assert_allclose(macd[name][i][columns], expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(bands.middle[i][columns], BollingerBands(period=20).compute(chart.closes).middle, equal_nan=True)
+
+    last = bands[-1]
+    assert last["middle"].shape == (3,)
+    assert bands[10:].middle.shape == (3, len(universe.trading_dates) - 10)
+    assert bands.series("upper").mask is universe.mask
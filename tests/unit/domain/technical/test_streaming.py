@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.domain.technical import kernels
+from src.domain.technical.moving_average import MovingAverage
+from src.domain.technical.ema import EMA
+from src.domain.technical.rsi import RSI
+from src.domain.technical.bollinger_bands import BollingerBands
+from src.domain.technical.macd import MACD
+from src.domain.technical.streaming import StreamingSMA, StreamingBollingerBands
+
+def _candle(day: int, price: float) -> Candle:
+    return Candle(
+        open_price=Money.krw(price), high_price=Money.krw(price), low_price=Money.krw(price),
+        close_price=Money.krw(price), volume=100, timestamp=datetime(2023, 1, 1) + timedelta(days=day),
+    )
+
+def _stream(state, closes):
+    return [state.update_value(c) for c in closes]
+
+def _nan(values):
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(3)
+    return (10_000 + np.cumsum(rng.normal(0, 50, 300))).round().tolist()
+
+def test_streaming_matches_batch_kernels(closes):
+    np.testing.assert_allclose(_nan(_stream(MovingAverage(period=20).streaming(), closes)), kernels.sma(closes, 20), rtol=1e-9)
+    np.testing.assert_allclose(_nan(_stream(EMA(period=12).streaming(), closes)), kernels.ema(closes, 12), rtol=1e-9)
+    np.testing.assert_allclose(_nan(_stream(RSI(period=14).streaming(), closes)), kernels.rsi(closes, 14), rtol=1e-9)
+
+    bands = _stream(BollingerBands(period=20).streaming(), closes)
+    for i, expected in enumerate(kernels.bollinger(closes, 20, 2.0)):
+        np.testing.assert_allclose(_nan([None if b is None else b[i] for b in bands]), expected, rtol=1e-9)
+
+    macd = _stream(MACD().streaming(), closes)
+    for i, expected in enumerate(kernels.macd(closes, 12, 26, 9)):
+        np.testing.assert_allclose(_nan([row[i] for row in macd]), expected, rtol=1e-9, atol=1e-9)
+
+def test_snapshot_and_restore(closes):
+    state = StreamingBollingerBands(period=5)
+    _stream(state, closes[:50])
+    saved = state.snapshot()
+    after = _stream(state, closes[50:60])
+
+    state.restore(saved)
+    assert _stream(state, closes[50:60]) == after
+
+def test_chart_attach_updates_on_append():
+    chart = CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(i, 100 * (i + 1)) for i in range(3)])
+    sma = chart.attach(StreamingSMA(2))
+    assert sma.value == 250.0  # 기존 캔들로 warm-up
+
+    chart.add_candle(_candle(3, 400))
+    assert sma.value == 350.0
+    chart.extend([_candle(4, 500), _candle(5, 700)])
+    assert sma.value == 600.0
+
+def test_chart_attach_replays_on_middle_insert():
+    chart = CandleChart(Ticker(code="005930", name="삼성전자"), CandleUnit.day(), [_candle(0, 100), _candle(2, 300)])
+    sma = chart.attach(StreamingSMA(3))
+    assert sma.value is None
+
+    chart.add_candle(_candle(1, 200))
+    assert sma.value == 200.0
+
+    chart.detach(sma)
+    chart.add_candle(_candle(3, 1000))
+    assert sma.value == 200.0
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from src.domain.technical import kernels, sweep
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(11)
+    return 50_000 + np.cumsum(rng.normal(0, 300, 400))
+
+def test_sma_sweep_matches_single(closes):
+    periods = [1, 5, 20, 200, 500]
+    result = sweep.sma_sweep(closes, periods)
+    assert result.shape == (5, 400)
+    for row, period in zip(result, periods):
+        np.testing.assert_allclose(row, kernels.sma(closes, period), rtol=1e-10)
+
+def test_mean_var_sweep_matches_rolling(closes):
+    mean, var = sweep.mean_var_sweep(closes, [10, 60])
+    for i, period in enumerate([10, 60]):
+        expected_mean, expected_var = kernels.rolling_mean_var(closes, period)
+        np.testing.assert_allclose(mean[i], expected_mean, rtol=1e-10)
+        np.testing.assert_allclose(var[i], expected_var, rtol=1e-6)
+
+def test_bollinger_sweep_shares_periods(closes):
+    params = [(20, 2.0), (20, 2.5), (50, 2.0)]
+    series = sweep.bollinger_sweep(closes, params)
+    assert series.upper.shape == (3, 400)
+    for i, (period, multiplier) in enumerate(params):
+        expected = kernels.bollinger_series(closes, period, multiplier)
+        for got, want in zip(series, expected):
+            np.testing.assert_allclose(got[i], want, rtol=1e-6)
+
+def test_ema_and_wilder_sweep_match_single(closes):
+    periods = [2, 12, 26, 100, 1000]
+    emas = sweep.ema_sweep(closes, periods)
+    wilders = sweep.wilder_sweep(closes, periods)
+    for i, period in enumerate(periods):
+        np.testing.assert_allclose(emas[i], kernels.ema(closes, period), rtol=1e-10)
+        np.testing.assert_allclose(wilders[i], kernels.wilder(closes, period), rtol=1e-10)
+
+def test_invalid_periods():
+    with pytest.raises(ValueError):
+        sweep.sma_sweep([1.0, 2.0], [])
+    with pytest.raises(ValueError):
+        sweep.ema_sweep([1.0, 2.0], [0, 3])
@@ -0,0 +1,144 @@
+import multiprocessing
+import pytest
+from datetime import date, datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.ports.market_data_provider import MarketDataProvider
+from src.infrastructure.market.memmap_chart_store import MemmapChartStore
+from src.infrastructure.market.caching_data_provider import CachingDataProvider
+from src.application.service.universe_loader import UniverseLoader
+
+class CountingProvider(MarketDataProvider):
+    """호출 횟수와 조회 구간을 기록하는 스텁 제공자 (매일 캔들 1개, 종가 = 일자 + price_offset)"""
+    def __init__(self):
+        self.calls = []
+        self.price_offset = 0
+
+    def get_ohlcv(self, ticker: Ticker, start_date: date, end_date: date) -> CandleChart:
+        self.calls.append((start_date, end_date))
+        candles = []
+        day = start_date
+        while day <= end_date:
+            price = Money.krw(day.day + self.price_offset)
+            candles.append(Candle(open_price=price, high_price=price, low_price=price, close_price=price, volume=1, timestamp=datetime(day.year, day.month, day.day)))
+            day += timedelta(days=1)
+        return CandleChart.from_candles(ticker, CandleUnit.day(), candles)
+
+class TestCachingDataProvider:
+    def setup_method(self):
+        self.ticker = Ticker(code="005930", name="삼성전자")
+        self.upstream = CountingProvider()
+        self.now = datetime(2025, 2, 1, 9, 0)
+
+    def _provider(self, tmp_path, stale_after=timedelta(minutes=30)) -> CachingDataProvider:
+        return CachingDataProvider(self.upstream, MemmapChartStore(tmp_path), stale_after=stale_after, clock=lambda: self.now)
+
+    def test_repeated_request_hits_cache(self, tmp_path):
+        """같은 기간 재조회 시 상위 제공자를 호출하지 않음"""
+        provider = self._provider(tmp_path)
+        first = provider.get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 10))
+        second = provider.get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 10))
+
+        assert len(self.upstream.calls) == 1
+        assert len(first) == len(second) == 10
+
+    def test_fetches_only_missing_ranges(self, tmp_path):
+        """빠진 구간만 조회하여 병합"""
+        provider = self._provider(tmp_path)
+        provider.get_ohlcv(self.ticker, date(2025, 1, 5), date(2025, 1, 10))
+        provider.get_ohlcv(self.ticker, date(2025, 1, 15), date(2025, 1, 20))
+        chart = provider.get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 25))
+
+        assert self.upstream.calls[2:] == [
+            (date(2025, 1, 1), date(2025, 1, 4)),
+            (date(2025, 1, 11), date(2025, 1, 14)),
+            (date(2025, 1, 21), date(2025, 1, 25)),
+        ]
+        assert len(chart) == 25
+        assert chart.verify() == []
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """다른 프로세스(인스턴스)에서도 캐시 재사용"""
+        self._provider(tmp_path).get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 10))
+        chart = self._provider(tmp_path).get_ohlcv(self.ticker, date(2025, 1, 3), date(2025, 1, 4))
+
+        assert len(self.upstream.calls) == 1
+        assert chart.closes.tolist() == [3, 4]
+
+    def test_live_instances_share_coverage(self, tmp_path):
+        """동시에 열려 있는 인스턴스들이 서로의 coverage를 보고, 같은 종목의 기록을 덮어쓰지 않음"""
+        first, second = self._provider(tmp_path), self._provider(tmp_path)
+        first.get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 10))
+
+        # second는 first가 기록한 구간을 다시 조회하지 않음
+        assert second.missing_ranges(self.ticker.code, date(2025, 1, 3), date(2025, 1, 4)) == []
+        second.get_ohlcv(self.ticker, date(2025, 1, 20), date(2025, 1, 25))
+        assert self.upstream.calls == [(date(2025, 1, 1), date(2025, 1, 10)), (date(2025, 1, 20), date(2025, 1, 25))]
+
+        # 두 인스턴스의 기록과 데이터가 모두 남아 있음
+        chart = self._provider(tmp_path).get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 25))
+        assert self.upstream.calls[2:] == [(date(2025, 1, 11), date(2025, 1, 19))]
+        assert len(chart) == 25
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork 필요")
+    def test_coverage_written_by_other_process(self, tmp_path):
+        """다른 프로세스가 기록한 종목/구간도 다시 조회하지 않음"""
+        provider = self._provider(tmp_path)
+        provider.get_ohlcv(self.ticker, date(2025, 1, 1), date(2025, 1, 5))
+
+        other = Ticker(code="000660", name="SK하이닉스")
+        child = multiprocessing.get_context("fork").Process(
+            target=lambda: self._provider(tmp_path).get_ohlcv(other, date(2025, 1, 1), date(2025, 1, 10)),
+        )
+        child.start()
+        child.join()
+        assert child.exitcode == 0
+
+        assert provider.get_ohlcv(other, date(2025, 1, 1), date(2025, 1, 10)).closes.tolist() == list(range(1, 11))
+        assert self.upstream.calls == [(date(2025, 1, 1), date(2025, 1, 5))]
+        # 이후 이 인스턴스의 기록도 다른 프로세스의 기록을 유지
+        provider.get_ohlcv(self.ticker, date(2025, 1, 6), date(2025, 1, 8))
+        assert self._provider(tmp_path).missing_ranges(other.code, date(2025, 1, 1), date(2025, 1, 10)) == []
+
+    def test_recent_day_refreshed_after_staleness(self, tmp_path):
+        """조회 당일 캔들은 유효 시간이 지나면 다시 조회하여 교체"""
+        provider = self._provider(tmp_path)
+        provider.get_ohlcv(self.ticker, date(2025, 1, 25), date(2025, 2, 1))
+
+        # 유효 시간 이내: 재조회 없음
+        self.now += timedelta(minutes=10)
+        provider.get_ohlcv(self.ticker, date(2025, 1, 25), date(2025, 2, 1))
+        assert len(self.upstream.calls) == 1
+
+        # 유효 시간 경과: 당일(2/1)만 재조회, 새 값으로 교체
+        self.now += timedelta(hours=8)
+        self.upstream.price_offset = 100
+        chart = provider.get_ohlcv(self.ticker, date(2025, 1, 25), date(2025, 2, 1))
+        assert self.upstream.calls[-1] == (date(2025, 2, 1), date(2025, 2, 1))
+        assert chart.closes.tolist()[-2:] == [31, 101]
+        assert len(chart) == 8
+
+    def test_future_dates_are_not_marked_covered(self, tmp_path):
+        """아직 오지 않은 날짜는 캐시된 것으로 기록하지 않음"""
+        provider = self._provider(tmp_path)
+        provider.get_ohlcv(self.ticker, date(2025, 1, 30), date(2025, 2, 1))
+        assert provider.missing_ranges("005930", date(2025, 1, 30), date(2025, 2, 5)) == [(date(2025, 2, 2), date(2025, 2, 5))]
+
+    def test_concurrent_universe_load(self, tmp_path):
+        """여러 스레드로 동시에 로딩해도 실패 없이 모든 종목과 coverage가 기록됨"""
+        provider = self._provider(tmp_path)
+        tickers = [Ticker(code=f"{i:06d}", name=f"T{i}") for i in range(1, 41)]
+        report = UniverseLoader(provider, max_workers=8).load(tickers, date(2025, 1, 1), date(2025, 1, 10))
+
+        assert report.failures == {}
+        assert len(report.charts) == 40
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # 새 인스턴스에서도 전 종목이 캐시되어 있음
+        calls = len(self.upstream.calls)
+        reloaded = UniverseLoader(self._provider(tmp_path), max_workers=8).load(tickers, date(2025, 1, 1), date(2025, 1, 10))
+        assert len(self.upstream.calls) == calls
+        assert all(len(chart) == 10 for chart in reloaded.charts.values())
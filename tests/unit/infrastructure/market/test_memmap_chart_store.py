@@ -0,0 +1,160 @@
+import threading
+import numpy as np
+import pytest
+from datetime import date, datetime, timedelta
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.market.candle import Candle
+from src.domain.market.candle_chart import CandleChart
+from src.domain.shared.money import Money
+from src.infrastructure.market.memmap_chart_store import MemmapChartStore
+from src.infrastructure.market.memmap_data_provider import MemmapDataProvider
+
+class TestMemmapChartStore:
+    def setup_method(self):
+        self.ticker = Ticker(code="005930", name="삼성전자")
+        self.base_time = datetime(2025, 1, 1)
+        candles = []
+        for i in range(10):
+            price = Money.krw(1000 + i)
+            candles.append(Candle(open_price=price, high_price=price, low_price=price, close_price=price, volume=100 + i, timestamp=self.base_time + timedelta(days=i)))
+        self.chart = CandleChart.from_candles(self.ticker, CandleUnit.day(), candles)
+
+    def test_write_and_open_round_trip(self, tmp_path):
+        """저장 후 다시 열면 동일한 차트"""
+        store = MemmapChartStore(tmp_path)
+        store.write(self.chart)
+
+        loaded = MemmapChartStore(tmp_path).open("005930")
+        # 배열 복사 없이 memmap을 그대로 참조
+        base = loaded.closes
+        while isinstance(base.base, np.ndarray):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        assert loaded.is_view
+        assert loaded.ticker == self.ticker
+        assert loaded.unit == CandleUnit.day()
+        assert list(loaded.candles) == list(self.chart.candles)
+
+    def test_metadata_index(self, tmp_path):
+        """메타데이터 인덱스 기록"""
+        store = MemmapChartStore(tmp_path)
+        store.write(self.chart)
+
+        meta = MemmapChartStore(tmp_path).metadata("005930")
+        assert meta["length"] == 10
+        assert meta["currency"] == "KRW"
+        assert meta["first"].startswith("2025-01-01")
+        assert store.tickers() == ["005930"]
+
+    def test_read_range(self, tmp_path):
+        """요청 기간만 참조하는 뷰"""
+        store = MemmapChartStore(tmp_path)
+        store.write(self.chart)
+
+        chart = store.read_range("005930", date(2025, 1, 3), date(2025, 1, 5))
+        assert chart.closes.tolist() == [1002, 1003, 1004]
+
+    def _chart(self, code: str, offset: int = 0) -> CandleChart:
+        return CandleChart.from_arrays(
+            Ticker(code=code, name=code), CandleUnit.day(), self.chart.timestamps,
+            self.chart.opens + offset, self.chart.highs + offset, self.chart.lows + offset,
+            self.chart.closes + offset, self.chart.volumes, currency=self.chart.currency,
+        )
+
+    def test_instances_merge_index_entries(self, tmp_path):
+        """같은 디렉터리의 두 인스턴스가 서로의 인덱스 항목을 덮어쓰지 않음"""
+        first, second = MemmapChartStore(tmp_path), MemmapChartStore(tmp_path)
+        first.write(self._chart("000001"))
+        second.write(self._chart("000002"))
+
+        assert MemmapChartStore(tmp_path).tickers() == ["000001", "000002"]
+        # second는 first가 쓴 종목도 열 수 있음 (인덱스 재조회)
+        assert second.open("000001").closes.tolist() == self.chart.closes.tolist()
+
+    def test_concurrent_writes(self, tmp_path):
+        """여러 스레드가 동시에 써도 모든 항목이 기록되고 임시 파일이 남지 않음"""
+        store = MemmapChartStore(tmp_path)
+        errors = []
+
+        def write(i: int):
+            try:
+                store.write(self._chart(f"{i:06d}", offset=i))
+                store.write(self._chart(f"{i:06d}", offset=i + 1))
+            except Exception as e:  # pragma: no cover - 실패 시 보고용
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        reopened = MemmapChartStore(tmp_path)
+        assert len(reopened.tickers()) == 16
+        assert reopened.open("000007").closes[0] == self.chart.closes[0] + 8
+        assert not list(tmp_path.glob("*.tmp"))
+        # 교체된 이전 데이터 디렉터리는 정리됨
+        assert len(list((tmp_path / "000007").iterdir())) == 1
+
+    def test_interrupted_write_keeps_previous_data(self, tmp_path, monkeypatch):
+        """필드 기록 중 실패하면 인덱스는 이전의 완전한 데이터를 그대로 가리킴"""
+        store = MemmapChartStore(tmp_path)
+        store.write(self.chart)
+
+        calls = {"count": 0}
+        original_save = np.save
+
+        def failing_save(f, array):
+            calls["count"] += 1
+            if calls["count"] == 3:
+                raise OSError("disk full")
+            original_save(f, array)
+
+        monkeypatch.setattr(np, "save", failing_save)
+        with pytest.raises(OSError):
+            store.write(self._chart("005930", offset=500))
+        monkeypatch.undo()
+
+        reopened = MemmapChartStore(tmp_path).open("005930")
+        assert reopened.closes.tolist() == self.chart.closes.tolist()
+        assert reopened.opens.tolist() == self.chart.opens.tolist()
+        # 실패한 쓰기의 데이터 디렉터리는 남지 않음
+        assert len(list((tmp_path / "005930").iterdir())) == 1
+
+    def test_open_sees_rewrite_by_other_instance(self, tmp_path):
+        """다른 인스턴스가 종목을 교체하면 이미 열어 둔 차트 대신 새 데이터를 엶"""
+        reader, writer = MemmapChartStore(tmp_path), MemmapChartStore(tmp_path)
+        writer.write(self.chart)
+        first = reader.open("005930")
+        assert reader.open("005930") is first
+
+        writer.write(self._chart("005930", offset=500))
+        reopened = reader.open("005930")
+
+        assert reopened is not first
+        assert reopened.closes[0] == self.chart.closes[0] + 500
+        assert reader.metadata("005930")["data"] == writer.metadata("005930")["data"]
+        # 이전에 연 차트는 계속 이전 데이터를 안전하게 참조
+        assert first.closes[0] == self.chart.closes[0]
+
+    def test_open_unknown_ticker(self, tmp_path):
+        with pytest.raises(KeyError):
+            MemmapChartStore(tmp_path).open("000660")
+
+class TestMemmapDataProvider:
+    def test_get_ohlcv(self, tmp_path):
+        ticker = Ticker(code="005930", name="삼성전자")
+        price = Money.krw(1000)
+        candles = [Candle(open_price=price, high_price=price, low_price=price, close_price=price, volume=1, timestamp=datetime(2025, 1, d)) for d in (2, 3, 6)]
+        store = MemmapChartStore(tmp_path)
+        store.write(CandleChart.from_candles(ticker, CandleUnit.day(), candles))
+        provider = MemmapDataProvider(store)
+
+        chart = provider.get_ohlcv(ticker, date(2025, 1, 3), date(2025, 1, 31))
+        assert len(chart) == 2
+        assert chart.find_index_by_date(date(2025, 1, 6)) == 1
+
+        # 저장되지 않은 종목은 빈 차트
+        assert len(provider.get_ohlcv(Ticker(code="000660", name="SK하이닉스"), date(2025, 1, 1), date(2025, 1, 31))) == 0
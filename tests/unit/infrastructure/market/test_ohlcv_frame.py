@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+from datetime import date
+from src.domain.market.ticker import Ticker
+from src.domain.market.candle_unit import CandleUnit
+from src.domain.shared.money import Money
+from src.infrastructure.market.ohlcv_frame import frame_to_chart, frame_to_snapshot
+
+class TestFrameToChart:
+    def setup_method(self):
+        self.ticker = Ticker(code="005930", name="삼성전자")
+
+    def _frame(self, rows: list) -> pd.DataFrame:
+        index = pd.to_datetime(["2025-12-12", "2025-12-15", "2025-12-16"][:len(rows)])
+        return pd.DataFrame(rows, index=index, columns=["시가", "고가", "저가", "종가", "거래량"])
+
+    def test_converts_pykrx_frame(self):
+        df = self._frame([
+            [108000, 109500, 107500, 108900, 1000],
+            [109000, 110000, 108000, 109500, 2000],
+        ])
+        chart = frame_to_chart(df, self.ticker, CandleUnit.day())
+
+        assert len(chart) == 2
+        assert chart.find_index_by_date(date(2025, 12, 15)) == 1
+        assert chart[0].close_price == Money.krw(108900)
+        assert chart.volumes.tolist() == [1000, 2000]
+
+    def test_repairs_high_low(self):
+        """고가가 시가보다 낮은 등 어긋난 행은 OHLC 최댓값/최솟값으로 보정"""
+        df = self._frame([[1000, 900, 950, 1100, 10]])
+        chart = frame_to_chart(df, self.ticker, CandleUnit.day())
+
+        assert chart.highs[0] == 1100
+        assert chart.lows[0] == 900
+
+    def test_unsorted_frame_is_sorted(self):
+        df = self._frame([[1, 1, 1, 1, 1], [2, 2, 2, 2, 2]]).iloc[::-1]
+        chart = frame_to_chart(df, self.ticker, CandleUnit.day())
+        assert chart.closes.tolist() == [1, 2]
+
+    def test_invalid_rows_rejected(self):
+        df = self._frame([[1000, 1000, 1000, 1000, 10], [1000, 1000, 1000, 1000, -1]])
+        with pytest.raises(ValueError, match="2025-12-15"):
+            frame_to_chart(df, self.ticker, CandleUnit.day())
+
+class TestFrameToSnapshot:
+    def test_drops_unlisted_and_suspended_rows(self):
+        """종가 0(상장 전)과 시가 0(거래정지, 종가만 전일 값) 종목은 단면에서 제외"""
+        df = pd.DataFrame(
+            [
+                [1000, 1100, 900, 1050, 10],
+                [0, 0, 0, 0, 0],
+                [0, 0, 0, 2000, 0],
+            ],
+            index=["005930", "000660", "035420"],
+            columns=["시가", "고가", "저가", "종가", "거래량"],
+        )
+        snapshot = frame_to_snapshot(df, date(2025, 12, 12))
+
+        assert snapshot.codes.tolist() == ["005930"]
+        assert snapshot.lows.tolist() == [900]
@@ -0,0 +1,78 @@
+import pandas as pd
+from datetime import date
+from src.domain.market.ticker import Ticker
+from src.infrastructure.market import pykrx_data_provider
+from src.infrastructure.market.pykrx_data_provider import PyKrxDataProvider
+from src.application.service.universe_loader import UniverseLoader
+
+COLUMNS = ["시가", "고가", "저가", "종가", "거래량"]
+
+class FakeStock:
+    """pykrx.stock 대체 (네트워크 없이 호출 횟수 기록)"""
+    def __init__(self):
+        self.snapshot_calls = []
+        self.ticker_calls = []
+
+    def get_previous_business_days(self, fromdate: str, todate: str):
+        return list(pd.to_datetime(["2025-01-02", "2025-01-03"]))
+
+    def get_market_ohlcv(self, fromdate: str, todate: str = None, ticker: str = None, market: str = None):
+        if market is not None:
+            self.snapshot_calls.append(fromdate)
+            price = 100 if fromdate == "20250102" else 110
+            rows = [[price] * 4 + [10] for _ in range(3)] + [[0, 0, 0, 0, 0]]
+            return pd.DataFrame(rows, index=["005930", "000660", "035420", "999999"], columns=COLUMNS)
+        self.ticker_calls.append(ticker)
+        return pd.DataFrame([[100] * 4 + [10]], index=pd.to_datetime(["2025-01-02"]), columns=COLUMNS)
+
+def test_universe_uses_market_snapshots(monkeypatch):
+    """종목 수 > 거래일 수이면 날짜별 시장 단면으로 조회 (호출 수 = 거래일 수)"""
+    fake = FakeStock()
+    monkeypatch.setattr(pykrx_data_provider, "stock", fake)
+    provider = PyKrxDataProvider()
+    tickers = [Ticker(code=code, name=code) for code in ("005930", "000660", "035420")]
+
+    charts = provider.get_universe_ohlcv(tickers, date(2025, 1, 1), date(2025, 1, 3))
+
+    assert fake.snapshot_calls == ["20250102", "20250103"]
+    assert fake.ticker_calls == []
+    assert charts["000660"].closes.tolist() == [100, 110]
+
+    # 단면 캐시: 다시 조회해도 상위 호출 없음
+    provider.get_universe_ohlcv(tickers, date(2025, 1, 1), date(2025, 1, 3))
+    assert len(fake.snapshot_calls) == 2
+
+def test_small_universe_uses_per_ticker_calls(monkeypatch):
+    """종목 수 <= 거래일 수이면 일괄 조회하지 않고 로더가 종목별로 조회"""
+    fake = FakeStock()
+    monkeypatch.setattr(pykrx_data_provider, "stock", fake)
+    provider = PyKrxDataProvider()
+    tickers = [Ticker(code="005930", name="삼성전자")]
+
+    assert not provider.prefers_market_snapshot(tickers, date(2025, 1, 1), date(2025, 1, 3))
+    report = UniverseLoader(provider).load(tickers, date(2025, 1, 1), date(2025, 1, 3))
+
+    assert fake.snapshot_calls == []
+    assert fake.ticker_calls == ["005930"]
+    assert len(report.charts["005930"]) == 1
+
+def test_before_call_runs_before_each_upstream_call(monkeypatch):
+    """거래일 조회 1회(판단과 일괄 조회가 공유) + 캐시에 없는 단면 조회마다 before_call 호출"""
+    fake = FakeStock()
+    monkeypatch.setattr(pykrx_data_provider, "stock", fake)
+    provider = PyKrxDataProvider()
+    tickers = [Ticker(code=code, name=code) for code in ("005930", "000660", "035420")]
+    calls = []
+
+    def record():
+        calls.append(1)
+
+    assert provider.prefers_market_snapshot(tickers, date(2025, 1, 1), date(2025, 1, 3), before_call=record)
+    provider.get_universe_ohlcv(tickers, date(2025, 1, 1), date(2025, 1, 3), before_call=record)
+    assert len(calls) == 3
+    # 같은 기간의 거래일과 단면은 재사용
+    provider.get_universe_ohlcv(tickers, date(2025, 1, 1), date(2025, 1, 3), before_call=record)
+    assert len(calls) == 3
+    # 다른 기간은 거래일만 다시 조회 (단면은 캐시)
+    provider.get_universe_ohlcv(tickers, date(2025, 1, 2), date(2025, 1, 3), before_call=record)
+    assert len(calls) == 4